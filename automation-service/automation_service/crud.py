@@ -199,6 +199,8 @@ def update_playlist(session: Session, playlist_id: int, data: schemas.PlaylistUp
     update_data = data.model_dump(exclude_unset=True)
     if "channel_id" in update_data:
         _ = get_channel(session, update_data["channel_id"])
+    if "pipeline_options" in update_data and update_data["pipeline_options"] is None:
+        update_data["pipeline_options"] = {}
     for key, value in update_data.items():
         setattr(playlist, key, value)
     playlist.updated_at = datetime.now(UTC)
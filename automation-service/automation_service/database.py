@@ -22,6 +22,7 @@ def init_db() -> None:
     _ensure_job_upload_column()
     _ensure_run_progress_columns()
     _ensure_schedule_columns()
+    _ensure_playlist_columns()
 
 
 def _ensure_job_upload_column() -> None:
@@ -85,6 +86,20 @@ def _ensure_schedule_columns() -> None:
             conn.execute(text("ALTER TABLE schedule ADD COLUMN run_time TEXT DEFAULT '07:00'"))
 
 
+def _ensure_playlist_columns() -> None:
+    """Ensure playlist table has the per-playlist pipeline options column."""
+
+    if not _settings.database_url.startswith("sqlite"):
+        return
+    with _engine.connect() as conn:
+        result = conn.execute(text("PRAGMA table_info(playlist)"))
+        columns = {row[1] for row in result}
+        if "pipeline_options" not in columns:
+            conn.execute(
+                text("ALTER TABLE playlist ADD COLUMN pipeline_options TEXT DEFAULT '{}'")
+            )
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """Provide a transactional scope around a series of operations."""
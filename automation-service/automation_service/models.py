@@ -44,6 +44,10 @@ class PlaylistBase(SQLModel):
     is_active: bool = Field(default=True)
     castopod_slug: Optional[str] = Field(default=None, max_length=255)
     castopod_uuid: Optional[str] = Field(default=None, max_length=64)
+    pipeline_options: dict = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False, server_default="{}"),
+    )
 
 
 class Playlist(PlaylistBase, TimestampMixin, table=True):
@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class ChannelCreate(BaseModel):
@@ -30,6 +31,7 @@ class PlaylistCreate(BaseModel):
     is_active: bool = True
     castopod_slug: str | None = None
     castopod_uuid: str | None = None
+    pipeline_options: dict[str, Any] = Field(default_factory=dict)
 
     @field_validator("youtube_playlist_id")
     @classmethod
@@ -46,6 +48,7 @@ class PlaylistUpdate(BaseModel):
     is_active: bool | None = None
     castopod_slug: str | None = None
     castopod_uuid: str | None = None
+    pipeline_options: dict[str, Any] | None = None
 
 
 class PlaylistRead(BaseModel):
@@ -56,6 +59,7 @@ class PlaylistRead(BaseModel):
     is_active: bool
     castopod_slug: str | None
     castopod_uuid: str | None
+    pipeline_options: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime
     updated_at: datetime
 
@@ -84,6 +84,14 @@ def test_playlist_crud(client: TestClient, channel_id: int) -> None:
     assert updated["title"] == "Updated"
     assert updated["is_active"] is False
     assert updated["castopod_uuid"] == "uuid-456"
+    assert updated["pipeline_options"] == {}
+
+    options_response = client.patch(
+        f"/playlists/{playlist_id}",
+        json={"pipeline_options": {"download_workers": 4}},
+    )
+    assert options_response.status_code == 200
+    assert options_response.json()["pipeline_options"] == {"download_workers": 4}
 
     duplicate_response = client.post("/playlists/", json=payload)
     assert duplicate_response.status_code == 409
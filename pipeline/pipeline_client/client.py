@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from datetime import UTC, datetime
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import httpx
 from pydantic import BaseModel
@@ -23,6 +23,7 @@ class Playlist(BaseModel):
     is_active: bool = True
     castopod_slug: Optional[str] = None
     castopod_uuid: Optional[str] = None
+    pipeline_options: Dict[str, Any] = {}
 
 
 class Schedule(BaseModel):
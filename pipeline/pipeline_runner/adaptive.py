@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+DEFAULT_MAX_DOWNLOAD_WORKERS = 8
+# A window must beat the previous one by this much to count as an improvement.
+THROUGHPUT_GAIN = 0.10
+# Share of failed downloads in a window that triggers a multiplicative decrease.
+ERROR_RATE_LIMIT = 0.25
+
+
+def format_rate(bytes_per_second: float) -> str:
+    return f"{bytes_per_second / (1024 * 1024):.1f}MiB/s"
+
+
+@dataclass
+class ConcurrencyChange:
+    previous: int
+    limit: int
+    reason: str
+
+    def message(self) -> str:
+        return f"동시 다운로드 {self.previous}→{self.limit} ({self.reason})"
+
+
+class AdaptiveConcurrency:
+    """AIMD controller for the number of concurrent episode downloads.
+
+    Completed downloads are grouped into windows of ``limit`` episodes. After each
+    window the limit grows by one while aggregate bytes/s keeps improving; when the
+    last increase did not pay off it steps back and holds for a window before
+    probing again. Throttling responses or a high failure rate halve the limit.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: int = DEFAULT_MAX_DOWNLOAD_WORKERS,
+        minimum: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(self.maximum, max(self.minimum, initial))
+        self._clock = clock
+        self._last_rate: float | None = None
+        self._last_action: str | None = None
+        self.history: list[ConcurrencyChange] = []
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._window_start = self._clock()
+        self._window_bytes = 0
+        self._window_done = 0
+        self._window_errors = 0
+
+    def _change(self, limit: int, action: str, reason: str) -> ConcurrencyChange | None:
+        self._reset_window()
+        limit = min(self.maximum, max(self.minimum, limit))
+        if limit == self.limit:
+            # Already at a bound: keep measuring instead of treating it as a probe.
+            self._last_action = None if action == "increase" else action
+            return None
+        self._last_action = action
+        change = ConcurrencyChange(self.limit, limit, reason)
+        self.limit = limit
+        self.history.append(change)
+        return change
+
+    def record(self, nbytes: int, ok: bool, throttled: bool = False) -> ConcurrencyChange | None:
+        """Account one finished download; returns the change it caused, if any."""
+
+        if throttled:
+            self._last_rate = None
+            return self._change(self.limit // 2, "hold", "요청 제한 감지")
+        self._window_bytes += max(0, nbytes)
+        self._window_done += 1
+        self._window_errors += 0 if ok else 1
+        if self._window_done < self.limit:
+            return None
+
+        elapsed = max(self._clock() - self._window_start, 1e-6)
+        rate = self._window_bytes / elapsed
+        error_rate = self._window_errors / self._window_done
+        previous_rate, last_action = self._last_rate, self._last_action
+        self._last_rate = rate
+        if error_rate > ERROR_RATE_LIMIT:
+            return self._change(self.limit // 2, "hold", f"오류율 {error_rate:.0%}")
+        improved = previous_rate is None or rate >= previous_rate * (1 + THROUGHPUT_GAIN)
+        if last_action == "increase" and not improved:
+            return self._change(self.limit - 1, "hold", f"처리량 정체 {format_rate(rate)}")
+        if last_action == "hold":
+            # Re-measure at the reduced limit before probing upwards again.
+            self._last_action = None
+            self._reset_window()
+            return None
+        return self._change(self.limit + 1, "increase", f"처리량 {format_rate(rate)}")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Iterable
+
+ARCHIVE_FILENAME = ".pipeline-archive.sqlite3"
+# Ordered by progress; a video never moves back to an earlier status.
+ARCHIVE_STATUSES = ("downloaded", "transcoded", "uploaded")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    playlist_id INTEGER NOT NULL,
+    video_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    audio_path TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (playlist_id, video_id)
+)
+"""
+
+
+def _rank(status: str | None) -> int:
+    return ARCHIVE_STATUSES.index(status) if status in ARCHIVE_STATUSES else -1
+
+
+class DownloadArchive:
+    """SQLite record of processed videos, stored under the download root."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    @classmethod
+    def open(cls, download_root: Path) -> "DownloadArchive":
+        return cls(download_root / ARCHIVE_FILENAME)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def video_ids(self, playlist_id: int, statuses: Iterable[str] = ARCHIVE_STATUSES) -> set[str]:
+        wanted = list(statuses)
+        if not wanted:
+            return set()
+        placeholders = ", ".join("?" for _ in wanted)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT video_id FROM videos WHERE playlist_id = ? AND status IN ({placeholders})",
+                (playlist_id, *wanted),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def status(self, playlist_id: int, video_id: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM videos WHERE playlist_id = ? AND video_id = ?",
+                (playlist_id, video_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(
+        self,
+        playlist_id: int,
+        video_id: str,
+        status: str,
+        audio_path: Path | None = None,
+    ) -> None:
+        if status not in ARCHIVE_STATUSES:
+            raise ValueError(f"unknown archive status: {status}")
+        if not video_id:
+            return
+        now = datetime.now(UTC).isoformat()
+        with self._lock, self._conn:
+            current = self._conn.execute(
+                "SELECT status, audio_path FROM videos WHERE playlist_id = ? AND video_id = ?",
+                (playlist_id, video_id),
+            ).fetchone()
+            if current is not None and _rank(current[0]) > _rank(status):
+                status = current[0]
+            stored_path = str(audio_path) if audio_path else (current[1] if current else None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO videos (playlist_id, video_id, status, audio_path, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (playlist_id, video_id, status, stored_path, now),
+            )
+
+    def uploaded_files(self, uploaded_before: datetime) -> list[tuple[int, str, Path, datetime]]:
+        """Uploaded videos that still have local files, oldest upload first."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT playlist_id, video_id, audio_path, updated_at FROM videos"
+                " WHERE status = 'uploaded' AND audio_path IS NOT NULL AND updated_at <= ?"
+                " ORDER BY updated_at",
+                (uploaded_before.isoformat(),),
+            ).fetchall()
+        return [
+            (row[0], row[1], Path(row[2]), datetime.fromisoformat(row[3])) for row in rows
+        ]
+
+    def forget_files(self, playlist_id: int, video_id: str) -> None:
+        """Mark a video's local files as removed; its status is kept."""
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE videos SET audio_path = NULL WHERE playlist_id = ? AND video_id = ?",
+                (playlist_id, video_id),
+            )
@@ -1,13 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+import mimetypes
 import os
 from pathlib import Path
 from datetime import datetime
+from time import monotonic
+from typing import BinaryIO, Iterable
 import httpx
 
 from pipeline_client.client import Playlist
 
+from .catalog import CastopodCatalog
+
+DEFAULT_MAX_CONCURRENCY = 2
+PODCAST_PAGE_SIZE = 200
+EPISODE_PAGE_SIZE = 100
+# Playlists whose podcast and episode slugs are loaded at once by ``prewarm``.
+PREWARM_CONCURRENCY = 8
+# Responses worth retrying; anything else (validation errors, auth) fails at once.
+RETRYABLE_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for connection failures, timeouts and transient HTTP statuses."""
+
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUSES
+    return False
+
+
+def episode_is_published(episode: dict[str, object]) -> bool:
+    return bool(episode.get("published_at"))
+
+
 @dataclass
 class CastopodConfig:
     base_url: str
@@ -18,6 +47,8 @@ class CastopodConfig:
     publication_method: str = "now"
     client_timezone: str = "UTC"
     episode_type: str = "full"
+    # Upload+publish operations run against the Castopod host at once.
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
 
 
 def load_castopod_config_from_env() -> CastopodConfig | None:
@@ -32,6 +63,10 @@ def load_castopod_config_from_env() -> CastopodConfig | None:
     publication_method = os.getenv("CASTOPOD_API_PUBLICATION_METHOD", "now")
     client_timezone = os.getenv("CASTOPOD_API_TIMEZONE", "UTC")
     episode_type = os.getenv("CASTOPOD_API_EPISODE_TYPE", "full")
+    try:
+        max_concurrency = int(os.getenv("CASTOPOD_API_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))
+    except ValueError:
+        max_concurrency = DEFAULT_MAX_CONCURRENCY
     return CastopodConfig(
         base_url=base_url.rstrip("/"),
         username=username,
@@ -41,74 +76,297 @@ def load_castopod_config_from_env() -> CastopodConfig | None:
         publication_method=publication_method,
         client_timezone=client_timezone,
         episode_type=episode_type,
+        max_concurrency=max(1, max_concurrency),
     )
 
 
+_AUDIO_MIME_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".opus": "audio/ogg",
+    ".ogg": "audio/ogg",
+    ".flac": "audio/flac",
+}
+
+
+def _audio_mime_type(path: Path) -> str:
+    guessed = mimetypes.guess_type(path.name)[0]
+    return _AUDIO_MIME_TYPES.get(path.suffix.lower(), guessed or "audio/mpeg")
+
+
+# Sample the process RSS after roughly this many bytes have been streamed.
+_RSS_SAMPLE_BYTES = 1024 * 1024
+
+
+def _current_rss() -> int:
+    """Resident set size of this process in bytes (0 where it cannot be read)."""
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        # Peak rather than current RSS; kilobytes on Linux, bytes on macOS.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+@dataclass
+class UploadStats:
+    """Bytes streamed for one episode upload, its duration and the RSS growth it saw."""
+
+    bytes_sent: int = 0
+    seconds: float = 0.0
+    # Highest process RSS above the level at the start of the upload.
+    peak_memory_bytes: int = 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_sent / self.seconds if self.seconds > 0 else 0.0
+
+    def message(self) -> str:
+        return (
+            f"{self.bytes_sent / 1024**2:.1f}MiB, {self.bytes_per_second / 1024**2:.1f}MiB/s, "
+            f"메모리 +{self.peak_memory_bytes / 1024**2:.1f}MiB"
+        )
+
+
+class _MeteredFile:
+    """Read-only file wrapper that counts streamed bytes and samples RSS.
+
+    httpx's multipart encoder reads file fields in 64 KiB chunks and takes the
+    length from ``fileno()``, so the body is never held in memory as a whole.
+    """
+
+    def __init__(self, fp: BinaryIO, stats: UploadStats, baseline_rss: int) -> None:
+        self._fp = fp
+        self._stats = stats
+        self._baseline_rss = baseline_rss
+        self._unsampled = 0
+        self.name = fp.name
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._fp.read(size)
+        self._stats.bytes_sent += len(chunk)
+        self._unsampled += len(chunk)
+        if self._unsampled >= _RSS_SAMPLE_BYTES or not chunk:
+            self._unsampled = 0
+            self.sample()
+        return chunk
+
+    def sample(self) -> None:
+        growth = _current_rss() - self._baseline_rss
+        if growth > self._stats.peak_memory_bytes:
+            self._stats.peak_memory_bytes = growth
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if offset == 0 and whence == os.SEEK_SET:
+            # httpx rewinds before streaming (and again on a redirect).
+            self._stats.bytes_sent = 0
+        return self._fp.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._fp.tell()
+
+    def fileno(self) -> int:
+        return self._fp.fileno()
+
+
 class CastopodClient:
-    def __init__(self, config: CastopodConfig) -> None:
+    """Async Castopod REST client sharing one keep-alive connection pool.
+
+    One client talks to one host, and at most ``config.max_concurrency``
+    uploads and publishes run against it at once; catalog reads are not
+    limited. With a ``catalog`` the podcast list and episode slugs are kept on
+    disk between runs. ``transport`` replaces the network layer in tests.
+    """
+
+    def __init__(
+        self,
+        config: CastopodConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+        catalog: CastopodCatalog | None = None,
+    ) -> None:
         self._config = config
-        self._client = httpx.Client(
+        pool_size = max(1, config.max_concurrency) + 2
+        self._client = httpx.AsyncClient(
             base_url=config.base_url,
             auth=(config.username, config.password),
             verify=config.verify_ssl,
             timeout=30.0,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            transport=transport,
         )
+        self._upload_slots = asyncio.Semaphore(max(1, config.max_concurrency))
+        self._podcast_lock = asyncio.Lock()
         self._podcast_cache: dict[str, dict[str, object]] = {}
         self._episode_cache: dict[int, set[str]] = {}
+        self._episode_locks: dict[int, asyncio.Lock] = {}
+        self._catalog = catalog
 
-    def close(self) -> None:
-        self._client.close()
+    @property
+    def max_concurrency(self) -> int:
+        return max(1, self._config.max_concurrency)
 
-    def _fetch_podcasts(self) -> None:
-        if self._podcast_cache:
-            return
-        response = self._client.get("podcasts", params={"limit": 200})
-        response.raise_for_status()
-        for podcast in response.json():
-            guid = podcast.get("guid")
-            slug = podcast.get("handle")
-            if guid:
-                self._podcast_cache[guid] = podcast
-            if slug:
-                self._podcast_cache.setdefault(slug, podcast)
-
-    def resolve_podcast_id(self, playlist: Playlist) -> int | None:
-        self._fetch_podcasts()
+    async def close(self) -> None:
+        if self._catalog is not None:
+            self._catalog.save()
+        await self._client.aclose()
+
+    async def _list_podcasts(self) -> list[dict[str, object]]:
+        podcasts: list[dict[str, object]] = []
+        seen: set[object] = set()
+        offset = 0
+        while True:
+            response = await self._client.get(
+                "podcasts", params={"limit": PODCAST_PAGE_SIZE, "offset": offset}
+            )
+            response.raise_for_status()
+            payload = response.json()
+            # Stop on a repeated page too, in case the host ignores ``offset``.
+            page = [podcast for podcast in payload if podcast.get("id") not in seen]
+            podcasts.extend(page)
+            seen.update(podcast.get("id") for podcast in page)
+            if len(payload) < PODCAST_PAGE_SIZE or not page:
+                return podcasts
+            offset += PODCAST_PAGE_SIZE
+
+    async def _fetch_podcasts(self) -> None:
+        async with self._podcast_lock:
+            if self._podcast_cache:
+                return
+            podcasts = self._catalog.podcasts() if self._catalog is not None else None
+            if podcasts is None:
+                podcasts = await self._list_podcasts()
+                if self._catalog is not None:
+                    self._catalog.store_podcasts(podcasts)
+            for podcast in podcasts:
+                guid = podcast.get("guid")
+                slug = podcast.get("handle")
+                if guid:
+                    self._podcast_cache[guid] = podcast
+                if slug:
+                    self._podcast_cache.setdefault(slug, podcast)
+
+    async def resolve_podcast_id(self, playlist: Playlist) -> int | None:
+        await self._fetch_podcasts()
         if playlist.castopod_uuid and playlist.castopod_uuid in self._podcast_cache:
             return int(self._podcast_cache[playlist.castopod_uuid]["id"])
         if playlist.castopod_slug and playlist.castopod_slug in self._podcast_cache:
             return int(self._podcast_cache[playlist.castopod_slug]["id"])
         return None
 
-    def _fetch_episode_slugs(self, podcast_id: int) -> set[str]:
-        if podcast_id in self._episode_cache:
-            return self._episode_cache[podcast_id]
-        slugs: set[str] = set()
+    async def _list_episode_slugs(self, podcast_id: int, known: set[str] | None) -> set[str]:
+        """Page through the podcast's episodes, newest first.
+
+        With ``known`` slugs the listing stops after the first page that contains
+        one of them; the API lists the most recent episodes first.
+        """
+
+        slugs: set[str] = set(known or ())
         offset = 0
         while True:
-            response = self._client.get(
+            response = await self._client.get(
                 "episodes",
-                params={"podcastIds": podcast_id, "limit": 100, "offset": offset},
+                params={"podcastIds": podcast_id, "limit": EPISODE_PAGE_SIZE, "offset": offset},
             )
             response.raise_for_status()
             payload = response.json()
             if not payload:
                 break
-            for entry in payload:
-                slug = entry.get("slug")
-                if slug:
-                    slugs.add(slug)
-            if len(payload) < 100:
+            page = {entry["slug"] for entry in payload if entry.get("slug")}
+            slugs.update(page)
+            if known is not None and page & known:
+                break
+            if len(payload) < EPISODE_PAGE_SIZE:
                 break
-            offset += 100
-        self._episode_cache[podcast_id] = slugs
+            offset += EPISODE_PAGE_SIZE
         return slugs
 
-    def get_episode_slugs(self, podcast_id: int) -> set[str]:
+    async def _fetch_episode_slugs(self, podcast_id: int) -> set[str]:
+        if podcast_id in self._episode_cache:
+            return self._episode_cache[podcast_id]
+        lock = self._episode_locks.setdefault(podcast_id, asyncio.Lock())
+        async with lock:
+            if podcast_id in self._episode_cache:
+                return self._episode_cache[podcast_id]
+            known, fresh = (
+                self._catalog.episodes(podcast_id) if self._catalog is not None else (None, False)
+            )
+            if known is not None and fresh:
+                slugs = known
+            else:
+                slugs = await self._list_episode_slugs(podcast_id, known)
+                if self._catalog is not None:
+                    self._catalog.store_episodes(podcast_id, slugs, full=known is None)
+            self._episode_cache[podcast_id] = slugs
+            return slugs
+
+    async def find_episode(self, podcast_id: int, slug: str) -> dict[str, object] | None:
+        """Look ``slug`` up on the server, bypassing the cached slug lists.
+
+        Pages through the podcast's episodes, newest first, so an episode created by
+        a failed attempt is usually found on the first page, but concurrent uploads
+        or backdated episodes may push it further down.
+        """
+
+        seen: set[object] = set()
+        offset = 0
+        while True:
+            response = await self._client.get(
+                "episodes",
+                params={"podcastIds": podcast_id, "limit": EPISODE_PAGE_SIZE, "offset": offset},
+            )
+            response.raise_for_status()
+            payload = response.json()
+            for entry in payload:
+                if entry.get("slug") == slug:
+                    self._episode_cache.setdefault(podcast_id, set()).add(slug)
+                    if self._catalog is not None:
+                        self._catalog.add_slug(podcast_id, slug)
+                    return entry
+            # Stop on a repeated page too, in case the host ignores ``offset``.
+            page = {entry.get("slug") for entry in payload} - seen
+            seen.update(page)
+            if len(payload) < EPISODE_PAGE_SIZE or not page:
+                return None
+            offset += EPISODE_PAGE_SIZE
+
+    async def prewarm(
+        self, playlists: Iterable[Playlist], concurrency: int = PREWARM_CONCURRENCY
+    ) -> int:
+        """Resolve the podcasts of ``playlists`` and load their episode slugs concurrently.
+
+        Failures are left for the playlist's own run to report. Returns the number
+        of podcasts loaded.
+        """
+
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def _warm(playlist: Playlist) -> int | None:
+            async with limit:
+                try:
+                    podcast_id = await self.resolve_podcast_id(playlist)
+                    if podcast_id is not None:
+                        await self._fetch_episode_slugs(podcast_id)
+                    return podcast_id
+                except (httpx.HTTPError, ValueError):
+                    return None
+
+        podcast_ids = await asyncio.gather(*(_warm(playlist) for playlist in playlists))
+        if self._catalog is not None:
+            self._catalog.save()
+        return len({podcast_id for podcast_id in podcast_ids if podcast_id is not None})
+
+    async def get_episode_slugs(self, podcast_id: int) -> set[str]:
         """Return a copy of the known episode slugs for the given podcast."""
-        return set(self._fetch_episode_slugs(podcast_id))
+        return set(await self._fetch_episode_slugs(podcast_id))
 
-    def upload_episode(
+    async def _create_episode(
         self,
         podcast_id: int,
         slug: str,
@@ -116,9 +374,9 @@ class CastopodClient:
         description: str | None,
         audio_path: Path,
         cover_path: Path | None,
-        publication_datetime: datetime | None = None,
+        stats: UploadStats | None,
     ) -> dict[str, object] | None:
-        existing = self._fetch_episode_slugs(podcast_id)
+        existing = await self._fetch_episode_slugs(podcast_id)
         if slug in existing:
             return None
 
@@ -131,15 +389,30 @@ class CastopodClient:
             "updated_by": str(self._config.user_id),
             "type": self._config.episode_type,
         }
-        files: list[tuple[str, tuple[str, bytes, str]]] = []
-        files.append(("audio_file", (audio_path.name, audio_path.read_bytes(), "audio/mpeg")))
-        if cover_path and cover_path.exists():
-            files.append(("cover", (cover_path.name, cover_path.read_bytes(), "image/jpeg")))
-
-        response = self._client.post("episodes", data=data, files=files)
+        stats = stats if stats is not None else UploadStats()
+        baseline_rss = _current_rss()
+        started = monotonic()
+        with audio_path.open("rb") as audio_fp:
+            audio = _MeteredFile(audio_fp, stats, baseline_rss)
+            files: list[tuple[str, tuple[str, _MeteredFile | bytes, str]]] = [
+                ("audio_file", (audio_path.name, audio, _audio_mime_type(audio_path)))
+            ]
+            if cover_path and cover_path.exists():
+                # Covers are small square JPEGs; reading them whole is fine.
+                files.append(("cover", (cover_path.name, cover_path.read_bytes(), "image/jpeg")))
+            response = await self._client.post("episodes", data=data, files=files)  # type: ignore[arg-type]
+            audio.sample()
+        stats.seconds = monotonic() - started
         response.raise_for_status()
         episode = response.json()
         self._episode_cache.setdefault(podcast_id, set()).add(slug)
+        if self._catalog is not None:
+            self._catalog.add_slug(podcast_id, slug)
+        return episode
+
+    async def _publish_episode(
+        self, episode_id: int, publication_datetime: datetime | None
+    ) -> None:
         publish_method = self._config.publication_method
         publish_data = {
             "publication_method": publish_method,
@@ -153,11 +426,39 @@ class CastopodClient:
                 )
             else:
                 publish_data["publication_method"] = "now"
-        self._client.post(
-            f"episodes/{episode['id']}/publish",
-            data=publish_data,
+        (
+            await self._client.post(f"episodes/{episode_id}/publish", data=publish_data)
         ).raise_for_status()
-        return episode
+
+    async def create_episode(
+        self,
+        podcast_id: int,
+        slug: str,
+        title: str,
+        description: str | None,
+        audio_path: Path,
+        cover_path: Path | None,
+        stats: UploadStats | None = None,
+    ) -> dict[str, object] | None:
+        """Upload an episode without publishing it; None when the slug already exists.
+
+        Waits for one of the host's upload slots and streams the audio and cover
+        from disk. ``stats`` is filled with the bytes sent, the upload time and the
+        peak RSS growth while the body was streamed.
+        """
+
+        async with self._upload_slots:
+            return await self._create_episode(
+                podcast_id, slug, title, description, audio_path, cover_path, stats
+            )
+
+    async def publish_episode(
+        self, episode_id: int, publication_datetime: datetime | None = None
+    ) -> None:
+        """Publish an episode created by ``create_episode``; safe to retry on its own."""
+
+        async with self._upload_slots:
+            await self._publish_episode(episode_id, publication_datetime)
 
 
 def slugify(value: str) -> str:
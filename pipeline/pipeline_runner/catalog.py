@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+CATALOG_FILENAME = ".castopod-catalog.json"
+DEFAULT_CATALOG_TTL_MINUTES = 30.0
+# Re-list every episode page after this long so deletions on the server are noticed.
+CATALOG_FULL_REFRESH_SECONDS = 24 * 3600
+
+
+@dataclass
+class CatalogEpisodes:
+    slugs: set[str]
+    fetched_at: float
+    # Last time every page was listed, not just the newest ones.
+    full_at: float
+
+
+class CastopodCatalog:
+    """On-disk copy of a Castopod host's podcasts and episode slugs.
+
+    Stored in ``<download-dir>/.castopod-catalog.json`` under the API base URL.
+    Entries younger than ``ttl_seconds`` are used as they are; older episode lists
+    are refreshed from the newest page until a known slug shows up, and listed in
+    full once ``CATALOG_FULL_REFRESH_SECONDS`` have passed. A ``read_only`` catalog
+    is used and refreshed in memory but never written back.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        base_url: str,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+        read_only: bool = False,
+    ) -> None:
+        self.path = path
+        self.base_url = base_url
+        self.ttl_seconds = ttl_seconds
+        self.read_only = read_only
+        self._clock = clock
+        self._lock = Lock()
+        self._podcasts: list[dict[str, Any]] | None = None
+        self._podcasts_at = 0.0
+        self._episodes: dict[int, CatalogEpisodes] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def open(
+        cls, download_root: Path, base_url: str, ttl_seconds: float, read_only: bool = False
+    ) -> "CastopodCatalog":
+        return cls(download_root / CATALOG_FILENAME, base_url, ttl_seconds, read_only=read_only)
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            host = payload.get(self.base_url) or {}
+        except (OSError, ValueError, AttributeError):
+            return
+        podcasts = host.get("podcasts") or {}
+        if isinstance(podcasts.get("items"), list):
+            self._podcasts = podcasts["items"]
+            self._podcasts_at = float(podcasts.get("fetched_at", 0))
+        for podcast_id, item in (host.get("episodes") or {}).items():
+            try:
+                self._episodes[int(podcast_id)] = CatalogEpisodes(
+                    slugs=set(item["slugs"]),
+                    fetched_at=float(item["fetched_at"]),
+                    full_at=float(item.get("full_at", 0)),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _fresh(self, fetched_at: float) -> bool:
+        return self._clock() - fetched_at <= self.ttl_seconds
+
+    def podcasts(self) -> list[dict[str, Any]] | None:
+        """Cached podcast list while it is fresh, otherwise None."""
+
+        with self._lock:
+            if self._podcasts is None or not self._fresh(self._podcasts_at):
+                return None
+            return list(self._podcasts)
+
+    def store_podcasts(self, podcasts: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._podcasts = list(podcasts)
+            self._podcasts_at = self._clock()
+            self._dirty = True
+
+    def episodes(self, podcast_id: int) -> tuple[set[str] | None, bool]:
+        """Known slugs of ``podcast_id`` and whether they can be used without a refresh.
+
+        The slugs are None when the podcast has to be listed in full.
+        """
+
+        with self._lock:
+            entry = self._episodes.get(podcast_id)
+            if entry is None or self._clock() - entry.full_at > CATALOG_FULL_REFRESH_SECONDS:
+                return None, False
+            return set(entry.slugs), self._fresh(entry.fetched_at)
+
+    def store_episodes(self, podcast_id: int, slugs: set[str], full: bool) -> None:
+        with self._lock:
+            now = self._clock()
+            previous = self._episodes.get(podcast_id)
+            full_at = now if full or previous is None else previous.full_at
+            self._episodes[podcast_id] = CatalogEpisodes(set(slugs), now, full_at)
+            self._dirty = True
+
+    def add_slug(self, podcast_id: int, slug: str) -> None:
+        with self._lock:
+            entry = self._episodes.get(podcast_id)
+            if entry is not None and slug not in entry.slugs:
+                entry.slugs.add(slug)
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if self.read_only or not self._dirty:
+                return
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+                if not isinstance(payload, dict):
+                    payload = {}
+            except (OSError, ValueError):
+                payload = {}
+            payload[self.base_url] = {
+                "podcasts": {"fetched_at": self._podcasts_at, "items": self._podcasts or []},
+                "episodes": {
+                    str(podcast_id): {
+                        "slugs": sorted(entry.slugs),
+                        "fetched_at": entry.fetched_at,
+                        "full_at": entry.full_at,
+                    }
+                    for podcast_id, entry in self._episodes.items()
+                },
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as fp:
+                json.dump(payload, fp, ensure_ascii=False)
+            temp_path.replace(self.path)
+            self._dirty = False
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from .ratelimit import THROTTLE_STATUSES, RateLimiter
+
+YOUTUBE_FEED_URL = "https://www.youtube.com/feeds/videos.xml?playlist_id={playlist_id}"
+FEED_STATE_FILENAME = "feed.json"
+FEED_TIMEOUT_SECONDS = 10.0
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+
+
+class FeedError(RuntimeError):
+    """The feed could not be fetched or parsed; callers fall back to a full listing."""
+
+    def __init__(self, message: str, status: int | None = None, headers: object = None) -> None:
+        super().__init__(message)
+        # Read by ``throttle_status``/``retry_after_seconds`` for rate-limiter retries.
+        self.status = status
+        self.headers = headers
+
+
+@dataclass
+class FeedState:
+    """Validators and video ids of the last feed response, kept in ``metadata/feed.json``."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    video_ids: list[str] = field(default_factory=list)
+    checked_at: str = ""
+
+
+@dataclass
+class FeedCheck:
+    video_ids: list[str]
+    new_ids: list[str]
+    not_modified: bool
+    waited: float = 0.0
+
+    @property
+    def unchanged(self) -> bool:
+        """True when the feed lists videos and all of them are already known."""
+
+        return bool(self.video_ids) and not self.new_ids
+
+
+def playlist_feed_id(value: str) -> str | None:
+    """YouTube playlist id of a playlist id or URL, or None for other URLs."""
+
+    value = value.strip()
+    if not value.startswith(("http://", "https://")):
+        return value or None
+    parsed = urlparse(value)
+    if not parsed.netloc.endswith("youtube.com"):
+        return None
+    ids = parse_qs(parsed.query).get("list")
+    return ids[0] if ids else None
+
+
+def parse_feed_video_ids(payload: bytes) -> list[str]:
+    try:
+        root = ET.fromstring(payload)
+    except ET.ParseError as exc:
+        raise FeedError(f"invalid feed: {exc}") from exc
+    video_ids: list[str] = []
+    for entry in root.iter(f"{_ATOM}entry"):
+        video_id = entry.findtext(f"{_YT}videoId")
+        if video_id:
+            video_ids.append(video_id.strip())
+    return video_ids
+
+
+def _state_path(playlist_dir: Path) -> Path:
+    return playlist_dir / "metadata" / FEED_STATE_FILENAME
+
+
+def load_feed_state(playlist_dir: Path) -> FeedState | None:
+    try:
+        payload = json.loads(_state_path(playlist_dir).read_text(encoding="utf-8"))
+        return FeedState(
+            etag=payload.get("etag"),
+            last_modified=payload.get("last_modified"),
+            video_ids=[str(video_id) for video_id in payload.get("video_ids", [])],
+            checked_at=str(payload.get("checked_at", "")),
+        )
+    except (OSError, ValueError, AttributeError, TypeError):
+        return None
+
+
+def save_feed_state(playlist_dir: Path, state: FeedState) -> None:
+    path = _state_path(playlist_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(asdict(state), fp, ensure_ascii=False, indent=2)
+
+
+def check_feed(
+    url: str,
+    state: FeedState | None,
+    is_known: Callable[[str], bool],
+    rate_limiter: RateLimiter | None = None,
+    timeout: float = FEED_TIMEOUT_SECONDS,
+) -> tuple[FeedCheck, FeedState]:
+    """Fetch ``url`` with conditional-GET validators from ``state``.
+
+    A 304 reuses the video ids stored with ``state``; they are compared with
+    ``is_known`` again, since the archive may have changed since. Returns the
+    check and the state to store for the next run.
+    """
+
+    headers: dict[str, str] = {}
+    if state is not None and state.video_ids:
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+    def _send() -> httpx.Response:
+        try:
+            response = httpx.get(url, headers=headers, timeout=timeout, follow_redirects=True)
+        except httpx.HTTPError as exc:
+            raise FeedError(f"feed request failed: {exc}") from exc
+        if response.status_code in THROTTLE_STATUSES:
+            raise FeedError(
+                f"feed throttled: HTTP {response.status_code}",
+                response.status_code,
+                response.headers,
+            )
+        return response
+
+    if rate_limiter is not None:
+        response, waited = rate_limiter.call(_send)
+    else:
+        response, waited = _send(), 0.0
+
+    checked_at = datetime.now(UTC).isoformat()
+    if response.status_code == 304 and state is not None:
+        video_ids = list(state.video_ids)
+        new_state = FeedState(state.etag, state.last_modified, video_ids, checked_at)
+        not_modified = True
+    elif response.status_code == 200:
+        video_ids = parse_feed_video_ids(response.content)
+        new_state = FeedState(
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            video_ids,
+            checked_at,
+        )
+        not_modified = False
+    else:
+        raise FeedError(f"unexpected feed response: HTTP {response.status_code}", response.status_code)
+    new_ids = [video_id for video_id in video_ids if not is_known(video_id)]
+    return FeedCheck(video_ids, new_ids, not_modified, waited), new_state
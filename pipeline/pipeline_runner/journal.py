@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable
+
+JOURNAL_FILENAME = "journal.jsonl"
+# Ordered by progress; a video never moves back to an earlier stage.
+JOURNAL_STAGES = ("listed", "downloading", "transcoded", "artwork", "uploaded", "published")
+# Persist download offsets only every few MiB so the journal stays small.
+PROGRESS_STEP_BYTES = 4 * 1024 * 1024
+
+_ENTRY_FIELDS = ("id", "title", "url", "webpage_url", "original_url", "upload_date", "duration")
+_PLAYLIST_FIELDS = ("id", "title", "thumbnail", "thumbnails")
+
+
+def stage_rank(stage: str | None) -> int:
+    return JOURNAL_STAGES.index(stage) if stage in JOURNAL_STAGES else -1
+
+
+def _slim(data: dict[str, Any] | None, keys: Iterable[str]) -> dict[str, Any]:
+    if not data:
+        return {}
+    return {key: data[key] for key in keys if data.get(key) is not None}
+
+
+@dataclass
+class JournalEntry:
+    video_id: str
+    stage: str
+    entry: dict[str, Any] = field(default_factory=dict)
+    episode: dict[str, Any] | None = None
+    downloaded_bytes: int | None = None
+    # Castopod episode created by an upload that has not been published yet.
+    castopod_episode_id: int | None = None
+
+
+class PlaylistJournal:
+    """Append-only checkpoint log of per-episode progress inside a playlist directory.
+
+    Each line is a JSON event; replaying the file yields the latest stage per video
+    and whether the last run finished, so an interrupted run can pick up its
+    pending entries without listing the playlist again.
+    """
+
+    def __init__(self, playlist_dir: Path) -> None:
+        self.path = playlist_dir / "metadata" / JOURNAL_FILENAME
+        self._lock = Lock()
+        self._entries: dict[str, JournalEntry] = {}
+        self._run: dict[str, Any] | None = None
+        self._last_progress: dict[str, int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # torn write from a crash
+            self._apply(event)
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        kind = event.get("event")
+        if kind == "run_started":
+            self._run = event
+        elif kind == "run_completed":
+            self._run = None
+        elif kind == "stage":
+            video_id = event.get("video_id")
+            stage = event.get("stage")
+            if not video_id or stage not in JOURNAL_STAGES:
+                return
+            current = self._entries.get(video_id)
+            if current is None:
+                current = JournalEntry(video_id=video_id, stage=stage)
+                self._entries[video_id] = current
+            elif stage_rank(stage) < stage_rank(current.stage):
+                return
+            current.stage = stage
+            if event.get("entry"):
+                current.entry = event["entry"]
+            if event.get("episode"):
+                current.episode = event["episode"]
+            if event.get("downloaded_bytes") is not None:
+                current.downloaded_bytes = event["downloaded_bytes"]
+            if event.get("castopod_episode_id") is not None:
+                current.castopod_episode_id = event["castopod_episode_id"]
+
+    def _append(self, event: dict[str, Any]) -> None:
+        event.setdefault("ts", datetime.now(UTC).isoformat())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fp:
+            fp.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+        self._apply(event)
+
+    @property
+    def has_open_run(self) -> bool:
+        return self._run is not None
+
+    @property
+    def playlist_info(self) -> dict[str, Any] | None:
+        return (self._run or {}).get("playlist_info") or None
+
+    def get(self, video_id: str) -> JournalEntry | None:
+        return self._entries.get(video_id)
+
+    def unpublished_uploads(self) -> list[JournalEntry]:
+        """Entries created on Castopod whose publish has not succeeded yet."""
+
+        return [
+            state
+            for state in self._entries.values()
+            if state.stage == "uploaded" and state.castopod_episode_id is not None
+        ]
+
+    def pending_entries(self) -> list[dict[str, Any]]:
+        """Listing entries of the unfinished run that have not reached its target stage."""
+
+        if self._run is None:
+            return []
+        target = stage_rank(self._run.get("target_stage"))
+        pending: list[dict[str, Any]] = []
+        for video_id in self._run.get("video_ids", []):
+            state = self._entries.get(video_id)
+            if state is None or stage_rank(state.stage) < target:
+                pending.append(dict(state.entry) if state else {"id": video_id})
+        return pending
+
+    def start_run(
+        self,
+        entries: list[dict[str, Any]],
+        target_stage: str,
+        playlist_info: dict[str, Any] | None = None,
+    ) -> None:
+        with self._lock:
+            video_ids = [str(entry.get("id")) for entry in entries if entry.get("id")]
+            self._append(
+                {
+                    "event": "run_started",
+                    "target_stage": target_stage,
+                    "video_ids": video_ids,
+                    "playlist_info": _slim(playlist_info, _PLAYLIST_FIELDS),
+                }
+            )
+            for entry in entries:
+                video_id = entry.get("id")
+                if video_id and video_id not in self._entries:
+                    self._append(
+                        {
+                            "event": "stage",
+                            "video_id": video_id,
+                            "stage": "listed",
+                            "entry": _slim(entry, _ENTRY_FIELDS),
+                        }
+                    )
+
+    def record(self, video_id: str, stage: str, **data: Any) -> None:
+        if not video_id or stage not in JOURNAL_STAGES:
+            return
+        with self._lock:
+            self._append({"event": "stage", "video_id": video_id, "stage": stage, **data})
+
+    def record_download_progress(self, video_id: str, downloaded_bytes: int) -> None:
+        if not video_id:
+            return
+        last = self._last_progress.get(video_id)
+        if last is not None and downloaded_bytes - last < PROGRESS_STEP_BYTES:
+            return
+        self._last_progress[video_id] = downloaded_bytes
+        self.record(video_id, "downloading", downloaded_bytes=downloaded_bytes)
+
+    def complete_run(self) -> None:
+        """Close the current run and compact the log to one line per video."""
+
+        with self._lock:
+            self._run = None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as fp:
+                for state in self._entries.values():
+                    event = {
+                        "event": "stage",
+                        "video_id": state.video_id,
+                        "stage": state.stage,
+                        "entry": state.entry,
+                        "episode": state.episode,
+                        "downloaded_bytes": state.downloaded_bytes,
+                        "castopod_episode_id": state.castopod_episode_id,
+                    }
+                    fp.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+            temp_path.replace(self.path)
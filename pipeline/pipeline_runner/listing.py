@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+LISTING_MODES = ("flat", "full", "incremental")
+# Incremental listings stop after this many consecutive already-known entries.
+INCREMENTAL_KNOWN_RUN = 10
+# "playlist" keeps the listing order, "newest" handles the most recent uploads first.
+PROCESSING_ORDERS = ("playlist", "newest")
+LISTING_STATE_FILENAME = "listing.json"
+
+
+def build_playlist_url(value: str) -> str:
+    value = value.strip()
+    if value.startswith("http://") or value.startswith("https://"):
+        return value
+    return f"https://www.youtube.com/playlist?list={value}"
+
+
+def entry_video_id(entry: dict[str, Any]) -> str:
+    return str(entry.get("id") or entry.get("url") or entry.get("title") or "")
+
+
+def entry_timestamp(entry: dict[str, Any]) -> float | None:
+    """Upload time of a listing entry, when the listing carries one."""
+
+    for key in ("timestamp", "release_timestamp"):
+        value = entry.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+    for key in ("upload_date", "release_date"):
+        value = entry.get(key)
+        if isinstance(value, str) and len(value) == 8 and value.isdigit():
+            try:
+                return datetime.strptime(value, "%Y%m%d").replace(tzinfo=UTC).timestamp()
+            except ValueError:
+                continue
+    return None
+
+
+def newest_first(
+    entries: list[dict[str, Any]], newest_at_top: bool = False
+) -> list[dict[str, Any]]:
+    """``entries`` reordered so the most recent uploads come first.
+
+    Dated entries sort by upload time. Flat listings usually carry no dates, so
+    undated entries follow in reverse playlist order (playlists are appended to),
+    or in listing order for playlists that already list the newest video on top.
+    """
+
+    dated: list[tuple[float, int, dict[str, Any]]] = []
+    undated: list[dict[str, Any]] = []
+    for position, entry in enumerate(entries):
+        timestamp = entry_timestamp(entry)
+        if timestamp is None:
+            undated.append(entry)
+        else:
+            dated.append((timestamp, position, entry))
+    dated.sort(key=lambda item: (-item[0], item[1] if newest_at_top else -item[1]))
+    if not newest_at_top:
+        undated.reverse()
+    return [entry for _timestamp, _position, entry in dated] + undated
+
+
+def listing_fingerprint(video_ids: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for video_id in video_ids:
+        digest.update(video_id.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+@dataclass
+class ListingState:
+    """Fingerprint of the playlist listing seen by the last completed run."""
+
+    fingerprint: str
+    entry_count: int
+    updated_at: str
+
+
+def _state_path(playlist_dir: Path) -> Path:
+    return playlist_dir / "metadata" / LISTING_STATE_FILENAME
+
+
+def load_listing_state(playlist_dir: Path) -> ListingState | None:
+    path = _state_path(playlist_dir)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return ListingState(
+            fingerprint=str(payload["fingerprint"]),
+            entry_count=int(payload.get("entry_count", 0)),
+            updated_at=str(payload.get("updated_at", "")),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_listing_state(playlist_dir: Path, fingerprint: str, entry_count: int) -> None:
+    path = _state_path(playlist_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "fingerprint": fingerprint,
+        "entry_count": entry_count,
+        "updated_at": datetime.now(UTC).isoformat(),
+    }
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(payload, fp, ensure_ascii=False, indent=2)
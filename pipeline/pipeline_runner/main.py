@@ -3,11 +3,14 @@ from __future__ import annotations
 import argparse
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, time
+from datetime import UTC, datetime, time, timedelta
 from pathlib import Path
 from threading import Event
-from typing import Any, Iterable
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterable
+from urllib.parse import parse_qs, quote, urlparse
 
 from rich.console import Console
 from rich.table import Table
@@ -24,14 +27,69 @@ from pipeline_client.client import (
     PipelineChannel,
     PipelineConfiguration,
     PipelinePlaylist,
+    Playlist,
 )
 
-from .castopod import CastopodClient, load_castopod_config_from_env, slugify
+from .castopod import (
+    CastopodClient,
+    UploadStats,
+    episode_is_published,
+    is_retryable,
+    load_castopod_config_from_env,
+    slugify,
+)
+from .catalog import DEFAULT_CATALOG_TTL_MINUTES, CastopodCatalog
 
+from .adaptive import DEFAULT_MAX_DOWNLOAD_WORKERS, AdaptiveConcurrency, ConcurrencyChange
+from .archive import ARCHIVE_FILENAME, ARCHIVE_STATUSES, DownloadArchive
 from .artwork import create_square_artwork, gather_thumbnail_urls
+from .feed import (
+    YOUTUBE_FEED_URL,
+    FeedCheck,
+    FeedError,
+    check_feed,
+    load_feed_state,
+    playlist_feed_id,
+    save_feed_state,
+)
+from .journal import PlaylistJournal, stage_rank
+from .listing import (
+    INCREMENTAL_KNOWN_RUN,
+    LISTING_MODES,
+    PROCESSING_ORDERS,
+    build_playlist_url,
+    entry_video_id,
+    listing_fingerprint,
+    load_listing_state,
+    newest_first,
+    save_listing_state,
+)
+from .metacache import DEFAULT_METADATA_TTL_HOURS, MetadataCache
+from .plan import PLAN_CONCURRENCY, PlaylistPlan, plan_configuration, plan_report
+from .ratelimit import BACKOFF_MAX_SECONDS, DEFAULT_BURST, RateLimiter, retry_after_seconds
+from .storage import (
+    DEFAULT_MIN_RETENTION_HOURS,
+    StorageManager,
+    parse_channel_quotas,
+)
+from .transcode import AudioPlan, AudioPolicy, TranscodePool, plan_audio, transcode_audio
+from .videoindex import VideoIndex, link_or_clone, media_key
 
 console = Console()
 
+DEFAULT_DOWNLOAD_WORKERS = 1
+DEFAULT_LISTING_SHARDS = 4
+LISTING_WINDOW_RETRIES = 2
+DEFAULT_PLAYLIST_CONCURRENCY = 1
+DEFAULT_JOB_SLOTS = 1
+STREAM_QUEUE_SIZE = 4
+# Tries per Castopod upload or publish; retries back off exponentially.
+CASTOPOD_ATTEMPTS = 4
+CASTOPOD_RETRY_BASE_SECONDS = 2.0
+# How often in-flight Castopod uploads check whether their job was cancelled.
+CANCEL_POLL_SECONDS = 0.5
+TRANSCODE_MODES = ("inline", "pool")
+
 
 def env_flag(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
@@ -40,6 +98,147 @@ def env_flag(name: str, default: bool = False) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def _positive_int(value: Any, default: int) -> int:
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _choice(value: Any, choices: Iterable[str], default: str) -> str:
+    return value if isinstance(value, str) and value in choices else default
+
+
+@dataclass
+class RunnerSettings:
+    """Run-wide tuning knobs; playlists may override them via ``pipeline_options``."""
+
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS
+    # Let an AIMD controller move the worker count between 1 and the maximum.
+    adaptive_downloads: bool = False
+    max_download_workers: int = DEFAULT_MAX_DOWNLOAD_WORKERS
+    listing_mode: str = "flat"
+    # List playlists in playlist_items windows of this size, ``listing_shards`` at once;
+    # 0 lists them with a single extraction.
+    listing_window: int = 0
+    listing_shards: int = DEFAULT_LISTING_SHARDS
+    # "playlist", "newest" or "auto" (newest first for scheduled runs, playlist order for jobs).
+    processing_order: str = "auto"
+    # Fetch the playlist's Atom feed before scheduled runs and skip yt-dlp when
+    # every listed video is already known.
+    feed_precheck: bool = True
+    feed_url: str = YOUTUBE_FEED_URL
+    # Serve resolved metadata from ``.info.json`` files younger than this; 0 disables.
+    metadata_ttl_hours: float = DEFAULT_METADATA_TTL_HOURS
+    stream_uploads: bool = False
+    # Upload every new episode first, then publish them together in one batch.
+    deferred_publish: bool = False
+    passthrough_codecs: tuple[str, ...] = ()
+    passthrough_min_abr: float | None = None
+    stream_queue_size: int = STREAM_QUEUE_SIZE
+    # Playlists processed at once by ``process_configuration``, overall and per channel
+    # (0 = only the overall cap applies).
+    playlist_concurrency: int = DEFAULT_PLAYLIST_CONCURRENCY
+    channel_concurrency: int = 0
+    # Queue jobs processed at once by ``process_job_queue``.
+    job_slots: int = DEFAULT_JOB_SLOTS
+    # Shared per-run resources, created in ``async_main``.
+    transcode_pool: TranscodePool | None = field(default=None, repr=False)
+    archive: DownloadArchive | None = field(default=None, repr=False)
+    rate_limiter: RateLimiter | None = field(default=None, repr=False)
+    storage: StorageManager | None = field(default=None, repr=False)
+    video_index: VideoIndex | None = field(default=None, repr=False)
+
+    def close(self) -> None:
+        if self.transcode_pool is not None:
+            self.transcode_pool.close()
+        if self.archive is not None:
+            self.archive.close()
+        if self.video_index is not None:
+            self.video_index.close()
+
+    @property
+    def channel_concurrency_limit(self) -> int:
+        overall = max(1, self.playlist_concurrency)
+        if self.channel_concurrency <= 0:
+            return overall
+        return min(self.channel_concurrency, overall)
+
+    def download_workers_for(self, playlist: Playlist) -> int:
+        default = max(1, self.download_workers)
+        return _positive_int(playlist.pipeline_options.get("download_workers"), default)
+
+    def metadata_cache_for(self, playlist_dir: Path) -> MetadataCache | None:
+        if self.metadata_ttl_hours <= 0:
+            return None
+        return MetadataCache(playlist_dir, self.metadata_ttl_hours * 3600)
+
+    def download_controller_for(self, playlist: Playlist) -> AdaptiveConcurrency | None:
+        options = playlist.pipeline_options
+        enabled = options.get("adaptive_downloads", self.adaptive_downloads)
+        if not isinstance(enabled, bool) or not enabled:
+            return None
+        maximum = _positive_int(
+            options.get("max_download_workers"), max(1, self.max_download_workers)
+        )
+        return AdaptiveConcurrency(self.download_workers_for(playlist), maximum)
+
+    def audio_policy_for(self, playlist: Playlist) -> AudioPolicy | None:
+        options = playlist.pipeline_options
+        codecs = options.get("passthrough_codecs", self.passthrough_codecs)
+        if isinstance(codecs, str):
+            codecs = codecs.split(",")
+        min_abr = options.get("passthrough_min_abr", self.passthrough_min_abr)
+        try:
+            min_abr = float(min_abr) if min_abr is not None else None
+        except (TypeError, ValueError):
+            min_abr = self.passthrough_min_abr
+        return AudioPolicy.from_values(codecs or (), min_abr)
+
+    def listing_mode_for(self, playlist: Playlist) -> str:
+        return _choice(playlist.pipeline_options.get("listing_mode"), LISTING_MODES, self.listing_mode)
+
+    def listing_window_for(self, playlist: Playlist) -> int:
+        window = playlist.pipeline_options.get("listing_window")
+        return _positive_int(window, self.listing_window) if window != 0 else 0
+
+    def feed_precheck_for(self, playlist: Playlist) -> bool:
+        enabled = playlist.pipeline_options.get("feed_precheck", self.feed_precheck)
+        return enabled if isinstance(enabled, bool) else self.feed_precheck
+
+    def deferred_publish_for(self, playlist: Playlist) -> bool:
+        enabled = playlist.pipeline_options.get("deferred_publish", self.deferred_publish)
+        return enabled if isinstance(enabled, bool) else self.deferred_publish
+
+    def processing_order_for(self, playlist: Playlist, scheduled: bool) -> str:
+        default = "newest" if scheduled else "playlist"
+        order = playlist.pipeline_options.get("processing_order", self.processing_order)
+        return _choice(order, PROCESSING_ORDERS, default)
+
+
 @dataclass
 class EpisodeRecord:
     video_id: str
@@ -54,6 +253,21 @@ class EpisodeRecord:
     thumbnail_url: str | None
     thumbnails: list[dict[str, Any]] | None
     square_cover_path: Path | None = None
+    # HTTP requests issued through YoutubeDL while producing this episode.
+    request_count: int | None = None
+    reused_info: bool = False
+    # Built from a fresh cached ``.info.json`` without contacting YouTube.
+    cached_info: bool = False
+    # Seconds this episode's requests waited on the shared rate limiter.
+    throttled_seconds: float | None = None
+    # "passthrough", "remux" or "encode"; None when yt-dlp's postprocessor ran inline.
+    audio_action: str | None = None
+    transcode_cpu_seconds: float | None = None
+    # "hardlink", "reflink" or "copy" when the audio came from another playlist's download.
+    shared_media: str | None = None
+    upload_stats: UploadStats | None = None
+    # Castopod episode created but not yet published (deferred publish).
+    castopod_episode_id: int | None = None
 
 
 def _episode_sort_key(episode: EpisodeRecord) -> tuple[datetime, str]:
@@ -80,6 +294,52 @@ def _episode_publication_datetime(episode: EpisodeRecord) -> datetime | None:
     return datetime.combine(base_date.date(), time(hour=6))
 
 
+_EPISODE_PATH_FIELDS = ("audio_path", "info_path", "thumbnail_path", "square_cover_path")
+
+
+def _episode_payload(episode: EpisodeRecord) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "video_id": episode.video_id,
+        "title": episode.title,
+        "description": episode.description,
+        "webpage_url": episode.webpage_url,
+        "upload_date": episode.upload_date,
+        "duration": episode.duration,
+        "thumbnail_url": episode.thumbnail_url,
+        "thumbnails": episode.thumbnails,
+        "audio_action": episode.audio_action,
+        "transcode_cpu_seconds": episode.transcode_cpu_seconds,
+    }
+    for name in _EPISODE_PATH_FIELDS:
+        value = getattr(episode, name)
+        payload[name] = str(value) if value is not None else None
+    return payload
+
+
+def _episode_from_payload(payload: dict[str, Any]) -> EpisodeRecord | None:
+    if not payload.get("audio_path"):
+        return None
+    paths = {
+        name: Path(payload[name]) if payload.get(name) else None for name in _EPISODE_PATH_FIELDS
+    }
+    return EpisodeRecord(
+        video_id=payload.get("video_id") or "",
+        title=payload.get("title") or "",
+        description=payload.get("description"),
+        webpage_url=payload.get("webpage_url"),
+        upload_date=payload.get("upload_date"),
+        duration=payload.get("duration"),
+        audio_path=paths["audio_path"],
+        info_path=paths["info_path"],
+        thumbnail_path=paths["thumbnail_path"],
+        thumbnail_url=payload.get("thumbnail_url"),
+        thumbnails=payload.get("thumbnails"),
+        square_cover_path=paths["square_cover_path"],
+        audio_action=payload.get("audio_action"),
+        transcode_cpu_seconds=payload.get("transcode_cpu_seconds"),
+    )
+
+
 @dataclass
 class DownloadResult:
     playlist_url: str
@@ -87,6 +347,69 @@ class DownloadResult:
     dry_run: bool
     episodes: list[EpisodeRecord]
     playlist_info: dict[str, Any] | None
+    # Set when the listing matches the last completed run and nothing is pending.
+    unchanged: bool = False
+    # Only set when every pending entry was downloaded, so the run may be recorded.
+    listing_fingerprint: str | None = None
+    listing_count: int = 0
+    # Wall-clock seconds spent in ``process_playlist_entry``.
+    wall_seconds: float = 0.0
+    # Rate-limiter wait of the listing pass; episodes carry their own.
+    listing_throttled_seconds: float = 0.0
+    # Skipped by the feed pre-check without invoking yt-dlp.
+    feed_skipped: bool = False
+
+    @property
+    def request_count(self) -> int:
+        return sum(episode.request_count or 0 for episode in self.episodes)
+
+    @property
+    def transcode_cpu_seconds(self) -> float:
+        return sum(episode.transcode_cpu_seconds or 0.0 for episode in self.episodes)
+
+    @property
+    def throttled_seconds(self) -> float:
+        return self.listing_throttled_seconds + sum(
+            episode.throttled_seconds or 0.0 for episode in self.episodes
+        )
+
+    @property
+    def upload_bytes_per_second(self) -> float:
+        uploads = [episode.upload_stats for episode in self.episodes if episode.upload_stats]
+        seconds = sum(stats.seconds for stats in uploads)
+        return sum(stats.bytes_sent for stats in uploads) / seconds if seconds > 0 else 0.0
+
+    @property
+    def upload_peak_memory_bytes(self) -> int:
+        return max(
+            (episode.upload_stats.peak_memory_bytes for episode in self.episodes if episode.upload_stats),
+            default=0,
+        )
+
+
+@dataclass
+class StageProgress:
+    """Per-stage counters for a playlist whose episodes stream into Castopod."""
+
+    total: int = 0
+    downloaded: int = 0
+    artwork: int = 0
+    uploaded: int = 0
+    # Latest adaptive download concurrency and why it was chosen.
+    concurrency: int | None = None
+    concurrency_reason: str | None = None
+
+    def message(self) -> str:
+        message = (
+            f"다운로드 {self.downloaded}/{self.total} · "
+            f"아트워크 {self.artwork}/{self.total} · "
+            f"업로드 {self.uploaded}/{self.total}"
+        )
+        if self.concurrency is not None:
+            message += f" · 동시 다운로드 {self.concurrency}"
+            if self.concurrency_reason:
+                message += f" ({self.concurrency_reason})"
+        return message
 
 
 class JobCancelledError(Exception):
@@ -159,11 +482,344 @@ class RunTracker:
         await self.client.update_run(self.run_id, **fields)
 
 
-def build_playlist_url(value: str) -> str:
-    value = value.strip()
-    if value.startswith("http://") or value.startswith("https://"):
-        return value
-    return f"https://www.youtube.com/playlist?list={value}"
+def _build_episode_record(ydl: Any, info: dict[str, Any], audio_format: str) -> EpisodeRecord:
+    base_filename = Path(ydl.prepare_filename(info))
+    audio_path = base_filename.with_suffix(f".{audio_format}")
+    info_path = base_filename.with_suffix(".info.json")
+    thumbnail_path = None
+    for ext in (".jpg", ".webp", ".png"):
+        candidate = base_filename.with_suffix(ext)
+        if candidate.exists():
+            thumbnail_path = candidate
+            break
+    thumbnails = info.get("thumbnails")
+    return EpisodeRecord(
+        video_id=info.get("id", ""),
+        title=info.get("title", ""),
+        description=info.get("description"),
+        webpage_url=info.get("webpage_url"),
+        upload_date=info.get("upload_date"),
+        duration=info.get("duration"),
+        audio_path=audio_path,
+        info_path=info_path if info_path.exists() else None,
+        thumbnail_path=thumbnail_path,
+        thumbnail_url=info.get("thumbnail"),
+        thumbnails=list(thumbnails) if thumbnails else None,
+    )
+
+
+def _downloaded_media_path(ydl: Any, info: dict[str, Any]) -> Path:
+    for download in info.get("requested_downloads") or []:
+        filepath = download.get("filepath")
+        if filepath:
+            return Path(filepath)
+    return Path(ydl.prepare_filename(info))
+
+
+class _RequestCounter:
+    """Counts HTTP requests a YoutubeDL instance sends (extractor and download).
+
+    With a ``rate_limiter`` every request also passes through the shared token
+    bucket, and throttled responses are retried after the limiter's backoff.
+    """
+
+    def __init__(self, ydl: Any, rate_limiter: RateLimiter | None = None) -> None:
+        self.count = 0
+        self.throttled_seconds = 0.0
+        self.throttle_events = 0
+        original = getattr(ydl, "urlopen", None)
+        if original is None:
+            return
+
+        def _on_throttle(status: int, delay: float) -> None:
+            self.count += 1
+            self.throttle_events += 1
+            console.print(
+                f"[yellow]YouTube 요청 제한(HTTP {status})[/yellow] — {delay:.0f}초 대기 후 재시도"
+            )
+
+        def _counted(request: Any) -> Any:
+            self.count += 1
+            if rate_limiter is None:
+                return original(request)
+            response, waited = rate_limiter.call(lambda: original(request), _on_throttle)
+            self.throttled_seconds += waited
+            return response
+
+        ydl.urlopen = _counted
+
+
+# Re-extract instead of reusing resolved formats that expire within this window.
+FORMAT_EXPIRY_MARGIN_SECONDS = 300
+
+
+def _is_resolved_info(entry: dict[str, Any]) -> bool:
+    return entry.get("_type", "video") == "video" and bool(entry.get("formats"))
+
+
+def _formats_expired(info: dict[str, Any]) -> bool:
+    deadline = datetime.now(UTC).timestamp() + FORMAT_EXPIRY_MARGIN_SECONDS
+    selected = info.get("requested_formats") or [info]
+    for fmt in selected:
+        url = fmt.get("url")
+        if not isinstance(url, str):
+            continue
+        expire = parse_qs(urlparse(url).query).get("expire")
+        if not expire:
+            continue
+        try:
+            if float(expire[0]) <= deadline:
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def _downloaded_bytes(ydl: Any, info: dict[str, Any], episode: EpisodeRecord) -> int:
+    for path in (_downloaded_media_path(ydl, info), episode.audio_path):
+        try:
+            return path.stat().st_size
+        except OSError:
+            continue
+    size = info.get("filesize") or info.get("filesize_approx")
+    return int(size) if isinstance(size, (int, float)) else 0
+
+
+def _audio_exists(ydl: Any, info: dict[str, Any], audio_format: str) -> bool:
+    return Path(ydl.prepare_filename(info)).with_suffix(f".{audio_format}").exists()
+
+
+def _download_succeeded(ydl: Any, info: dict[str, Any], audio_format: str) -> bool:
+    return _audio_exists(ydl, info, audio_format) or _downloaded_media_path(ydl, info).exists()
+
+
+def _download_entry(
+    ydl: Any,
+    entry: dict[str, Any],
+    audio_format: str,
+    dry_run: bool,
+    counter: _RequestCounter | None = None,
+    metadata_cache: MetadataCache | None = None,
+) -> tuple[EpisodeRecord, dict[str, Any]] | None:
+    entry_url = entry.get("original_url") or entry.get("webpage_url") or entry.get("url")
+    info: dict[str, Any] | None = entry
+    reused_info = False
+    cached_info = False
+    requests_before = counter.count if counter else 0
+    throttled_before = counter.throttled_seconds if counter else 0.0
+    if entry_url and not dry_run:
+        info = None
+        cached = metadata_cache.fresh_info(entry_video_id(entry)) if metadata_cache else None
+        resolved = cached if cached is not None and _is_resolved_info(cached) else entry
+        if cached is not None and _audio_exists(ydl, cached, audio_format):
+            # Audio is on disk and its metadata is fresh: nothing to ask YouTube for.
+            info = cached
+            cached_info = True
+        elif _is_resolved_info(resolved) and not _formats_expired(resolved):
+            # The listing pass or the cache already resolved formats; download from them.
+            info = ydl.process_ie_result(dict(resolved), download=True)
+            reused_info = bool(info) and _download_succeeded(ydl, info, audio_format)
+        if not (cached_info or reused_info):
+            info = ydl.extract_info(entry_url, download=True)
+            if info and metadata_cache is not None:
+                metadata_cache.store(
+                    str(info.get("id") or ""),
+                    Path(ydl.prepare_filename(info)).with_suffix(".info.json"),
+                )
+    if not info:
+        console.print(
+            f"[yellow]경고:[/yellow] 다운로드 실패로 건너뜀 — {entry.get('id') or entry_url}"
+        )
+        return None
+    episode = _build_episode_record(ydl, info, audio_format)
+    episode.reused_info = reused_info
+    episode.cached_info = cached_info
+    if counter is not None and not dry_run:
+        episode.request_count = counter.count - requests_before
+        episode.throttled_seconds = counter.throttled_seconds - throttled_before
+        throttled = (
+            f", 대기 {episode.throttled_seconds:.1f}s" if episode.throttled_seconds else ""
+        )
+        console.print(
+            f"[dim]{episode.video_id}: 요청 {episode.request_count}회{throttled}"
+            f"{' (info 재사용)' if reused_info else ''}"
+            f"{' (메타데이터 캐시)' if cached_info else ''}[/dim]"
+        )
+    return episode, info
+
+
+async def _download_entries(
+    entries: list[dict[str, Any]],
+    ydl_opts: dict[str, Any],
+    audio_format: str,
+    dry_run: bool,
+    workers: int,
+    check_cancel: Callable[[], None],
+    transcode_pool: TranscodePool | None = None,
+    record_status: Callable[[EpisodeRecord, str], None] | None = None,
+    on_ready: Callable[[EpisodeRecord], Awaitable[None]] | None = None,
+    audio_policy: AudioPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    controller: AdaptiveConcurrency | None = None,
+    on_concurrency_change: Callable[[ConcurrencyChange], Awaitable[None]] | None = None,
+    metadata_cache: MetadataCache | None = None,
+    admit_download: Callable[[], Awaitable[None]] | None = None,
+) -> list[EpisodeRecord]:
+    """Download ``entries`` with up to ``workers`` concurrent YoutubeDL instances.
+
+    With a ``transcode_pool`` the workers only fetch the raw stream and hand it to
+    the pool, so the next download starts while ffmpeg encodes the previous one.
+    With an ``audio_policy`` each raw stream is passed through, remuxed or encoded
+    depending on its codec (in the pool when there is one, otherwise in a thread).
+    With a ``controller`` up to its maximum workers are started, but only as many
+    as its current limit download at the same time.
+    """
+
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    for entry in entries:
+        queue.put_nowait(entry)
+    episodes: list[EpisodeRecord] = []
+    transcodes: list[asyncio.Task[EpisodeRecord | None]] = []
+
+    def _record(episode: EpisodeRecord, status: str) -> None:
+        if record_status is not None and not dry_run:
+            record_status(episode, status)
+
+    async def _transcode(
+        episode: EpisodeRecord, source: Path, plan: AudioPlan
+    ) -> EpisodeRecord | None:
+        destination = episode.audio_path.with_suffix(f".{plan.extension}")
+        try:
+            if plan.action == "passthrough":
+                if source != destination:
+                    await asyncio.to_thread(source.replace, destination)
+                cpu_seconds = 0.0
+            elif transcode_pool is not None:
+                _path, cpu_seconds = await transcode_pool.transcode(
+                    source, destination, plan.extension, copy=plan.action == "remux"
+                )
+            else:
+                _path, cpu_seconds = await asyncio.to_thread(
+                    transcode_audio,
+                    str(source),
+                    str(destination),
+                    plan.extension,
+                    plan.action == "remux",
+                )
+        except Exception as exc:
+            console.print(f"[red]트랜스코딩 실패[/red] — {episode.video_id}: {exc}")
+            return None
+        episode.audio_path = destination
+        episode.audio_action = plan.action
+        episode.transcode_cpu_seconds = cpu_seconds
+        console.print(
+            f"[dim]{episode.video_id}: 오디오 {plan.action} ({plan.extension}), "
+            f"CPU {cpu_seconds:.1f}s[/dim]"
+        )
+        _record(episode, "transcoded")
+        if on_ready is not None:
+            await on_ready(episode)
+        return episode
+
+    slot_changed = asyncio.Condition()
+    active = 0
+
+    async def _take_slot() -> None:
+        nonlocal active
+        if controller is None:
+            return
+        async with slot_changed:
+            await slot_changed.wait_for(lambda: active < controller.limit)
+            active += 1
+
+    async def _release_slot() -> None:
+        nonlocal active
+        if controller is None:
+            return
+        async with slot_changed:
+            active -= 1
+            slot_changed.notify_all()
+
+    async def _observe(
+        ydl: Any,
+        downloaded: tuple[EpisodeRecord, dict[str, Any]] | None,
+        throttled: bool,
+    ) -> None:
+        if controller is None or dry_run:
+            return
+        nbytes = _downloaded_bytes(ydl, downloaded[1], downloaded[0]) if downloaded else 0
+        change = controller.record(nbytes, downloaded is not None, throttled)
+        if change is None:
+            return
+        async with slot_changed:
+            slot_changed.notify_all()
+        if on_concurrency_change is not None:
+            await on_concurrency_change(change)
+
+    async def _worker() -> None:
+        with YoutubeDL(ydl_opts) as ydl:
+            counter = _RequestCounter(ydl, rate_limiter)
+            while True:
+                check_cancel()
+                if queue.empty():
+                    return
+                await _take_slot()
+                if admit_download is not None and not dry_run:
+                    try:
+                        await admit_download()
+                    except BaseException:
+                        await _release_slot()
+                        raise
+                try:
+                    entry = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    await _release_slot()
+                    return
+                throttle_events = counter.throttle_events
+                downloaded = await asyncio.to_thread(
+                    _download_entry,
+                    ydl,
+                    entry,
+                    audio_format,
+                    dry_run,
+                    counter,
+                    metadata_cache,
+                )
+                await _release_slot()
+                await _observe(ydl, downloaded, counter.throttle_events > throttle_events)
+                if downloaded is None:
+                    continue
+                episode, info = downloaded
+                if (
+                    (transcode_pool is not None or audio_policy is not None)
+                    and not dry_run
+                    and not episode.cached_info
+                ):
+                    _record(episode, "downloaded")
+                    source = _downloaded_media_path(ydl, info)
+                    plan = plan_audio(info, audio_format, audio_policy)
+                    transcodes.append(asyncio.create_task(_transcode(episode, source, plan)))
+                else:
+                    _record(episode, "transcoded")
+                    episodes.append(episode)
+                    if on_ready is not None:
+                        await on_ready(episode)
+
+    if controller is not None:
+        workers = controller.maximum
+    worker_count = max(1, min(workers, len(entries)))
+    tasks = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+    try:
+        await asyncio.gather(*tasks)
+        for episode in await asyncio.gather(*transcodes):
+            if episode is not None:
+                episodes.append(episode)
+    except BaseException:
+        for task in [*tasks, *transcodes]:
+            task.cancel()
+        await asyncio.gather(*tasks, *transcodes, return_exceptions=True)
+        raise
+    return episodes
 
 
 async def download_playlist(
@@ -173,7 +829,37 @@ async def download_playlist(
     dry_run: bool,
     existing_slugs: set[str] | None = None,
     job_tracker: JobTracker | None = None,
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    transcode_pool: TranscodePool | None = None,
+    listing_mode: str = "flat",
+    archive: DownloadArchive | None = None,
+    known_video_ids: set[str] | None = None,
+    progress: StageProgress | None = None,
+    on_episode: Callable[[EpisodeRecord], Awaitable[None]] | None = None,
+    journal: PlaylistJournal | None = None,
+    journal_target_stage: str = "artwork",
+    audio_policy: AudioPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    controller: AdaptiveConcurrency | None = None,
+    metadata_cache: MetadataCache | None = None,
+    admit_download: Callable[[], Awaitable[None]] | None = None,
+    video_index: VideoIndex | None = None,
+    processing_order: str = "playlist",
+    listing_window: int = 0,
+    listing_shards: int = DEFAULT_LISTING_SHARDS,
 ) -> DownloadResult:
+    """Download the playlist's new entries.
+
+    ``on_episode`` is awaited as soon as each episode's audio is final, which lets
+    callers start later stages before the whole playlist has downloaded. With a
+    ``journal`` an interrupted run is resumed from its pending entries instead of
+    listing the playlist again, and already transcoded episodes are not downloaded.
+    With a ``video_index`` videos another playlist already produced are linked into
+    ``download_dir`` instead of being downloaded again. ``processing_order="newest"``
+    downloads the most recent uploads first; the returned episodes stay chronological.
+    A positive ``listing_window`` lists the playlist in ``playlist_items`` ranges of
+    that size, ``listing_shards`` at a time (``listing_mode="full"`` only).
+    """
     if YoutubeDL is None:  # pragma: no cover - fallback for missing dependency
         raise RuntimeError("yt-dlp is not installed in this environment")
 
@@ -201,81 +887,433 @@ async def download_playlist(
             }
         ],
     }
-    def _run() -> tuple[int, list[EpisodeRecord], dict[str, Any] | None, int]:
+    listing_counters: list[_RequestCounter] = []
+    playlist = pipeline_playlist.playlist
+    incremental = listing_mode == "incremental"
+    if incremental and not (known_video_ids or existing_slugs):
+        # Nothing is known yet, so the whole playlist has to be listed once.
+        incremental = False
+    elif incremental and not _newest_on_top(playlist):
+        console.print(
+            "[yellow]증분 목록 조회는 최신 영상이 맨 위에 오는 플레이리스트에서만 사용 — "
+            "flat 목록으로 진행 (pipeline_options.newest_on_top으로 지정)[/yellow]"
+        )
+        incremental = False
+    if listing_window > 0 and listing_mode != "full":
+        # A flat listing already arrives in a few continuation pages, and every window
+        # would fetch the pages in front of it again.
+        console.print("[yellow]구간 목록 조회는 full 모드에서만 사용 — 한 번에 목록 조회[/yellow]")
+        listing_window = 0
+
+    def _is_known(entry: dict[str, Any]) -> bool:
+        if known_video_ids and entry_video_id(entry) in known_video_ids:
+            return True
+        slug = slugify(entry.get("id") or entry.get("title") or "")
+        return existing_slugs is not None and slug in existing_slugs
+
+    def _list_entries() -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, Any] | None]:
         metadata_opts = dict(ydl_opts)
         metadata_opts["skip_download"] = True
         metadata_opts.pop("postprocessors", None)
+        if listing_mode != "full":
+            # Only ids and basic fields; each video is resolved when it is downloaded.
+            metadata_opts["extract_flat"] = "in_playlist"
         playlist_info: dict[str, Any] | None = None
+        listed_entries: list[dict[str, Any]] = []
         filtered_entries: list[dict[str, Any]] = []
-        skipped_existing = 0
+        if listing_window > 0:
+            playlist_info = _list_playlist_windows(
+                metadata_opts,
+                playlist_url,
+                listing_window,
+                listing_shards,
+                rate_limiter,
+                _check_cancel,
+                listing_counters,
+            )
+            entries = playlist_info.get("entries") if playlist_info else []
+            for entry in entries or []:
+                if not entry:
+                    continue
+                listed_entries.append(entry)
+                if not _is_known(entry):
+                    filtered_entries.append(entry)
+            return listed_entries, filtered_entries, playlist_info
         with YoutubeDL(metadata_opts) as meta_ydl:
+            listing_counters.append(_RequestCounter(meta_ydl, rate_limiter))
             _check_cancel()
-            info = meta_ydl.extract_info(playlist_url, download=False)
+            if incremental:
+                # Unprocessed, ``entries`` is a generator that fetches the playlist one
+                # continuation page at a time, so stopping early skips the other pages.
+                info = meta_ydl.extract_info(playlist_url, download=False, process=False)
+                if not isinstance(info, dict) or info.get("entries") is None:
+                    info = meta_ydl.extract_info(playlist_url, download=False)
+            else:
+                info = meta_ydl.extract_info(playlist_url, download=False)
             playlist_info = info if isinstance(info, dict) else None
             entries = playlist_info.get("entries") if playlist_info else []
+            known_run = 0
             if entries:
                 for entry in entries:
                     _check_cancel()
                     if not entry:
                         continue
-                    slug_source = entry.get("id") or entry.get("title") or ""
-                    slug = slugify(slug_source)
-                    if existing_slugs and slug in existing_slugs:
-                        skipped_existing += 1
+                    listed_entries.append(entry)
+                    if not _is_known(entry):
+                        known_run = 0
+                        filtered_entries.append(entry)
                         continue
-                    filtered_entries.append(entry)
+                    known_run += 1
+                    if incremental and known_run >= INCREMENTAL_KNOWN_RUN:
+                        console.print(
+                            f"[dim]증분 목록 조회 — {len(listed_entries)}개 항목에서 중단 "
+                            f"(이미 처리한 영상 {known_run}개 연속)[/dim]"
+                        )
+                        break
+            if incremental and playlist_info is not None:
+                playlist_info = {**playlist_info, "entries": listed_entries}
+        return listed_entries, filtered_entries, playlist_info
+
+    resumed_entries = journal.pending_entries() if journal is not None else []
+    if resumed_entries:
+        assert journal is not None
+        console.print(
+            f"[cyan]중단된 실행을 이어서 진행 — {len(resumed_entries)}개 항목 (목록 조회 생략)[/cyan]"
+        )
+        listed_entries = filtered_entries = resumed_entries
+        playlist_info = journal.playlist_info
+    else:
+        listed_entries, filtered_entries, playlist_info = await asyncio.to_thread(_list_entries)
+    skipped_existing = len(listed_entries) - len(filtered_entries)
+    fingerprint = listing_fingerprint(entry_video_id(entry) for entry in listed_entries)
+
+    previous = load_listing_state(download_dir)
+    if (
+        not resumed_entries
+        and listed_entries
+        and previous is not None
+        and previous.fingerprint == fingerprint
+        and ((existing_slugs is None and known_video_ids is None) or not filtered_entries)
+    ):
+        console.print(
+            f"[cyan]플레이리스트 변경 없음 — {len(listed_entries)}개 항목, 건너뜀[/cyan]"
+        )
+        return DownloadResult(
+            playlist_url,
+            0,
+            dry_run,
+            [],
+            playlist_info,
+            unchanged=True,
+            listing_count=len(listed_entries),
+            listing_throttled_seconds=sum(counter.throttled_seconds for counter in listing_counters),
+        )
+
+    playlist_id = playlist.id
+    if progress is not None:
+        progress.total = len(filtered_entries)
+    if journal is not None and not resumed_entries:
+        journal.start_run(filtered_entries, journal_target_stage, playlist_info)
+
+    index_key = media_key(audio_format, audio_policy)
+
+    def _record_status(episode: EpisodeRecord, status: str) -> None:
+        if archive is not None:
+            archive.record(playlist_id, episode.video_id, status, episode.audio_path)
+        if status != "transcoded":
+            return
+        if journal is not None:
+            journal.record(episode.video_id, "transcoded", episode=_episode_payload(episode))
+        if video_index is not None:
+            video_index.record(
+                episode.video_id,
+                index_key,
+                episode.audio_path,
+                episode.info_path,
+                episode.thumbnail_path,
+            )
+
+    async def _concurrency_changed(change: ConcurrencyChange) -> None:
+        message = change.message()
+        console.print(f"[cyan]{message}[/cyan]")
+        if progress is not None:
+            progress.concurrency = change.limit
+            progress.concurrency_reason = change.reason
+            message = progress.message()
+        if job_tracker:
+            await job_tracker.patch(progress_message=message)
+
+    async def _episode_ready(episode: EpisodeRecord) -> None:
+        if progress is not None:
+            progress.downloaded += 1
+        if on_episode is not None:
+            await on_episode(episode)
+
+    episodes: list[EpisodeRecord] = []
+    pending_entries: list[dict[str, Any]] = []
+    for entry in filtered_entries:
+        restored = _restore_journaled_episode(journal, entry) if journal else None
+        if restored is None:
+            pending_entries.append(entry)
+            continue
+        episodes.append(restored)
+        await _episode_ready(restored)
+    if processing_order == "newest" and len(pending_entries) > 1:
+        pending_entries = newest_first(
+            pending_entries, newest_at_top=_newest_on_top(pipeline_playlist.playlist)
+        )
+        console.print(f"[dim]최신 항목부터 처리 — {len(pending_entries)}개[/dim]")
 
-        episodes: list[EpisodeRecord] = []
-        if not filtered_entries:
-            return 0, episodes, playlist_info, skipped_existing
+    if video_index is not None and pending_entries and not dry_run:
+        linked, pending_entries = await asyncio.to_thread(
+            _link_indexed_entries, video_index, index_key, pending_entries, ydl_opts, audio_format
+        )
+        for episode in linked:
+            _record_status(episode, "transcoded")
+            episodes.append(episode)
+            await _episode_ready(episode)
+        if linked:
+            console.print(
+                f"[cyan]다른 플레이리스트에서 받은 오디오 {len(linked)}개 재사용 (다운로드 생략)[/cyan]"
+            )
 
+    if pending_entries:
         download_opts = dict(ydl_opts)
         download_opts.pop("skip_download", None)
-        with YoutubeDL(download_opts) as ydl:
-            for entry in filtered_entries:
-                _check_cancel()
-                entry_url = (
-                    entry.get("original_url")
-                    or entry.get("webpage_url")
-                    or entry.get("url")
-                )
-                info = entry
-                if entry_url and not dry_run:
-                    info = ydl.extract_info(entry_url, download=True)
-                base_filename = Path(ydl.prepare_filename(info))
-                audio_path = base_filename.with_suffix(f".{audio_format}")
-                info_path = base_filename.with_suffix(".info.json")
-                thumbnail_path = None
-                for ext in (".jpg", ".webp", ".png"):
-                    candidate = base_filename.with_suffix(ext)
-                    if candidate.exists():
-                        thumbnail_path = candidate
-                        break
-                thumbnails = info.get("thumbnails")
-                episodes.append(
-                    EpisodeRecord(
-                        video_id=info.get("id", ""),
-                        title=info.get("title", ""),
-                        description=info.get("description"),
-                        webpage_url=info.get("webpage_url"),
-                        upload_date=info.get("upload_date"),
-                        duration=info.get("duration"),
-                        audio_path=audio_path,
-                        info_path=info_path if info_path.exists() else None,
-                        thumbnail_path=thumbnail_path,
-                        thumbnail_url=info.get("thumbnail"),
-                        thumbnails=list(thumbnails) if thumbnails else None,
-                    )
-                )
-        episodes.sort(key=_episode_sort_key)
-        return len(episodes), episodes, playlist_info, skipped_existing
+        if transcode_pool is not None or audio_policy is not None:
+            # Fetch the raw bestaudio stream only; the transcode stage finishes it.
+            download_opts.pop("postprocessors", None)
+        if journal is not None:
+            # yt-dlp resumes from the .part file; the journal keeps the offset reached.
+            download_opts["continuedl"] = True
+            download_opts["progress_hooks"] = [_journal_progress_hook(journal)]
+        try:
+            episodes += await _download_entries(
+                pending_entries,
+                download_opts,
+                audio_format,
+                dry_run,
+                download_workers,
+                _check_cancel,
+                transcode_pool=transcode_pool,
+                record_status=_record_status,
+                on_ready=_episode_ready,
+                audio_policy=audio_policy,
+                rate_limiter=rate_limiter,
+                controller=controller,
+                on_concurrency_change=_concurrency_changed,
+                metadata_cache=metadata_cache,
+                admit_download=admit_download,
+            )
+        finally:
+            if metadata_cache is not None:
+                metadata_cache.flush()
+        if metadata_cache is not None and (metadata_cache.hits or metadata_cache.stale):
+            console.print(
+                f"[dim]메타데이터 캐시: 적중 {metadata_cache.hits}, "
+                f"만료 {metadata_cache.stale}, 없음 {metadata_cache.misses}[/dim]"
+            )
+    episodes.sort(key=_episode_sort_key)
 
-    downloaded, episodes, playlist_info, skipped_existing = await asyncio.to_thread(_run)
     if skipped_existing:
         console.print(
-            f"[yellow]{skipped_existing}개 에피소드는 Castopod에 이미 존재하여 건너뜀[/yellow]"
+            f"[yellow]{skipped_existing}개 에피소드는 이미 처리되어 건너뜀 (Castopod/로컬 아카이브)[/yellow]"
+        )
+    complete = len(episodes) == len(filtered_entries)
+    return DownloadResult(
+        playlist_url,
+        len(episodes),
+        dry_run,
+        episodes,
+        playlist_info,
+        listing_fingerprint=fingerprint if complete else None,
+        listing_count=len(listed_entries),
+        listing_throttled_seconds=sum(counter.throttled_seconds for counter in listing_counters),
+    )
+
+
+def _list_window(
+    metadata_opts: dict[str, Any],
+    playlist_url: str,
+    start: int,
+    size: int,
+    rate_limiter: RateLimiter | None,
+    check_cancel: Callable[[], None],
+    counters: list[_RequestCounter],
+) -> dict[str, Any]:
+    """List playlist items ``start`` to ``start + size - 1``, retrying only this window."""
+
+    window_opts = dict(metadata_opts)
+    window_opts["playlist_items"] = f"{start}-{start + size - 1}"
+    for attempt in range(LISTING_WINDOW_RETRIES + 1):
+        check_cancel()
+        with YoutubeDL(window_opts) as ydl:
+            counters.append(_RequestCounter(ydl, rate_limiter))
+            try:
+                info = ydl.extract_info(playlist_url, download=False)
+            except Exception as exc:  # yt-dlp raises DownloadError without ignoreerrors
+                console.print(f"[yellow]목록 구간 {window_opts['playlist_items']} 실패[/yellow] — {exc}")
+                info = None
+        if isinstance(info, dict):
+            return info
+        if attempt < LISTING_WINDOW_RETRIES:
+            console.print(
+                f"[yellow]목록 구간 {window_opts['playlist_items']} 재시도 "
+                f"({attempt + 1}/{LISTING_WINDOW_RETRIES})[/yellow]"
+            )
+    raise RuntimeError(f"playlist items {window_opts['playlist_items']} could not be listed")
+
+
+def _list_playlist_windows(
+    metadata_opts: dict[str, Any],
+    playlist_url: str,
+    window: int,
+    shards: int,
+    rate_limiter: RateLimiter | None,
+    check_cancel: Callable[[], None],
+    counters: list[_RequestCounter],
+) -> dict[str, Any] | None:
+    """List the playlist in ``window``-sized ranges, ``shards`` ranges at a time.
+
+    Windows are merged in playlist order; a window shorter than ``window`` marks the
+    end of the playlist, so later windows of the same batch are discarded.
+    """
+
+    shards = max(1, shards)
+    playlist_info: dict[str, Any] | None = None
+    entries: list[Any] = []
+    start = 1
+    with ThreadPoolExecutor(max_workers=shards) as executor:
+        while True:
+            starts = [start + index * window for index in range(shards)]
+            infos = list(
+                executor.map(
+                    lambda first: _list_window(
+                        metadata_opts,
+                        playlist_url,
+                        first,
+                        window,
+                        rate_limiter,
+                        check_cancel,
+                        counters,
+                    ),
+                    starts,
+                )
+            )
+            for info in infos:
+                window_entries = list(info.get("entries") or [])
+                if playlist_info is None:
+                    playlist_info = info
+                entries.extend(window_entries)
+                if len(window_entries) < window:
+                    playlist_info = {**playlist_info, "entries": entries}
+                    console.print(
+                        f"[dim]구간 목록 조회 — {len(entries)}개 항목 "
+                        f"({window}개 단위, 동시 {shards}구간)[/dim]"
+                    )
+                    return playlist_info
+            start = starts[-1] + window
+
+
+def _lists_newest_first(youtube_playlist_id: str) -> bool:
+    """Channel upload playlists (``UU…``) list the newest video first."""
+
+    return (playlist_feed_id(youtube_playlist_id) or "").startswith("UU")
+
+
+def _newest_on_top(playlist: Playlist) -> bool:
+    """Whether new videos appear at the top of the playlist rather than at its end."""
+
+    return (
+        _lists_newest_first(playlist.youtube_playlist_id)
+        or playlist.pipeline_options.get("newest_on_top") is True
+    )
+
+
+def _link_indexed_entries(
+    video_index: VideoIndex,
+    index_key: str,
+    entries: list[dict[str, Any]],
+    ydl_opts: dict[str, Any],
+    audio_format: str,
+) -> tuple[list[EpisodeRecord], list[dict[str, Any]]]:
+    """Link indexed audio, info JSON and thumbnail into this playlist's directory.
+
+    Returns the linked episodes and the entries that still have to be downloaded.
+    """
+
+    linked: list[EpisodeRecord] = []
+    remaining: list[dict[str, Any]] = []
+    with YoutubeDL(ydl_opts) as ydl:
+        for entry in entries:
+            media = video_index.lookup(entry_video_id(entry), index_key)
+            info = media.load_info() if media is not None else None
+            if media is None or info is None:
+                remaining.append(entry)
+                continue
+            base_filename = Path(ydl.prepare_filename(info))
+            audio_path = base_filename.with_suffix(media.audio_path.suffix)
+            try:
+                method = link_or_clone(media.audio_path, audio_path)
+                if media.info_path is not None:
+                    link_or_clone(media.info_path, base_filename.with_suffix(".info.json"))
+                if media.thumbnail_path is not None:
+                    link_or_clone(
+                        media.thumbnail_path, base_filename.with_suffix(media.thumbnail_path.suffix)
+                    )
+            except OSError as exc:
+                console.print(f"[yellow]공유 오디오 연결 실패 — {media.video_id}: {exc}[/yellow]")
+                remaining.append(entry)
+                continue
+            episode = _build_episode_record(ydl, info, audio_format)
+            episode.audio_path = audio_path
+            episode.request_count = 0
+            episode.shared_media = method
+            linked.append(episode)
+    return linked, remaining
+
+
+def _restore_journaled_episode(
+    journal: PlaylistJournal, entry: dict[str, Any]
+) -> EpisodeRecord | None:
+    state = journal.get(entry_video_id(entry))
+    if state is None or state.episode is None or stage_rank(state.stage) < stage_rank("transcoded"):
+        return None
+    episode = _episode_from_payload(state.episode)
+    if episode is None or not episode.audio_path.exists():
+        return None
+    return episode
+
+
+def _journal_progress_hook(journal: PlaylistJournal) -> Callable[[dict[str, Any]], None]:
+    def _hook(status: dict[str, Any]) -> None:
+        if status.get("status") != "downloading":
+            return
+        info = status.get("info_dict") or {}
+        journal.record_download_progress(
+            str(info.get("id") or ""), int(status.get("downloaded_bytes") or 0)
         )
-    return DownloadResult(playlist_url, downloaded, dry_run, episodes, playlist_info)
+
+    return _hook
+
+
+def create_episode_artwork(playlist_dir: Path, episode: EpisodeRecord) -> Path | None:
+    """Create the square cover for ``episode`` once and remember it on the record."""
+
+    if episode.square_cover_path is not None and episode.square_cover_path.exists():
+        return episode.square_cover_path
+    key = episode.video_id or episode.audio_path.stem
+    thumbnail_urls = gather_thumbnail_urls(episode.thumbnail_url, episode.thumbnails)
+    artwork_path = create_square_artwork(
+        playlist_dir / "metadata" / "artwork" / "episodes" / f"{key}.jpg",
+        local_source=episode.thumbnail_path,
+        remote_candidates=thumbnail_urls,
+    )
+    if artwork_path is not None:
+        episode.square_cover_path = artwork_path
+    elif episode.thumbnail_path or thumbnail_urls:
+        console.log(f"[yellow]경고:[/yellow] 에피소드 썸네일 생성 실패 — {key}")
+    return artwork_path
 
 
 def write_playlist_metadata(
@@ -288,7 +1326,6 @@ def write_playlist_metadata(
     metadata_dir.mkdir(parents=True, exist_ok=True)
 
     artwork_dir = metadata_dir / "artwork"
-    episodes_artwork_dir = artwork_dir / "episodes"
 
     playlist_cover_rel: str | None = None
     channel_cover_rel: str | None = None
@@ -311,35 +1348,14 @@ def write_playlist_metadata(
             f"[yellow]경고:[/yellow] 플레이리스트 표지 이미지를 생성하지 못했습니다 — {playlist_dir}"
         )
 
-    episode_lookup = {
-        (episode.video_id or episode.audio_path.stem): episode for episode in result.episodes
-    }
-
     playlist_meta = []
     for episode in result.episodes:
-        episode_thumbnail_urls = gather_thumbnail_urls(
-            episode.thumbnail_url,
-            episode.thumbnails,
-        )
-        episode_artwork_path = create_square_artwork(
-            episodes_artwork_dir / f"{episode.video_id or episode.audio_path.stem}.jpg",
-            local_source=episode.thumbnail_path,
-            remote_candidates=episode_thumbnail_urls,
-        )
+        episode_artwork_path = create_episode_artwork(playlist_dir, episode)
         episode_artwork_rel = (
             os.path.relpath(episode_artwork_path, playlist_dir)
             if episode_artwork_path is not None
             else None
         )
-        if episode_artwork_path is not None:
-            key = episode.video_id or episode.audio_path.stem
-            record = episode_lookup.get(key)
-            if record is not None:
-                record.square_cover_path = episode_artwork_path
-        if episode_artwork_rel is None and (episode.thumbnail_path or episode_thumbnail_urls):
-            console.log(
-                f"[yellow]경고:[/yellow] 에피소드 썸네일 생성 실패 — {episode.video_id or episode.audio_path.stem}"
-            )
         playlist_meta.append(
             {
                 "video_id": episode.video_id,
@@ -359,6 +1375,8 @@ def write_playlist_metadata(
                 else None,
                 "thumbnail_square": episode_artwork_rel,
                 "thumbnail_source": episode.thumbnail_url,
+                "audio_action": episode.audio_action,
+                "transcode_cpu_seconds": episode.transcode_cpu_seconds,
             }
         )
 
@@ -385,6 +1403,46 @@ def write_playlist_metadata(
         json.dump(payload, fp, ensure_ascii=False, indent=2)
 
 
+def _feed_precheck(
+    playlist: Playlist,
+    playlist_dir: Path,
+    settings: RunnerSettings,
+    known_video_ids: set[str] | None,
+    existing_slugs: set[str] | None,
+) -> FeedCheck | None:
+    """Compare the playlist feed with known videos; returns the check when nothing is new.
+
+    The feed shows only the first ~15 entries in playlist order, so it can only
+    vouch for playlists that add new videos at the top.
+    """
+
+    feed_id = playlist_feed_id(playlist.youtube_playlist_id)
+    if feed_id is None or not (known_video_ids or existing_slugs):
+        return None
+    if not _newest_on_top(playlist):
+        return None
+
+    def _is_known(video_id: str) -> bool:
+        if known_video_ids and video_id in known_video_ids:
+            return True
+        return existing_slugs is not None and slugify(video_id) in existing_slugs
+
+    try:
+        check, state = check_feed(
+            settings.feed_url.format(playlist_id=quote(feed_id)),
+            load_feed_state(playlist_dir),
+            _is_known,
+            rate_limiter=settings.rate_limiter,
+        )
+    except FeedError as exc:
+        console.print(f"[yellow]피드 확인 실패, 전체 목록 조회로 진행[/yellow] — {exc}")
+        return None
+    save_feed_state(playlist_dir, state)
+    if check.new_ids:
+        console.print(f"[cyan]피드에서 새 영상 {len(check.new_ids)}개 발견[/cyan]")
+    return check if check.unchanged else None
+
+
 async def process_playlist_entry(
     client: AutomationServiceClient,
     channel_entry: PipelineChannel,
@@ -396,7 +1454,10 @@ async def process_playlist_entry(
     allow_castopod_upload: bool,
     job_tracker: JobTracker | None = None,
     propagate_errors: bool = False,
+    settings: RunnerSettings | None = None,
 ) -> DownloadResult | None:
+    started = monotonic()
+    settings = settings or RunnerSettings()
     playlist = playlist_entry.playlist
     playlist_dir = download_root / channel_entry.channel.slug / (
         playlist.title or playlist.youtube_playlist_id
@@ -405,15 +1466,68 @@ async def process_playlist_entry(
     podcast_id: int | None = None
     existing_slugs: set[str] | None = None
     if castopod_client and (playlist.castopod_slug or playlist.castopod_uuid):
-        podcast_id = castopod_client.resolve_podcast_id(playlist)
+        podcast_id = await castopod_client.resolve_podcast_id(playlist)
         if podcast_id is not None:
-            existing_slugs = castopod_client.get_episode_slugs(podcast_id)
+            existing_slugs = await castopod_client.get_episode_slugs(podcast_id)
+
+    will_upload = (
+        not dry_run
+        and allow_castopod_upload
+        and castopod_client is not None
+        and bool(playlist.castopod_slug)
+        and bool(playlist.castopod_uuid)
+    )
+    known_video_ids: set[str] | None = None
+    if settings.archive is not None:
+        # Episodes bound for Castopod only count as done once they are uploaded.
+        statuses = ("uploaded",) if will_upload else ARCHIVE_STATUSES[1:]
+        known_video_ids = settings.archive.video_ids(playlist.id, statuses)
+    journal = PlaylistJournal(playlist_dir) if not dry_run else None
+    # Scheduled runs (no job) default to newest-first to cut time-to-publish.
+    processing_order = settings.processing_order_for(playlist, scheduled=job_tracker is None)
+    if will_upload and podcast_id is not None and journal is not None:
+        assert castopod_client is not None
+        await publish_journaled_uploads(
+            castopod_client, podcast_id, playlist, journal, settings.archive
+        )
+    feed_check: FeedCheck | None = None
+    if (
+        job_tracker is None
+        and settings.feed_precheck_for(playlist)
+        and not (journal is not None and journal.pending_entries())
+    ):
+        feed_check = await asyncio.to_thread(
+            _feed_precheck, playlist, playlist_dir, settings, known_video_ids, existing_slugs
+        )
 
     run_record = await client.create_run(
         playlist_id=playlist.id,
         status="in_progress",
         message=f"Starting download into {playlist_dir}",
     )
+    if feed_check is not None:
+        console.print(
+            f"[cyan]피드에 새 영상 없음 — {len(feed_check.video_ids)}개 항목"
+            f"{' (304)' if feed_check.not_modified else ''}, 건너뜀[/cyan]"
+        )
+        await client.update_run(
+            run_record.id,
+            status="finished",
+            message=f"No new videos in the feed ({len(feed_check.video_ids)} entries)",
+            finished_at=datetime.now(UTC),
+        )
+        return DownloadResult(
+            build_playlist_url(playlist.youtube_playlist_id),
+            0,
+            dry_run,
+            [],
+            None,
+            unchanged=True,
+            listing_count=len(feed_check.video_ids),
+            wall_seconds=monotonic() - started,
+            listing_throttled_seconds=feed_check.waited,
+            feed_skipped=True,
+        )
     run_tracker = RunTracker(client, run_record.id)
     try:
         if job_tracker:
@@ -430,20 +1544,103 @@ async def process_playlist_entry(
             progress_total=0,
             progress_completed=0,
         )
-        result = await download_playlist(
-            playlist_entry,
-            playlist_dir,
-            audio_format,
-            dry_run,
-            existing_slugs=existing_slugs,
-            job_tracker=job_tracker,
+        progress = StageProgress()
+        consumer: asyncio.Task[None] | None = None
+        episode_queue: asyncio.Queue[EpisodeRecord | None] = asyncio.Queue(
+            maxsize=max(1, settings.stream_queue_size)
         )
-        write_playlist_metadata(
+        if will_upload and settings.stream_uploads:
+            assert castopod_client is not None
+            if podcast_id is None:
+                podcast_id = await castopod_client.resolve_podcast_id(playlist)
+            if podcast_id is not None:
+                consumer = asyncio.create_task(
+                    stream_episodes_to_castopod(
+                        episode_queue,
+                        castopod_client,
+                        playlist,
+                        playlist_dir,
+                        podcast_id,
+                        progress,
+                        job_tracker=job_tracker,
+                        run_tracker=run_tracker,
+                        archive=settings.archive,
+                        journal=journal,
+                        deferred_publish=settings.deferred_publish_for(playlist),
+                    )
+                )
+
+        async def _on_episode(episode: EpisodeRecord) -> None:
+            assert consumer is not None
+            await _hand_off_episode(episode_queue, consumer, episode)
+
+        async def _on_storage_hold(reason: str) -> None:
+            console.print(f"[yellow]다운로드 대기[/yellow] — {reason}")
+            if job_tracker:
+                await job_tracker.patch(progress_message=f"저장 공간 대기: {reason}")
+            await run_tracker.patch(progress_message=f"저장 공간 대기: {reason}")
+
+        async def _admit_download() -> None:
+            assert settings.storage is not None
+            await settings.storage.admit(channel_entry.channel.slug, _on_storage_hold)
+
+        try:
+            result = await download_playlist(
+                playlist_entry,
+                playlist_dir,
+                audio_format,
+                dry_run,
+                existing_slugs=existing_slugs,
+                job_tracker=job_tracker,
+                download_workers=settings.download_workers_for(playlist),
+                transcode_pool=settings.transcode_pool,
+                listing_mode=settings.listing_mode_for(playlist),
+                archive=settings.archive,
+                known_video_ids=known_video_ids,
+                progress=progress,
+                on_episode=_on_episode if consumer is not None else None,
+                journal=journal,
+                journal_target_stage="published" if will_upload else "artwork",
+                audio_policy=settings.audio_policy_for(playlist),
+                rate_limiter=settings.rate_limiter,
+                controller=settings.download_controller_for(playlist),
+                metadata_cache=settings.metadata_cache_for(playlist_dir) if not dry_run else None,
+                admit_download=_admit_download if settings.storage is not None else None,
+                video_index=settings.video_index,
+                processing_order=processing_order,
+                listing_window=settings.listing_window_for(playlist),
+                listing_shards=settings.listing_shards,
+            )
+            if consumer is not None:
+                await _hand_off_episode(episode_queue, consumer, None)
+                await consumer
+        finally:
+            if consumer is not None and not consumer.done():
+                consumer.cancel()
+                await asyncio.gather(consumer, return_exceptions=True)
+        if result.unchanged:
+            message = f"No changes in {result.listing_count} listed entries"
+            if job_tracker:
+                await job_tracker.patch(progress_message="변경 없음", current_task=None)
+            await run_tracker.patch(progress_message="변경 없음", current_task=None)
+            await client.update_run(
+                run_record.id,
+                status="finished",
+                message=message,
+                finished_at=datetime.now(UTC),
+            )
+            result.wall_seconds = monotonic() - started
+            return result
+        await asyncio.to_thread(
+            write_playlist_metadata,
             playlist_dir,
             channel_entry,
             playlist_entry,
             result,
         )
+        if journal is not None:
+            for episode in result.episodes:
+                journal.record(episode.video_id, "artwork")
         message = (
             f"{'Simulated' if dry_run else 'Downloaded'} {result.downloaded} entries"
         )
@@ -461,20 +1658,32 @@ async def process_playlist_entry(
             current_task="metadata",
             progress_message="메타데이터 생성 중",
         )
-        if (
-            not dry_run
-            and allow_castopod_upload
-            and castopod_client is not None
-            and playlist.castopod_slug
-            and playlist.castopod_uuid
-        ):
-            await upload_playlist_to_castopod(
-                castopod_client,
-                playlist_entry,
-                result,
-                podcast_id=podcast_id,
-                job_tracker=job_tracker,
+        if consumer is not None:
+            if job_tracker:
+                await job_tracker.patch(
+                    progress_completed=progress.uploaded,
+                    progress_message="Castopod 업로드 완료",
+                    current_task=None,
+                )
+            await run_tracker.patch(
+                progress_total=progress.total,
+                progress_completed=progress.uploaded,
+                progress_message="Castopod 업로드 완료",
+                current_task=None,
+            )
+        elif will_upload:
+            assert castopod_client is not None
+            await upload_playlist_to_castopod(
+                castopod_client,
+                playlist_entry,
+                result,
+                podcast_id=podcast_id,
+                job_tracker=job_tracker,
                 run_tracker=run_tracker,
+                archive=settings.archive,
+                journal=journal,
+                processing_order=processing_order,
+                deferred_publish=settings.deferred_publish_for(playlist),
             )
             if job_tracker:
                 await job_tracker.patch(
@@ -500,12 +1709,24 @@ async def process_playlist_entry(
                 progress_message="다운로드 완료",
                 current_task=None,
             )
+        if not dry_run and result.listing_fingerprint:
+            save_listing_state(playlist_dir, result.listing_fingerprint, result.listing_count)
+        if journal is not None:
+            journal.complete_run()
+        if settings.storage is not None and not dry_run:
+            evicted = await settings.storage.enforce(channel_entry.channel.slug)
+            if evicted.episodes:
+                console.print(
+                    f"[cyan]업로드된 에피소드 {evicted.episodes}개 정리 — "
+                    f"{evicted.bytes / (1024 * 1024):.0f}MiB 확보[/cyan]"
+                )
         await client.update_run(
             run_record.id,
             status="finished",
             message=message,
             finished_at=datetime.now(UTC),
         )
+        result.wall_seconds = monotonic() - started
         return result
     except JobCancelledError:
         await client.update_run(
@@ -555,58 +1776,412 @@ async def upload_playlist_to_castopod(
     podcast_id: int | None = None,
     job_tracker: JobTracker | None = None,
     run_tracker: RunTracker | None = None,
+    archive: DownloadArchive | None = None,
+    journal: PlaylistJournal | None = None,
+    processing_order: str = "playlist",
+    deferred_publish: bool = False,
 ) -> None:
+    """Upload and publish ``result.episodes``, as many at once as the client allows.
+
+    With ``deferred_publish`` every episode is uploaded first and the uploads are
+    then published together by ``publish_castopod_episodes``.
+    """
+
     playlist = playlist_entry.playlist
     if podcast_id is None:
-        podcast_id = castopod_client.resolve_podcast_id(playlist)
+        podcast_id = await castopod_client.resolve_podcast_id(playlist)
     if podcast_id is None:
         console.print(
             f"[yellow]경고:[/yellow] Castopod podcast를 찾을 수 없습니다 — "
             f"{playlist.castopod_slug or playlist.castopod_uuid}"
         )
         return
-    for index, episode in enumerate(result.episodes, start=1):
+    episodes = result.episodes
+    if processing_order == "newest":
+        # ``result.episodes`` is chronological; publish the freshest uploads first.
+        episodes = list(reversed(episodes))
+    if job_tracker:
+        await job_tracker.ensure_active()
+    completed = 0
+
+    async def _upload(episode: EpisodeRecord) -> None:
+        nonlocal completed
+        if not await _upload_episode_to_castopod(
+            castopod_client,
+            podcast_id,
+            playlist,
+            episode,
+            archive,
+            journal,
+            publish=not deferred_publish,
+        ):
+            return
+        completed += 1
+        if job_tracker:
+            await job_tracker.patch(
+                progress_completed=completed,
+                progress_message=f"{completed}/{result.downloaded} 업로드 완료",
+            )
+        if run_tracker:
+            await run_tracker.patch(
+                progress_total=result.downloaded,
+                progress_completed=completed,
+                progress_message=f"{completed}/{result.downloaded} 업로드 완료",
+                current_task="castopod_upload",
+            )
+
+    pending = iter(episodes)
+
+    async def _worker() -> None:
+        # Workers take episodes in ``episodes`` order and check for a cancelled job
+        # before each one, so a cancel stops the queue instead of racing past it.
+        for episode in pending:
+            if job_tracker and job_tracker.cancel_event.is_set():
+                raise JobCancelledError
+            await _upload(episode)
+
+    workers = [
+        asyncio.create_task(_worker())
+        for _ in range(min(castopod_client.max_concurrency, len(episodes)))
+    ]
+    watcher = (
+        asyncio.create_task(_cancel_on_job_cancel(job_tracker, workers))
+        if job_tracker and workers
+        else None
+    )
+    try:
+        await asyncio.gather(*workers)
+    except BaseException as exc:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        current = asyncio.current_task()
+        if (
+            isinstance(exc, asyncio.CancelledError)
+            and job_tracker
+            and job_tracker.cancel_event.is_set()
+            and not (current is not None and current.cancelling())
+        ):
+            # The watcher cancelled the in-flight uploads, not our caller.
+            raise JobCancelledError from None
+        raise
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+    if deferred_publish:
         if job_tracker:
             await job_tracker.ensure_active()
-        audio_path = episode.audio_path
-        if not audio_path.exists():
+        await publish_castopod_episodes(
+            castopod_client, podcast_id, playlist, episodes, archive, journal, run_tracker
+        )
+
+
+def _episode_slug(episode: EpisodeRecord) -> str:
+    return slugify(episode.video_id or episode.audio_path.stem)
+
+
+def _castopod_retry_delay(exc: BaseException, attempt: int) -> float:
+    backoff = CASTOPOD_RETRY_BASE_SECONDS * 2 ** (attempt - 1)
+    return retry_after_seconds(exc) or min(BACKOFF_MAX_SECONDS, backoff)
+
+
+async def _cancel_on_job_cancel(job_tracker: JobTracker, tasks: list[asyncio.Task[None]]) -> None:
+    """Cancel ``tasks``, including uploads in flight, once the job is cancelled."""
+
+    while not job_tracker.cancel_event.is_set():
+        await asyncio.sleep(CANCEL_POLL_SECONDS)
+    for task in tasks:
+        task.cancel()
+
+
+async def _upload_episode_to_castopod(
+    castopod_client: CastopodClient,
+    podcast_id: int,
+    playlist: Playlist,
+    episode: EpisodeRecord,
+    archive: DownloadArchive | None = None,
+    journal: PlaylistJournal | None = None,
+    publish: bool = True,
+) -> bool:
+    """Upload ``episode``; without ``publish`` it is only created and its id kept.
+
+    Transient failures are retried with exponential backoff. Before each retry the
+    slug is looked up on the server, so audio whose POST went through is never sent
+    twice, and an episode that exists but is unpublished is only published.
+    """
+
+    audio_path = episode.audio_path
+    if not audio_path.exists():
+        console.print(
+            f"[yellow]경고:[/yellow] 오디오 파일이 없어 업로드를 건너뜁니다 — {audio_path}"
+        )
+        return False
+    slug = _episode_slug(episode)
+    title = episode.title or audio_path.stem
+    publication_dt = _episode_publication_datetime(episode)
+    stats = UploadStats()
+    state = journal.get(episode.video_id) if journal is not None else None
+    if state is not None and state.stage == "uploaded" and state.castopod_episode_id is not None:
+        # Created by an earlier attempt that stopped before publishing.
+        episode.castopod_episode_id = state.castopod_episode_id
+    uploaded = False
+    for attempt in range(1, CASTOPOD_ATTEMPTS + 1):
+        try:
+            if attempt > 1:
+                remote = await castopod_client.find_episode(podcast_id, slug)
+                if remote is not None:
+                    if episode_is_published(remote):
+                        episode.castopod_episode_id = None
+                        break
+                    episode.castopod_episode_id = int(remote["id"])
+            if episode.castopod_episode_id is None:
+                # Create and publish separately so a failed publish keeps the id.
+                response = await castopod_client.create_episode(
+                    podcast_id,
+                    slug,
+                    title,
+                    episode.description,
+                    audio_path,
+                    episode.square_cover_path,
+                    stats=stats,
+                )
+                if response is None:
+                    # The slug already exists; publish it if an earlier run did not.
+                    remote = await castopod_client.find_episode(podcast_id, slug)
+                    if remote is not None and not episode_is_published(remote):
+                        episode.castopod_episode_id = int(remote["id"])
+                else:
+                    uploaded = True
+                    episode.castopod_episode_id = int(response["id"])
+            if publish and episode.castopod_episode_id is not None:
+                await castopod_client.publish_episode(episode.castopod_episode_id, publication_dt)
+                episode.castopod_episode_id = None
+            break
+        except Exception as exc:
+            if attempt == CASTOPOD_ATTEMPTS or not is_retryable(exc):
+                console.print(
+                    f"[red]Castopod 업로드 실패[/red] — {title} ({slug}): {exc}"
+                )
+                if journal is not None and episode.castopod_episode_id is not None:
+                    journal.record(
+                        episode.video_id,
+                        "uploaded",
+                        castopod_episode_id=episode.castopod_episode_id,
+                    )
+                return False
+            delay = _castopod_retry_delay(exc, attempt)
             console.print(
-                f"[yellow]경고:[/yellow] 오디오 파일이 없어 업로드를 건너뜁니다 — {audio_path}"
+                f"[yellow]Castopod 요청 실패, {delay:.0f}초 후 재시도 "
+                f"({attempt}/{CASTOPOD_ATTEMPTS - 1})[/yellow] — {title} ({slug}): {exc}"
             )
-            continue
-        slug = slugify(episode.video_id or audio_path.stem)
-        title = episode.title or audio_path.stem
-        publication_dt = _episode_publication_datetime(episode)
+            await asyncio.sleep(delay)
+    if uploaded:
+        episode.upload_stats = stats
+        console.print(
+            f"[green]Castopod 업로드 완료[/green] — {title} ({slug}) · {stats.message()}"
+        )
+    if episode.castopod_episode_id is None:
+        # Published now or earlier; only then may the archive treat it as done.
+        if archive is not None:
+            archive.record(playlist.id, episode.video_id, "uploaded")
+        if journal is not None:
+            journal.record(episode.video_id, "published")
+    elif journal is not None:
+        journal.record(
+            episode.video_id, "uploaded", castopod_episode_id=episode.castopod_episode_id
+        )
+    return True
+
+
+async def publish_castopod_episodes(
+    castopod_client: CastopodClient,
+    podcast_id: int,
+    playlist: Playlist,
+    episodes: list[EpisodeRecord],
+    archive: DownloadArchive | None = None,
+    journal: PlaylistJournal | None = None,
+    run_tracker: RunTracker | None = None,
+) -> int:
+    """Publish the uploaded-but-unpublished ``episodes`` in one concurrent batch.
+
+    Publishes start in publication-datetime order (undated episodes last) and queue
+    on the client's upload slots. A failed publish is retried with backoff, without
+    sending the audio again, unless the server already shows the episode published.
+    Returns the number of episodes published.
+    """
+
+    pending = [episode for episode in episodes if episode.castopod_episode_id is not None]
+    if not pending:
+        return 0
+    pending.sort(
+        key=lambda episode: _episode_publication_datetime(episode) or datetime.max
+    )
+
+    async def _publish(episode: EpisodeRecord) -> bool:
+        assert episode.castopod_episode_id is not None
+        for attempt in range(1, CASTOPOD_ATTEMPTS + 1):
+            try:
+                if attempt > 1:
+                    remote = await castopod_client.find_episode(podcast_id, _episode_slug(episode))
+                    if remote is not None and episode_is_published(remote):
+                        break
+                await castopod_client.publish_episode(
+                    episode.castopod_episode_id, _episode_publication_datetime(episode)
+                )
+                break
+            except Exception as exc:
+                if attempt == CASTOPOD_ATTEMPTS or not is_retryable(exc):
+                    console.print(f"[red]Castopod 발행 실패[/red] — {episode.title}: {exc}")
+                    return False
+                await asyncio.sleep(_castopod_retry_delay(exc, attempt))
+        episode.castopod_episode_id = None
+        if archive is not None:
+            archive.record(playlist.id, episode.video_id, "uploaded")
+        if journal is not None:
+            journal.record(episode.video_id, "published")
+        return True
+
+    published = sum(await asyncio.gather(*(_publish(episode) for episode in pending)))
+    console.print(f"[green]Castopod 일괄 발행 완료[/green] — {published}/{len(pending)}")
+    if run_tracker:
+        await run_tracker.patch(
+            progress_message=f"{published}/{len(pending)} 발행 완료",
+            current_task="castopod_publish",
+        )
+    return published
+
+
+async def publish_journaled_uploads(
+    castopod_client: CastopodClient,
+    podcast_id: int,
+    playlist: Playlist,
+    journal: PlaylistJournal,
+    archive: DownloadArchive | None = None,
+) -> int:
+    """Publish episodes an earlier run created on Castopod but could not publish.
+
+    Their slugs are already on the server, so the listing no longer offers them
+    for upload; the journal keeps their Castopod ids until they are published.
+    """
+
+    episodes: list[EpisodeRecord] = []
+    for state in journal.unpublished_uploads():
+        episode = _episode_from_payload(state.episode or {}) or EpisodeRecord(
+            state.video_id,
+            state.entry.get("title") or state.video_id,
+            None,
+            None,
+            state.entry.get("upload_date"),
+            None,
+            Path(state.video_id),
+            None,
+            None,
+            None,
+            None,
+        )
+        episode.castopod_episode_id = state.castopod_episode_id
+        episodes.append(episode)
+    if not episodes:
+        return 0
+    console.print(f"[cyan]지난 실행에서 발행하지 못한 에피소드 {len(episodes)}개 발행[/cyan]")
+    return await publish_castopod_episodes(
+        castopod_client, podcast_id, playlist, episodes, archive, journal
+    )
+
+
+async def _hand_off_episode(
+    queue: asyncio.Queue[EpisodeRecord | None],
+    consumer: asyncio.Task[None],
+    episode: EpisodeRecord | None,
+) -> None:
+    """Put ``episode`` on the bounded queue unless the consumer has already stopped."""
+
+    put = asyncio.ensure_future(queue.put(episode))
+    await asyncio.wait({put, consumer}, return_when=asyncio.FIRST_COMPLETED)
+    if not put.done():
+        put.cancel()
+        consumer.result()
+        raise RuntimeError("Castopod upload stage stopped before the download finished")
+
+
+async def stream_episodes_to_castopod(
+    queue: asyncio.Queue[EpisodeRecord | None],
+    castopod_client: CastopodClient,
+    playlist: Playlist,
+    playlist_dir: Path,
+    podcast_id: int,
+    progress: StageProgress,
+    job_tracker: JobTracker | None = None,
+    run_tracker: RunTracker | None = None,
+    archive: DownloadArchive | None = None,
+    journal: PlaylistJournal | None = None,
+    deferred_publish: bool = False,
+) -> None:
+    """Run artwork and Castopod upload/publish for each episode as it arrives.
+
+    Artwork is made one episode at a time; up to the client's ``max_concurrency``
+    uploads run behind it, and the queue stops being drained while they are busy.
+    With ``deferred_publish`` the uploads are published together once the queue ends.
+    """
+
+    slots = asyncio.Semaphore(castopod_client.max_concurrency)
+    uploads: list[asyncio.Task[None]] = []
+    uploaded: list[EpisodeRecord] = []
+
+    async def _upload(episode: EpisodeRecord) -> None:
         try:
-            response = castopod_client.upload_episode(
+            if await _upload_episode_to_castopod(
+                castopod_client,
                 podcast_id,
-                slug,
-                title,
-                episode.description,
-                audio_path,
-                episode.square_cover_path,
-                publication_dt,
-            )
-            if response is not None:
-                console.print(
-                    f"[green]Castopod 업로드 완료[/green] — {title} ({slug})"
-                )
+                playlist,
+                episode,
+                archive,
+                journal,
+                publish=not deferred_publish,
+            ):
+                progress.uploaded += 1
+                uploaded.append(episode)
+        finally:
+            slots.release()
+        message = progress.message()
+        if job_tracker:
+            await job_tracker.patch(
+                progress_total=progress.total,
+                progress_completed=progress.uploaded,
+                current_task="castopod_upload",
+                progress_message=message,
+            )
+        if run_tracker:
+            await run_tracker.patch(
+                progress_total=progress.total,
+                progress_completed=progress.uploaded,
+                current_task="castopod_upload",
+                progress_message=message,
+            )
+
+    try:
+        while True:
+            episode = await queue.get()
+            if episode is None:
+                break
             if job_tracker:
-                await job_tracker.patch(
-                    progress_completed=index,
-                    progress_message=f"{index}/{result.downloaded} 업로드 완료",
-                )
-            if run_tracker:
-                await run_tracker.patch(
-                    progress_total=result.downloaded,
-                    progress_completed=index,
-                    progress_message=f"{index}/{result.downloaded} 업로드 완료",
-                    current_task="castopod_upload",
-                )
-        except Exception as exc:
-            console.print(
-                f"[red]Castopod 업로드 실패[/red] — {title} ({slug}): {exc}"
+                await job_tracker.ensure_active()
+            await asyncio.to_thread(create_episode_artwork, playlist_dir, episode)
+            progress.artwork += 1
+            if journal is not None:
+                journal.record(episode.video_id, "artwork")
+            await slots.acquire()
+            uploads.append(asyncio.create_task(_upload(episode)))
+        await asyncio.gather(*uploads)
+        if deferred_publish:
+            await publish_castopod_episodes(
+                castopod_client, podcast_id, playlist, uploaded, archive, journal, run_tracker
             )
+    except BaseException:
+        for task in uploads:
+            task.cancel()
+        await asyncio.gather(*uploads, return_exceptions=True)
+        raise
 
 
 async def process_job_queue(
@@ -616,82 +2191,146 @@ async def process_job_queue(
     audio_format: str,
     dry_run: bool,
     castopod_client: CastopodClient | None,
+    settings: RunnerSettings | None = None,
 ) -> list[DownloadResult]:
-    results: list[DownloadResult] = []
+    """Run queued jobs in up to ``settings.job_slots`` concurrent slots.
+
+    Jobs of the same playlist wait for each other in creation order and only take
+    a slot once the previous one finished, so a long backfill never shares its
+    playlist directory with another job while smaller jobs keep flowing.
+    """
+
+    settings = settings or RunnerSettings()
     jobs = await client.fetch_jobs()
     if not jobs:
-        return results
+        return []
 
     playlist_lookup: dict[int, tuple[PipelineChannel, PipelinePlaylist]] = {}
     for channel_entry in config.channels:
         for playlist_entry in channel_entry.playlists:
             playlist_lookup[playlist_entry.playlist.id] = (channel_entry, playlist_entry)
 
-    for job in jobs:
-        if job.status not in {"queued", "cancelling"}:
-            continue
+    slots = asyncio.Semaphore(max(1, settings.job_slots))
+    playlist_locks: dict[int, asyncio.Lock] = {}
+
+    async def _run(job: Job) -> DownloadResult | None:
         mapping = playlist_lookup.get(job.playlist_id)
         if mapping is None:
             await client.update_job(job.id, status="failed", progress_message="Playlist not active")
             console.print(
                 f"[red]작업 실패[/red] — playlist {job.playlist_id} not active"
             )
-            continue
-        console.rule(f"작업 실행: Job #{job.id}", style="magenta")
-        tracker = JobTracker(client, job)
-        if job.status == "cancelling":
-            await tracker.patch(status="cancelled", progress_message="사용자 취소", current_task=None)
-            continue
-        await tracker.patch(
-            status="in_progress",
-            progress_total=0,
-            progress_completed=0,
-            current_task="downloading",
-            progress_message="대기 중",
-        )
-        channel_entry, playlist_entry = mapping
-        await tracker.start_watch()
-        try:
-            result = await process_playlist_entry(
+            return None
+        lock = playlist_locks.setdefault(job.playlist_id, asyncio.Lock())
+        async with lock, slots:
+            return await _process_job(
                 client,
-                channel_entry,
-                playlist_entry,
+                job,
+                mapping,
                 download_root,
                 audio_format,
                 dry_run,
                 castopod_client,
-                allow_castopod_upload=job.should_castopod_upload,
-                job_tracker=tracker,
-                propagate_errors=True,
-            )
-            if result is None:
-                continue
-            await tracker.patch(
-                status="finished",
-                progress_total=result.downloaded,
-                progress_completed=result.downloaded,
-                current_task=None,
-                progress_message="완료",
+                settings,
             )
-            results.append(result)
-        except JobCancelledError:
-            await tracker.patch(
-                status="cancelled",
-                current_task=None,
-                progress_message="사용자 취소",
-            )
-            console.print(f"[yellow]작업 취소[/yellow] — Job #{job.id}")
-        except Exception as exc:  # pragma: no cover - runtime logging
-            await tracker.patch(
-                status="failed",
-                progress_message=str(exc),
-                current_task=None,
-            )
-            console.print(f"[red]작업 실패[/red] — Job #{job.id}: {exc}")
-        finally:
-            await tracker.stop_watch()
+
+    runnable = [job for job in jobs if job.status in {"queued", "cancelling"}]
+    # Let every job finish before returning, even when one of them fails, so none
+    # outlives the archive and clients that ``async_main`` closes afterwards.
+    outcomes = await asyncio.gather(*(_run(job) for job in runnable), return_exceptions=True)
+    return _successful_results(outcomes, [f"Job #{job.id}" for job in runnable])
+
+
+def _successful_results(
+    outcomes: list[DownloadResult | BaseException | None], labels: list[str]
+) -> list[DownloadResult]:
+    """Results of runs gathered with ``return_exceptions``; failures are logged.
+
+    Anything that is not an ``Exception`` (cancellation, KeyboardInterrupt) is
+    raised again once every run has finished.
+    """
+
+    results: list[DownloadResult] = []
+    fatal: BaseException | None = None
+    for label, outcome in zip(labels, outcomes):
+        if isinstance(outcome, Exception):
+            console.print(f"[red]실행 실패[/red] — {label}: {outcome}")
+        elif isinstance(outcome, BaseException):
+            fatal = fatal or outcome
+        elif outcome is not None:
+            results.append(outcome)
+    if fatal is not None:
+        raise fatal
     return results
 
+
+async def _process_job(
+    client: AutomationServiceClient,
+    job: Job,
+    mapping: tuple[PipelineChannel, PipelinePlaylist],
+    download_root: Path,
+    audio_format: str,
+    dry_run: bool,
+    castopod_client: CastopodClient | None,
+    settings: RunnerSettings,
+) -> DownloadResult | None:
+    console.rule(f"작업 실행: Job #{job.id}", style="magenta")
+    tracker = JobTracker(client, job)
+    if job.status == "cancelling":
+        await tracker.patch(status="cancelled", progress_message="사용자 취소", current_task=None)
+        return None
+    await tracker.patch(
+        status="in_progress",
+        progress_total=0,
+        progress_completed=0,
+        current_task="downloading",
+        progress_message="대기 중",
+    )
+    channel_entry, playlist_entry = mapping
+    await tracker.start_watch()
+    try:
+        result = await process_playlist_entry(
+            client,
+            channel_entry,
+            playlist_entry,
+            download_root,
+            audio_format,
+            dry_run,
+            castopod_client,
+            allow_castopod_upload=job.should_castopod_upload,
+            job_tracker=tracker,
+            propagate_errors=True,
+            settings=settings,
+        )
+        if result is None:
+            return None
+        await tracker.patch(
+            status="finished",
+            progress_total=result.downloaded,
+            progress_completed=result.downloaded,
+            current_task=None,
+            progress_message="완료",
+        )
+        return result
+    except JobCancelledError:
+        await tracker.patch(
+            status="cancelled",
+            current_task=None,
+            progress_message="사용자 취소",
+        )
+        console.print(f"[yellow]작업 취소[/yellow] — Job #{job.id}")
+    except Exception as exc:  # pragma: no cover - runtime logging
+        await tracker.patch(
+            status="failed",
+            progress_message=str(exc),
+            current_task=None,
+        )
+        console.print(f"[red]작업 실패[/red] — Job #{job.id}: {exc}")
+    finally:
+        await tracker.stop_watch()
+    return None
+
+
 async def process_configuration(
     client: AutomationServiceClient,
     config: PipelineConfiguration,
@@ -699,17 +2338,28 @@ async def process_configuration(
     audio_format: str,
     dry_run: bool,
     castopod_client: CastopodClient | None,
+    settings: RunnerSettings | None = None,
 ) -> list[DownloadResult]:
-    results: list[DownloadResult] = []
+    """Run every configured playlist, several at once within the settings' caps.
 
-    for channel_entry in config.channels:
-        channel = channel_entry.channel
-        for playlist_entry in channel_entry.playlists:
+    A playlist first takes a slot of its channel, then one of the run-wide limit,
+    so a channel waiting on its own cap never holds back other channels.
+    """
+
+    settings = settings or RunnerSettings()
+    overall_limit = asyncio.Semaphore(max(1, settings.playlist_concurrency))
+
+    async def _run(
+        channel_entry: PipelineChannel,
+        playlist_entry: PipelinePlaylist,
+        channel_limit: asyncio.Semaphore,
+    ) -> DownloadResult | None:
+        async with channel_limit, overall_limit:
             console.rule(
-                f"{channel.title}: {playlist_entry.playlist.title or playlist_entry.playlist.youtube_playlist_id}",
+                f"{channel_entry.channel.title}: {playlist_entry.playlist.title or playlist_entry.playlist.youtube_playlist_id}",
                 style="cyan",
             )
-            result = await process_playlist_entry(
+            return await process_playlist_entry(
                 client,
                 channel_entry,
                 playlist_entry,
@@ -718,10 +2368,56 @@ async def process_configuration(
                 dry_run,
                 castopod_client,
                 allow_castopod_upload=True,
+                settings=settings,
             )
-            if result is not None:
-                results.append(result)
-    return results
+
+    runs = []
+    labels = []
+    for channel_entry in config.channels:
+        channel_limit = asyncio.Semaphore(settings.channel_concurrency_limit)
+        for playlist_entry in channel_entry.playlists:
+            runs.append(_run(channel_entry, playlist_entry, channel_limit))
+            playlist = playlist_entry.playlist
+            labels.append(
+                f"{channel_entry.channel.slug}/{playlist.title or playlist.youtube_playlist_id}"
+            )
+    # A playlist failing outside process_playlist_entry's own error handling must
+    # not return while the others still use the shared archive and clients.
+    outcomes = await asyncio.gather(*runs, return_exceptions=True)
+    return _successful_results(outcomes, labels)
+
+
+def print_plan(plans: list[PlaylistPlan], output: str | None = None) -> dict[str, Any]:
+    table = Table(title="Pipeline plan")
+    table.add_column("Playlist")
+    table.add_column("Listed")
+    table.add_column("New")
+    table.add_column("Present")
+    table.add_column("Est. size")
+    table.add_column("Upload")
+    table.add_column("Time (s)")
+    for plan in plans:
+        table.add_row(
+            f"{plan.channel}/{plan.title}",
+            str(plan.listed) if plan.error is None else f"[red]오류: {plan.error}[/red]",
+            str(len(plan.new_entries)),
+            str(len(plan.present_ids)),
+            f"{plan.estimated_bytes / (1024 * 1024):.0f}MiB",
+            "yes" if plan.upload else "no",
+            f"{plan.elapsed_seconds:.1f}",
+        )
+    console.print(table)
+    report = plan_report(plans)
+    report["generated_at"] = datetime.now(UTC).isoformat()
+    if output and output != "-":
+        path = Path(output).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as fp:
+            json.dump(report, fp, ensure_ascii=False, indent=2)
+        console.print(f"Plan JSON  : {path}")
+    else:
+        console.print_json(data=report)
+    return report
 
 
 async def async_main(argv: Iterable[str] | None = None) -> int:
@@ -741,6 +2437,183 @@ async def async_main(argv: Iterable[str] | None = None) -> int:
         action="store_true",
         help="Do not download files, only simulate",
     )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Only list playlists and report new/present entries as JSON; nothing is downloaded",
+    )
+    parser.add_argument(
+        "--plan-output",
+        default=os.getenv("PIPELINE_PLAN_OUTPUT"),
+        help="Write the --plan JSON to this file instead of printing it",
+    )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=env_int("PIPELINE_DOWNLOAD_WORKERS", DEFAULT_DOWNLOAD_WORKERS),
+        help="Concurrent episode downloads per playlist (default: env PIPELINE_DOWNLOAD_WORKERS or 1)",
+    )
+    parser.add_argument(
+        "--adaptive-downloads",
+        action=argparse.BooleanOptionalAction,
+        default=env_flag("PIPELINE_ADAPTIVE_DOWNLOADS", False),
+        help="Tune concurrent downloads from observed throughput, starting at --download-workers (default: off)",
+    )
+    parser.add_argument(
+        "--max-download-workers",
+        type=int,
+        default=env_int("PIPELINE_MAX_DOWNLOAD_WORKERS", DEFAULT_MAX_DOWNLOAD_WORKERS),
+        help=f"Upper bound for --adaptive-downloads (default: {DEFAULT_MAX_DOWNLOAD_WORKERS})",
+    )
+    parser.add_argument(
+        "--playlist-concurrency",
+        type=int,
+        default=env_int("PIPELINE_PLAYLIST_CONCURRENCY", DEFAULT_PLAYLIST_CONCURRENCY),
+        help="Configured playlists processed at once (default: env PIPELINE_PLAYLIST_CONCURRENCY or 1)",
+    )
+    parser.add_argument(
+        "--job-slots",
+        type=int,
+        default=env_int("PIPELINE_JOB_SLOTS", DEFAULT_JOB_SLOTS),
+        help="Queued jobs processed at once; jobs of one playlist never overlap (default: 1)",
+    )
+    parser.add_argument(
+        "--channel-concurrency",
+        type=int,
+        default=env_int("PIPELINE_CHANNEL_CONCURRENCY", 0),
+        help="Playlists of one channel processed at once; 0 uses --playlist-concurrency (default: 0)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=env_float("PIPELINE_RATE_LIMIT", 0.0),
+        help="YouTube requests per second shared by all workers; 0 = unlimited (default: 0)",
+    )
+    parser.add_argument(
+        "--rate-burst",
+        type=int,
+        default=env_int("PIPELINE_RATE_BURST", DEFAULT_BURST),
+        help=f"Requests allowed in a burst above --rate-limit (default: {DEFAULT_BURST})",
+    )
+    parser.add_argument(
+        "--listing-mode",
+        choices=LISTING_MODES,
+        default=_choice(os.getenv("PIPELINE_LISTING_MODE"), LISTING_MODES, "flat"),
+        help="flat: ids only, resolved per download; full: resolve every entry up front; "
+        "incremental: flat, but stop at a run of known videos on newest-first playlists (default: flat)",
+    )
+    parser.add_argument(
+        "--listing-window",
+        type=int,
+        default=env_int("PIPELINE_LISTING_WINDOW", 0),
+        help="List playlists in playlist_items windows of this many entries, with --listing-mode full "
+        "only; 0 = one request (default: 0)",
+    )
+    parser.add_argument(
+        "--listing-shards",
+        type=int,
+        default=env_int("PIPELINE_LISTING_SHARDS", DEFAULT_LISTING_SHARDS),
+        help=f"Listing windows fetched concurrently (default: {DEFAULT_LISTING_SHARDS})",
+    )
+    parser.add_argument(
+        "--feed-precheck",
+        action=argparse.BooleanOptionalAction,
+        default=env_flag("PIPELINE_FEED_PRECHECK", True),
+        help="Check the playlist's Atom feed before scheduled runs and skip yt-dlp "
+        "when no video is new (default: on)",
+    )
+    parser.add_argument(
+        "--feed-url",
+        default=os.getenv("PIPELINE_FEED_URL", YOUTUBE_FEED_URL),
+        help="Feed URL template with {playlist_id} (default: YouTube playlist feed)",
+    )
+    parser.add_argument(
+        "--processing-order",
+        choices=("auto", *PROCESSING_ORDERS),
+        default=_choice(
+            os.getenv("PIPELINE_PROCESSING_ORDER"), ("auto", *PROCESSING_ORDERS), "auto"
+        ),
+        help="newest: download and upload the most recent videos first; "
+        "auto: newest for scheduled runs, playlist order for jobs (default: auto)",
+    )
+    parser.add_argument(
+        "--metadata-ttl",
+        type=float,
+        default=env_float("PIPELINE_METADATA_TTL_HOURS", DEFAULT_METADATA_TTL_HOURS),
+        help="Hours a cached .info.json replaces live extraction; 0 disables (default: 24)",
+    )
+    parser.add_argument(
+        "--archive",
+        action=argparse.BooleanOptionalAction,
+        default=env_flag("PIPELINE_ARCHIVE", True),
+        help="Skip videos recorded in <download-dir>/.pipeline-archive.sqlite3 (default: on)",
+    )
+    parser.add_argument(
+        "--video-index",
+        action=argparse.BooleanOptionalAction,
+        default=env_flag("PIPELINE_VIDEO_INDEX", True),
+        help="Link audio already downloaded for another playlist instead of downloading it again (default: on)",
+    )
+    parser.add_argument(
+        "--disk-high-water",
+        type=float,
+        default=env_float("PIPELINE_DISK_HIGH_WATER", 0.0),
+        help="Disk usage percent above which downloads wait and uploaded episodes are evicted; 0 = off",
+    )
+    parser.add_argument(
+        "--min-retention-hours",
+        type=float,
+        default=env_float("PIPELINE_MIN_RETENTION_HOURS", DEFAULT_MIN_RETENTION_HOURS),
+        help="Keep uploaded episodes at least this long before eviction (default: 24)",
+    )
+    parser.add_argument(
+        "--channel-quota",
+        action="append",
+        default=[os.getenv("PIPELINE_CHANNEL_QUOTAS", "")],
+        metavar="SLUG=SIZE",
+        help="Per-channel storage quota such as news=20G; '*' sets the default (repeatable)",
+    )
+    parser.add_argument(
+        "--stream-uploads",
+        action=argparse.BooleanOptionalAction,
+        default=env_flag("PIPELINE_STREAM_UPLOADS", False),
+        help="Upload each episode to Castopod as soon as it is downloaded (default: off)",
+    )
+    parser.add_argument(
+        "--deferred-publish",
+        action=argparse.BooleanOptionalAction,
+        default=env_flag("PIPELINE_DEFERRED_PUBLISH", False),
+        help="Upload all new episodes first, then publish them in one batch (default: off)",
+    )
+    parser.add_argument(
+        "--castopod-catalog-ttl",
+        type=float,
+        default=env_float("PIPELINE_CASTOPOD_CATALOG_TTL_MINUTES", DEFAULT_CATALOG_TTL_MINUTES),
+        help="Minutes the cached Castopod podcast/episode catalog is used without a refresh; 0 disables (default: 30)",
+    )
+    parser.add_argument(
+        "--transcode-mode",
+        choices=TRANSCODE_MODES,
+        default=_choice(os.getenv("PIPELINE_TRANSCODE_MODE"), TRANSCODE_MODES, "inline"),
+        help="inline: yt-dlp postprocessor, pool: separate ffmpeg process pool (default: inline)",
+    )
+    parser.add_argument(
+        "--passthrough-codecs",
+        default=os.getenv("PIPELINE_PASSTHROUGH_CODECS", ""),
+        help="Comma-separated source codecs kept without re-encoding, e.g. aac,opus (default: none)",
+    )
+    parser.add_argument(
+        "--passthrough-min-abr",
+        type=float,
+        default=env_float("PIPELINE_PASSTHROUGH_MIN_ABR", 96.0),
+        help="Minimum source bitrate in kbps for passthrough (default: 96)",
+    )
+    parser.add_argument(
+        "--transcode-workers",
+        type=int,
+        default=env_int("PIPELINE_TRANSCODE_WORKERS", os.cpu_count() or 1),
+        help="ffmpeg processes for --transcode-mode pool (default: CPU count)",
+    )
     skip_config_default = env_flag("PIPELINE_SKIP_CONFIGURATION", False)
     parser.add_argument(
         "--skip-configuration",
@@ -764,56 +2637,172 @@ async def async_main(argv: Iterable[str] | None = None) -> int:
     console.print(f"Download dir: {download_root}")
     console.print(f"Audio format: {args.audio_format}")
     console.print(f"Dry run    : {args.dry_run}")
+    if args.plan:
+        console.print("Mode       : plan")
+    console.print(
+        f"Workers    : {args.download_workers}"
+        + (f" (adaptive ≤ {args.max_download_workers})" if args.adaptive_downloads else "")
+    )
+    console.print(f"Playlists  : {args.playlist_concurrency}")
+    console.print(
+        f"Rate limit : {args.rate_limit or '∞'} req/s (burst {args.rate_burst})"
+    )
+    console.print(f"Transcode  : {args.transcode_mode}")
+
+    settings = RunnerSettings(
+        download_workers=max(1, args.download_workers),
+        adaptive_downloads=args.adaptive_downloads,
+        max_download_workers=max(1, args.max_download_workers),
+        listing_mode=args.listing_mode,
+        processing_order=args.processing_order,
+        listing_window=max(0, args.listing_window),
+        listing_shards=max(1, args.listing_shards),
+        feed_precheck=args.feed_precheck,
+        feed_url=args.feed_url,
+        metadata_ttl_hours=max(0.0, args.metadata_ttl),
+        stream_uploads=args.stream_uploads,
+        deferred_publish=args.deferred_publish,
+        passthrough_codecs=tuple(
+            codec.strip() for codec in args.passthrough_codecs.split(",") if codec.strip()
+        ),
+        passthrough_min_abr=args.passthrough_min_abr,
+        playlist_concurrency=max(1, args.playlist_concurrency),
+        channel_concurrency=max(0, args.channel_concurrency),
+        job_slots=max(1, args.job_slots),
+    )
+    if args.transcode_mode == "pool":
+        settings.transcode_pool = TranscodePool(args.transcode_workers)
+    if args.archive and (not args.plan or (download_root / ARCHIVE_FILENAME).exists()):
+        settings.archive = DownloadArchive.open(download_root)
+    if args.video_index and not args.plan:
+        settings.video_index = VideoIndex.open(download_root)
+    # Always shared: even without a rate, throttling responses back off every worker.
+    settings.rate_limiter = RateLimiter(args.rate_limit, args.rate_burst)
+    try:
+        channel_quotas = parse_channel_quotas(args.channel_quota)
+    except ValueError as exc:
+        parser.error(str(exc))
+    storage = StorageManager(
+        download_root,
+        settings.archive,
+        high_water=args.disk_high_water / 100,
+        min_retention=timedelta(hours=max(0.0, args.min_retention_hours)),
+        channel_quotas=channel_quotas,
+    )
+    if storage.enabled and not args.plan:
+        settings.storage = storage
+        if settings.archive is None:
+            console.print(
+                "[yellow]경고:[/yellow] 아카이브가 꺼져 있어 업로드 확인이 불가능하므로 파일을 정리하지 않습니다"
+            )
 
     castopod_config = load_castopod_config_from_env()
-    castopod_client = CastopodClient(castopod_config) if castopod_config else None
+    castopod_client = None
+    if castopod_config:
+        # --plan reads the catalog but, like the rest of plan mode, writes no files.
+        catalog = (
+            CastopodCatalog.open(
+                download_root,
+                castopod_config.base_url,
+                args.castopod_catalog_ttl * 60,
+                read_only=args.plan,
+            )
+            if args.castopod_catalog_ttl > 0
+            else None
+        )
+        castopod_client = CastopodClient(castopod_config, catalog=catalog)
     if castopod_client:
         console.print(
-            f"[cyan]Castopod API 업로드 활성화됨 — {castopod_client._config.base_url}[/cyan]"
+            f"[cyan]Castopod API 업로드 활성화됨 — {castopod_client._config.base_url} "
+            f"(동시 업로드 {castopod_client.max_concurrency})[/cyan]"
         )
 
-    async with AutomationServiceClient() as client:
-        config = await client.fetch_configuration()
-        if not config.channels:
-            console.print("[yellow]No channels configured. Nothing to do.[/yellow]")
-            return 0
-        job_results = await process_job_queue(
-            client,
-            config,
-            download_root,
-            args.audio_format,
-            args.dry_run,
-            castopod_client,
-        )
-        schedule_results: list[DownloadResult] = []
-        if args.skip_configuration:
-            console.print("[yellow]구성 채널 실행을 건너뜁니다 (skip-configuration 활성화)[/yellow]")
-        else:
-            schedule_results = await process_configuration(
+    try:
+        async with AutomationServiceClient() as client:
+            config = await client.fetch_configuration()
+            if not config.channels:
+                console.print("[yellow]No channels configured. Nothing to do.[/yellow]")
+                return 0
+            if args.plan:
+                plans = await plan_configuration(
+                    config,
+                    castopod_client,
+                    archive=settings.archive,
+                    rate_limiter=settings.rate_limiter,
+                    concurrency=max(PLAN_CONCURRENCY, settings.playlist_concurrency),
+                )
+                print_plan(plans, args.plan_output)
+                return 0
+            if castopod_client is not None:
+                warmed = await castopod_client.prewarm(
+                    playlist_entry.playlist
+                    for channel_entry in config.channels
+                    for playlist_entry in channel_entry.playlists
+                    if playlist_entry.playlist.castopod_slug or playlist_entry.playlist.castopod_uuid
+                )
+                console.print(f"[dim]Castopod 카탈로그 준비 완료 — 팟캐스트 {warmed}개[/dim]")
+            job_results = await process_job_queue(
                 client,
                 config,
                 download_root,
                 args.audio_format,
                 args.dry_run,
                 castopod_client,
+                settings=settings,
             )
-
-    if castopod_client:
-        castopod_client.close()
+            schedule_results: list[DownloadResult] = []
+            if args.skip_configuration:
+                console.print("[yellow]구성 채널 실행을 건너뜁니다 (skip-configuration 활성화)[/yellow]")
+            else:
+                schedule_results = await process_configuration(
+                    client,
+                    config,
+                    download_root,
+                    args.audio_format,
+                    args.dry_run,
+                    castopod_client,
+                    settings=settings,
+                )
+    finally:
+        if castopod_client:
+            await castopod_client.close()
+        settings.close()
 
     results = job_results + schedule_results
 
     table = Table(title="Pipeline summary")
     table.add_column("Playlist")
     table.add_column("Downloaded")
+    table.add_column("Requests")
+    table.add_column("Encode CPU (s)")
+    table.add_column("Throttled (s)")
+    table.add_column("Wall (s)")
+    table.add_column("Upload (MiB/s)")
+    table.add_column("Upload peak (MiB)")
     table.add_column("Mode")
     for result in results:
         table.add_row(
             result.playlist_url,
             str(result.downloaded),
-            "dry-run" if result.dry_run else "download",
+            str(result.request_count),
+            f"{result.transcode_cpu_seconds:.1f}",
+            f"{result.throttled_seconds:.1f}",
+            f"{result.wall_seconds:.1f}",
+            f"{result.upload_bytes_per_second / 1024**2:.1f}",
+            f"{result.upload_peak_memory_bytes / 1024**2:.1f}",
+            "feed-skip" if result.feed_skipped else "dry-run" if result.dry_run else "download",
         )
     console.print(table)
+    if settings.storage is not None and settings.storage.evicted.episodes:
+        console.print(
+            f"[cyan]저장 공간 정리: 에피소드 {settings.storage.evicted.episodes}개, "
+            f"{settings.storage.evicted.bytes / (1024 * 1024):.0f}MiB[/cyan]"
+        )
+    if settings.rate_limiter is not None and settings.rate_limiter.throttle_events:
+        console.print(
+            f"[yellow]YouTube 요청 제한 {settings.rate_limiter.throttle_events}회, "
+            f"총 대기 {settings.rate_limiter.throttled_seconds:.1f}초[/yellow]"
+        )
 
     return 0
 
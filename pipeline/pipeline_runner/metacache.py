@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+METADATA_CACHE_FILENAME = "info-cache.json"
+DEFAULT_METADATA_TTL_HOURS = 24.0
+
+
+@dataclass
+class CachedInfo:
+    video_id: str
+    info_path: Path
+    fetched_at: float
+
+
+class MetadataCache:
+    """Index of the ``.info.json`` files yt-dlp writes next to each episode.
+
+    Keyed by video id and stored as ``metadata/info-cache.json``; the first use in a
+    directory without an index picks up existing ``.info.json`` files by their
+    modification time. Entries older than ``ttl_seconds`` are not served but kept
+    until the episode is resolved again, so stale metadata is only refreshed when a
+    run actually needs it.
+    """
+
+    def __init__(self, playlist_dir: Path, ttl_seconds: float) -> None:
+        self.playlist_dir = playlist_dir
+        self.path = playlist_dir / "metadata" / METADATA_CACHE_FILENAME
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._entries: dict[str, CachedInfo] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, CachedInfo]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, CachedInfo] = {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        if isinstance(payload, dict):
+            for video_id, item in payload.items():
+                try:
+                    entries[video_id] = CachedInfo(
+                        video_id=video_id,
+                        info_path=self.playlist_dir / item["info_path"],
+                        fetched_at=float(item["fetched_at"]),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+        else:
+            entries = self._scan()
+            self._dirty = bool(entries)
+        self._entries = entries
+        return entries
+
+    def _scan(self) -> dict[str, CachedInfo]:
+        entries: dict[str, CachedInfo] = {}
+        for info_path in self.playlist_dir.glob("*.info.json"):
+            try:
+                with info_path.open(encoding="utf-8") as fp:
+                    video_id = json.load(fp).get("id")
+                fetched_at = info_path.stat().st_mtime
+            except (OSError, ValueError, AttributeError):
+                continue
+            if video_id:
+                entries[str(video_id)] = CachedInfo(str(video_id), info_path, fetched_at)
+        return entries
+
+    def lookup(self, video_id: str) -> CachedInfo | None:
+        with self._lock:
+            return self._load().get(video_id)
+
+    def fresh_info(self, video_id: str) -> dict[str, Any] | None:
+        """Full cached info for ``video_id`` when it is younger than the TTL."""
+
+        cached = self.lookup(video_id) if video_id else None
+        info: Any = None
+        if cached is not None and time.time() - cached.fetched_at <= self.ttl_seconds:
+            try:
+                with cached.info_path.open(encoding="utf-8") as fp:
+                    info = json.load(fp)
+            except (OSError, ValueError):
+                info = None
+            if not isinstance(info, dict) or str(info.get("id")) != video_id:
+                self.invalidate(video_id)
+                cached, info = None, None
+        with self._lock:
+            if info is not None:
+                self.hits += 1
+            elif cached is not None:
+                self.stale += 1
+            else:
+                self.misses += 1
+        return info
+
+    def store(self, video_id: str, info_path: Path) -> None:
+        if not video_id or not info_path.exists():
+            return
+        with self._lock:
+            self._load()[video_id] = CachedInfo(video_id, info_path, time.time())
+            self._dirty = True
+
+    def invalidate(self, video_id: str) -> None:
+        with self._lock:
+            if self._load().pop(video_id, None) is not None:
+                self._dirty = True
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            payload = {}
+            for video_id, cached in self._entries.items():
+                try:
+                    relative = cached.info_path.relative_to(self.playlist_dir)
+                except ValueError:
+                    continue
+                payload[video_id] = {
+                    "info_path": relative.as_posix(),
+                    "fetched_at": cached.fetched_at,
+                }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as fp:
+                json.dump(payload, fp, ensure_ascii=False, indent=2)
+            temp_path.replace(self.path)
+            self._dirty = False
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass, field
+from time import monotonic
+from typing import Any
+
+try:
+    from yt_dlp import YoutubeDL
+except ImportError:  # pragma: no cover - handled in runtime
+    YoutubeDL = None  # type: ignore
+
+from pipeline_client.client import PipelineChannel, PipelineConfiguration, PipelinePlaylist
+
+from .archive import DownloadArchive
+from .castopod import CastopodClient, slugify
+from .listing import build_playlist_url, entry_video_id
+from .ratelimit import RateLimiter
+
+# Typical YouTube bestaudio stream (opus/aac) used to size downloads from durations.
+ESTIMATED_AUDIO_KBPS = 160
+PLAN_CONCURRENCY = 8
+
+
+@dataclass
+class PlannedEntry:
+    video_id: str
+    title: str | None
+    duration: float | None
+    estimated_bytes: int | None
+
+
+@dataclass
+class PlaylistPlan:
+    """What a run would do for one playlist, derived from a flat listing only."""
+
+    playlist_id: int
+    channel: str
+    title: str
+    playlist_url: str
+    upload: bool
+    listed: int = 0
+    new_entries: list[PlannedEntry] = field(default_factory=list)
+    present_ids: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def estimated_bytes(self) -> int:
+        return sum(entry.estimated_bytes or 0 for entry in self.new_entries)
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["new_count"] = len(self.new_entries)
+        payload["present_count"] = len(self.present_ids)
+        payload["estimated_bytes"] = self.estimated_bytes
+        return payload
+
+
+def estimate_entry_bytes(entry: dict[str, Any]) -> int | None:
+    size = entry.get("filesize") or entry.get("filesize_approx")
+    if isinstance(size, (int, float)) and size > 0:
+        return int(size)
+    duration = entry.get("duration")
+    if isinstance(duration, (int, float)) and duration > 0:
+        return int(duration * ESTIMATED_AUDIO_KBPS * 1000 / 8)
+    return None
+
+
+def _flat_listing(playlist_url: str, rate_limiter: RateLimiter | None) -> list[dict[str, Any]]:
+    if YoutubeDL is None:  # pragma: no cover - fallback for missing dependency
+        raise RuntimeError("yt-dlp is not installed in this environment")
+    opts = {
+        "extract_flat": "in_playlist",
+        "skip_download": True,
+        "ignoreerrors": True,
+        "quiet": True,
+        "no_warnings": True,
+    }
+    with YoutubeDL(opts) as ydl:
+        if rate_limiter is not None:
+            original = ydl.urlopen
+            ydl.urlopen = lambda request: rate_limiter.call(lambda: original(request))[0]
+        info = ydl.extract_info(playlist_url, download=False)
+    entries = info.get("entries") if isinstance(info, dict) else None
+    return [entry for entry in entries or [] if entry]
+
+
+def _empty_plan(
+    channel_entry: PipelineChannel, playlist_entry: PipelinePlaylist, upload: bool
+) -> PlaylistPlan:
+    playlist = playlist_entry.playlist
+    return PlaylistPlan(
+        playlist_id=playlist.id,
+        channel=channel_entry.channel.slug,
+        title=playlist.title or playlist.youtube_playlist_id,
+        playlist_url=build_playlist_url(playlist.youtube_playlist_id),
+        upload=upload,
+    )
+
+
+def plan_playlist(
+    channel_entry: PipelineChannel,
+    playlist_entry: PipelinePlaylist,
+    upload: bool = False,
+    archive: DownloadArchive | None = None,
+    rate_limiter: RateLimiter | None = None,
+    existing_slugs: set[str] | None = None,
+) -> PlaylistPlan:
+    """Compare a flat listing against the archive and Castopod's known slugs.
+
+    Blocking; nothing is downloaded or written, so it is safe to run for every
+    configured playlist at once.
+    """
+
+    started = monotonic()
+    playlist = playlist_entry.playlist
+    plan = _empty_plan(channel_entry, playlist_entry, upload)
+    existing_slugs = existing_slugs or set()
+    try:
+        known_ids: set[str] = set()
+        if archive is not None:
+            statuses = ("uploaded",) if upload else ("transcoded", "uploaded")
+            known_ids = archive.video_ids(playlist.id, statuses)
+        entries = _flat_listing(plan.playlist_url, rate_limiter)
+    except Exception as exc:  # pragma: no cover - runtime logging
+        plan.error = str(exc)
+        plan.elapsed_seconds = monotonic() - started
+        return plan
+
+    plan.listed = len(entries)
+    for entry in entries:
+        video_id = entry_video_id(entry)
+        slug = slugify(entry.get("id") or entry.get("title") or "")
+        if video_id in known_ids or slug in existing_slugs:
+            plan.present_ids.append(video_id)
+            continue
+        duration = entry.get("duration")
+        plan.new_entries.append(
+            PlannedEntry(
+                video_id=video_id,
+                title=entry.get("title"),
+                duration=float(duration) if isinstance(duration, (int, float)) else None,
+                estimated_bytes=estimate_entry_bytes(entry),
+            )
+        )
+    plan.elapsed_seconds = monotonic() - started
+    return plan
+
+
+async def plan_configuration(
+    config: PipelineConfiguration,
+    castopod_client: CastopodClient | None = None,
+    archive: DownloadArchive | None = None,
+    rate_limiter: RateLimiter | None = None,
+    concurrency: int = PLAN_CONCURRENCY,
+) -> list[PlaylistPlan]:
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def _plan(
+        channel_entry: PipelineChannel, playlist_entry: PipelinePlaylist
+    ) -> PlaylistPlan:
+        playlist = playlist_entry.playlist
+        upload = castopod_client is not None and bool(
+            playlist.castopod_slug and playlist.castopod_uuid
+        )
+        async with limit:
+            existing_slugs: set[str] = set()
+            if castopod_client is not None and (playlist.castopod_slug or playlist.castopod_uuid):
+                try:
+                    podcast_id = await castopod_client.resolve_podcast_id(playlist)
+                    if podcast_id is not None:
+                        existing_slugs = await castopod_client.get_episode_slugs(podcast_id)
+                except Exception as exc:  # pragma: no cover - runtime logging
+                    plan = _empty_plan(channel_entry, playlist_entry, upload)
+                    plan.error = str(exc)
+                    return plan
+            return await asyncio.to_thread(
+                plan_playlist,
+                channel_entry,
+                playlist_entry,
+                upload,
+                archive,
+                rate_limiter,
+                existing_slugs,
+            )
+
+    return list(
+        await asyncio.gather(
+            *(
+                _plan(channel_entry, playlist_entry)
+                for channel_entry in config.channels
+                for playlist_entry in channel_entry.playlists
+            )
+        )
+    )
+
+
+def plan_report(plans: list[PlaylistPlan]) -> dict[str, Any]:
+    return {
+        "playlists": [plan.to_dict() for plan in plans],
+        "totals": {
+            "playlists": len(plans),
+            "listed": sum(plan.listed for plan in plans),
+            "new": sum(len(plan.new_entries) for plan in plans),
+            "present": sum(len(plan.present_ids) for plan in plans),
+            "estimated_bytes": sum(plan.estimated_bytes for plan in plans),
+            "errors": sum(1 for plan in plans if plan.error),
+        },
+    }
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Any, Callable
+
+# HTTP statuses YouTube answers with when it throttles a client. A 403 is also sent
+# for expired signatures and blocked videos, so it only counts with a throttle signal.
+THROTTLE_STATUSES = (429, 403)
+THROTTLE_MESSAGES = ("rate-limit", "rate limit", "too many requests")
+DEFAULT_BURST = 5
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 120.0
+MAX_THROTTLE_RETRIES = 3
+
+
+def throttle_status(exc: BaseException) -> int | None:
+    """HTTP status of ``exc`` when it is a throttling response, otherwise None."""
+
+    status = getattr(exc, "status", None) or getattr(exc, "code", None)
+    if status not in THROTTLE_STATUSES:
+        return None
+    if status == 403 and retry_after_seconds(exc) is None:
+        message = str(exc).lower()
+        if not any(marker in message for marker in THROTTLE_MESSAGES):
+            return None
+    return status
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exc, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    try:
+        seconds = float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds and seconds > 0 else None
+
+
+class RateLimiter:
+    """Token bucket shared by every YoutubeDL instance of a ``pipeline-run`` process.
+
+    ``rate`` requests per second are allowed on average with bursts of up to
+    ``burst``; a ``rate`` of 0 disables the bucket but keeps the throttle backoff.
+    When YouTube throttles, ``penalize`` pauses all callers with an exponential
+    delay (or the server's Retry-After) until a request succeeds again.
+    YoutubeDL runs in worker threads, so waiting blocks the calling thread.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = MAX_THROTTLE_RETRIES,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = max(0.0, rate)
+        self.burst = max(1, burst)
+        self.max_retries = max(0, max_retries)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._strikes = 0
+        self.throttled_seconds = 0.0
+        self.throttle_events = 0
+
+    def _reserve(self, now: float) -> float:
+        if self.rate <= 0:
+            return 0.0
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+        self._tokens -= 1
+        ready_at = self._updated + max(0.0, -self._tokens) / self.rate
+        return max(0.0, ready_at - now)
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the seconds spent waiting."""
+
+        with self._lock:
+            now = self._clock()
+            wait = max(self._reserve(now), self._paused_until - now)
+        waited = 0.0
+        while wait > 0:
+            self._sleep(wait)
+            waited += wait
+            with self._lock:
+                # A throttle response may have extended the pause while we slept.
+                wait = self._paused_until - self._clock()
+        if waited:
+            with self._lock:
+                self.throttled_seconds += waited
+        return waited
+
+    def penalize(self, retry_after: float | None = None) -> float:
+        """Pause every caller after a throttling response; returns the delay applied."""
+
+        with self._lock:
+            self._strikes += 1
+            self.throttle_events += 1
+            delay = retry_after or min(
+                BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (self._strikes - 1)
+            )
+            resume_at = self._clock() + delay
+            if resume_at > self._paused_until:
+                self._paused_until = resume_at
+                # Start again from an empty bucket instead of bursting after the pause.
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = max(self._updated, resume_at)
+            return delay
+
+    def record_success(self) -> None:
+        if self._strikes:
+            with self._lock:
+                self._strikes = 0
+
+    def call(
+        self,
+        send: Callable[[], Any],
+        on_throttle: Callable[[int, float], None] | None = None,
+    ) -> tuple[Any, float]:
+        """Send one request through the bucket, retrying throttled attempts.
+
+        Returns the response and the seconds spent waiting for this request.
+        """
+
+        waited = 0.0
+        attempt = 0
+        while True:
+            waited += self.acquire()
+            try:
+                response = send()
+            except Exception as exc:
+                status = throttle_status(exc)
+                if status is None or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                delay = self.penalize(retry_after_seconds(exc))
+                if on_throttle is not None:
+                    on_throttle(status, delay)
+                continue
+            self.record_success()
+            return response, waited
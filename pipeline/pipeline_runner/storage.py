@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable
+
+from .archive import DownloadArchive
+
+DEFAULT_MIN_RETENTION_HOURS = 24.0
+# Evict down to this far below the high-water mark so eviction does not run per episode.
+EVICTION_HYSTERESIS = 0.05
+ADMISSION_POLL_SECONDS = 5.0
+DEFAULT_ADMISSION_TIMEOUT_SECONDS = 15 * 60
+DEFAULT_QUOTA_KEY = "*"
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+class StorageFullError(RuntimeError):
+    """Raised when a download cannot be admitted before the admission timeout."""
+
+
+def parse_size(value: str) -> int:
+    """Parse ``10G``, ``500M``, ``1.5T`` or a plain byte count."""
+
+    text = value.strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1:] if text[-1:] in _SIZE_UNITS else ""
+    number = text[: len(text) - len(unit)] if unit else text
+    try:
+        size = float(number) * _SIZE_UNITS[unit]
+    except ValueError as exc:
+        raise ValueError(f"invalid size: {value!r}") from exc
+    if size < 0:
+        raise ValueError(f"invalid size: {value!r}")
+    return int(size)
+
+
+def parse_channel_quotas(values: Iterable[str]) -> dict[str, int]:
+    """Parse ``slug=10G`` items (comma-separated or repeated); ``*`` sets the default."""
+
+    quotas: dict[str, int] = {}
+    for value in values:
+        for item in value.split(","):
+            if not item.strip():
+                continue
+            slug, separator, size = item.partition("=")
+            if not separator or not slug.strip():
+                raise ValueError(f"invalid channel quota: {item!r} (expected slug=size)")
+            quotas[slug.strip()] = parse_size(size)
+    return quotas
+
+
+def directory_size(path: Path) -> int:
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.stat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+# Suffixes yt-dlp and the transcode stage leave next to an episode's audio.
+_EPISODE_SUFFIXES = (
+    ".mp3",
+    ".m4a",
+    ".opus",
+    ".ogg",
+    ".flac",
+    ".aac",
+    ".wav",
+    ".webm",
+    ".mka",
+    ".mp4",
+    ".info.json",
+    ".jpg",
+    ".jpeg",
+    ".webp",
+    ".png",
+)
+_PARTIAL_SUFFIXES = (".part", ".ytdl")
+
+
+def episode_files(audio_path: Path, video_id: str) -> list[Path]:
+    """Audio, raw download, thumbnails, info JSON and square cover of one episode.
+
+    Only exact names are matched, so evicting ``Ep 5.mp3`` leaves the files of
+    ``Ep 5. Bonus.mp3`` alone.
+    """
+
+    playlist_dir = audio_path.parent
+    stem = audio_path.stem
+    names = {audio_path.name}
+    for suffix in _EPISODE_SUFFIXES:
+        for name in (f"{stem}{suffix}", f"{stem}.transcoding{suffix}"):
+            names.add(name)
+            names.update(f"{name}{partial}" for partial in _PARTIAL_SUFFIXES)
+    files = [playlist_dir / name for name in sorted(names) if (playlist_dir / name).is_file()]
+    cover = playlist_dir / "metadata" / "artwork" / "episodes" / f"{video_id}.jpg"
+    if cover.exists():
+        files.append(cover)
+    return files
+
+
+@dataclass
+class EvictionResult:
+    episodes: int = 0
+    files: int = 0
+    bytes: int = 0
+
+
+class StorageManager:
+    """Keeps the download root below a disk high-water mark and per-channel quotas.
+
+    New downloads are admitted only while the filesystem is below ``high_water``
+    (a used fraction) and the channel directory is below its quota. Otherwise the
+    least recently used episodes that the archive has seen uploaded at least
+    ``min_retention`` ago are evicted; when that is not enough the download waits
+    until space frees up or the admission timeout passes.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        archive: DownloadArchive | None,
+        high_water: float | None = None,
+        min_retention: timedelta = timedelta(hours=DEFAULT_MIN_RETENTION_HOURS),
+        channel_quotas: dict[str, int] | None = None,
+        admission_timeout: float = DEFAULT_ADMISSION_TIMEOUT_SECONDS,
+        poll_seconds: float = ADMISSION_POLL_SECONDS,
+        disk_usage: Callable[[Path], Any] = shutil.disk_usage,
+    ) -> None:
+        self.root = root
+        self.archive = archive
+        self.high_water = high_water if high_water and 0 < high_water < 1 else None
+        self.min_retention = min_retention
+        self.channel_quotas = dict(channel_quotas or {})
+        self.admission_timeout = admission_timeout
+        self.poll_seconds = poll_seconds
+        self._disk_usage = disk_usage
+        self._lock = asyncio.Lock()
+        self.evicted = EvictionResult()
+
+    @property
+    def enabled(self) -> bool:
+        return self.high_water is not None or bool(self.channel_quotas)
+
+    def quota_for(self, channel: str) -> int | None:
+        return self.channel_quotas.get(channel, self.channel_quotas.get(DEFAULT_QUOTA_KEY))
+
+    def used_fraction(self) -> float:
+        usage = self._disk_usage(self.root)
+        return usage.used / usage.total if usage.total else 0.0
+
+    def pressure(self, channel: str | None = None) -> str | None:
+        """Why a download would be held back right now, or None."""
+
+        if self.high_water is not None:
+            used = self.used_fraction()
+            if used >= self.high_water:
+                return f"디스크 사용률 {used:.0%} ≥ {self.high_water:.0%}"
+        quota = self.quota_for(channel) if channel else None
+        if quota is not None:
+            used_bytes = directory_size(self.root / channel)  # type: ignore[operator]
+            if used_bytes >= quota:
+                return f"채널 {channel} 용량 {used_bytes / 1024**3:.1f}GiB ≥ {quota / 1024**3:.1f}GiB"
+        return None
+
+    def _channel_of(self, path: Path) -> str | None:
+        try:
+            parts = path.relative_to(self.root).parts
+        except ValueError:
+            return None
+        return parts[0] if len(parts) > 1 else None
+
+    def evict(self, channel: str | None = None) -> EvictionResult:
+        """Remove LRU uploaded episodes until the disk and ``channel`` are within limits."""
+
+        result = EvictionResult()
+        if self.archive is None or not self.enabled:
+            return result
+        cutoff = datetime.now(UTC) - self.min_retention
+        candidates = []
+        for playlist_id, video_id, audio_path, uploaded_at in self.archive.uploaded_files(cutoff):
+            owner = self._channel_of(audio_path)
+            if owner is None:
+                continue
+            try:
+                last_used = max(uploaded_at.timestamp(), audio_path.stat().st_atime)
+            except OSError:
+                last_used = uploaded_at.timestamp()
+            candidates.append((last_used, playlist_id, video_id, audio_path, owner))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        disk_target = self.high_water - EVICTION_HYSTERESIS if self.high_water else None
+        quota = self.quota_for(channel) if channel else None
+        channel_bytes = directory_size(self.root / channel) if channel and quota is not None else 0
+
+        for _last_used, playlist_id, video_id, audio_path, owner in candidates:
+            disk_ok = disk_target is None or self.used_fraction() <= disk_target
+            channel_ok = quota is None or channel_bytes < quota
+            if disk_ok and channel_ok:
+                break
+            if disk_ok and owner != channel:
+                # Only the channel quota is exceeded; other channels' files do not help.
+                continue
+            freed = 0
+            removed = 0
+            for path in episode_files(audio_path, video_id):
+                try:
+                    size = path.stat().st_size
+                    path.unlink()
+                except OSError:
+                    continue
+                freed += size
+                removed += 1
+            self.archive.forget_files(playlist_id, video_id)
+            result.episodes += 1
+            result.files += removed
+            result.bytes += freed
+            if owner == channel:
+                channel_bytes -= freed
+        self.evicted.episodes += result.episodes
+        self.evicted.files += result.files
+        self.evicted.bytes += result.bytes
+        return result
+
+    async def admit(
+        self,
+        channel: str,
+        on_hold: Callable[[str], Awaitable[None]] | None = None,
+    ) -> float:
+        """Wait until a new download for ``channel`` fits; returns the seconds held."""
+
+        if not self.enabled:
+            return 0.0
+        held = 0.0
+        notified = False
+        while True:
+            async with self._lock:
+                reason = await asyncio.to_thread(self.pressure, channel)
+                if reason is None:
+                    return held
+                await asyncio.to_thread(self.evict, channel)
+                reason = await asyncio.to_thread(self.pressure, channel)
+                if reason is None:
+                    return held
+            if held >= self.admission_timeout:
+                raise StorageFullError(f"저장 공간 부족으로 다운로드 불가 — {reason}")
+            if on_hold is not None and not notified:
+                notified = True
+                await on_hold(reason)
+            await asyncio.sleep(self.poll_seconds)
+            held += self.poll_seconds
+
+    async def enforce(self, channel: str | None = None) -> EvictionResult:
+        if not self.enabled:
+            return EvictionResult()
+        async with self._lock:
+            if await asyncio.to_thread(self.pressure, channel) is None:
+                return EvictionResult()
+            return await asyncio.to_thread(self.evict, channel)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+# Encoder settings that mirror yt-dlp's FFmpegExtractAudio with preferredquality "0".
+_ENCODERS: dict[str, tuple[str, list[str]]] = {
+    "mp3": ("libmp3lame", ["-q:a", "0"]),
+    "m4a": ("aac", ["-b:a", "256k"]),
+    "aac": ("aac", ["-b:a", "256k"]),
+    "opus": ("libopus", ["-b:a", "160k"]),
+    "ogg": ("libvorbis", ["-q:a", "10"]),
+    "flac": ("flac", []),
+    "wav": ("pcm_s16le", []),
+}
+
+
+# Container each passthrough codec is stored in; webm sources get remuxed into these.
+PASSTHROUGH_CONTAINERS: dict[str, str] = {
+    "aac": "m4a",
+    "opus": "opus",
+    "mp3": "mp3",
+    "vorbis": "ogg",
+    "flac": "flac",
+}
+_CODEC_ALIASES = {"m4a": "aac", "mp4a": "aac", "ogg": "vorbis"}
+
+
+class TranscodeError(RuntimeError):
+    """Raised when ffmpeg fails to produce the requested audio file."""
+
+
+def normalize_codec(value: str | None) -> str | None:
+    if not value or value == "none":
+        return None
+    codec = value.lower().split(".")[0]
+    return _CODEC_ALIASES.get(codec, codec)
+
+
+@dataclass(frozen=True)
+class AudioPolicy:
+    """Source codecs that may skip re-encoding, and the bitrate they need to reach."""
+
+    allowed_codecs: frozenset[str]
+    min_abr: float | None = None
+
+    @classmethod
+    def from_values(
+        cls, codecs: Iterable[str], min_abr: float | None = None
+    ) -> "AudioPolicy | None":
+        allowed = frozenset(
+            codec for codec in (normalize_codec(value.strip()) for value in codecs) if codec
+        )
+        if not allowed:
+            return None
+        return cls(allowed, min_abr if min_abr and min_abr > 0 else None)
+
+
+@dataclass(frozen=True)
+class AudioPlan:
+    """How a downloaded stream becomes the episode audio file."""
+
+    action: str  # "passthrough", "remux" or "encode"
+    extension: str
+
+
+def plan_audio(info: dict[str, Any], audio_format: str, policy: AudioPolicy | None) -> AudioPlan:
+    encode = AudioPlan("encode", audio_format)
+    if policy is None:
+        return encode
+    codec = normalize_codec(info.get("acodec"))
+    if codec is None or codec not in policy.allowed_codecs or codec not in PASSTHROUGH_CONTAINERS:
+        return encode
+    abr = info.get("abr")
+    if policy.min_abr is not None and isinstance(abr, (int, float)) and abr < policy.min_abr:
+        return encode
+    container = PASSTHROUGH_CONTAINERS[codec]
+    return AudioPlan("passthrough" if info.get("ext") == container else "remux", container)
+
+
+def build_ffmpeg_command(
+    source: Path,
+    destination: Path,
+    audio_format: str,
+    copy: bool = False,
+) -> list[str]:
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise TranscodeError("ffmpeg is not installed in this environment")
+    if copy:
+        codec, codec_args = "copy", []
+    else:
+        codec, codec_args = _ENCODERS.get(audio_format, (audio_format, []))
+    return [
+        ffmpeg,
+        "-y",
+        "-loglevel",
+        "error",
+        "-i",
+        str(source),
+        "-vn",
+        "-c:a",
+        codec,
+        *codec_args,
+        str(destination),
+    ]
+
+
+def _run_measured(command: list[str]) -> tuple[int, str, float]:
+    """Run ``command``; returns its exit code, stderr and the CPU seconds it used.
+
+    ``os.wait4`` reaps this child alone and reports its own rusage, so ffmpeg runs
+    in other threads and yt-dlp's ffmpeg/ffprobe children are not counted.
+    """
+
+    process = subprocess.Popen(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    assert process.stderr is not None
+    with process.stderr:
+        stderr = process.stderr.read()
+    _pid, status, usage = os.wait4(process.pid, 0)
+    # Tell Popen the child is reaped so it does not wait for it again.
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, stderr, usage.ru_utime + usage.ru_stime
+
+
+def transcode_audio(
+    source: str,
+    destination: str,
+    audio_format: str,
+    copy: bool = False,
+) -> tuple[str, float]:
+    """Encode (or with ``copy`` remux) ``source`` into ``destination``.
+
+    Runs inside a worker process, so arguments are plain strings. Returns the output
+    path and the CPU seconds ffmpeg used; the raw download is removed on success.
+    """
+
+    source_path = Path(source)
+    destination_path = Path(destination)
+    temp_path = destination_path.with_name(
+        f"{destination_path.stem}.transcoding.{audio_format}"
+    )
+    command = build_ffmpeg_command(source_path, temp_path, audio_format, copy=copy)
+    returncode, stderr_text, cpu_seconds = _run_measured(command)
+    if returncode != 0:
+        temp_path.unlink(missing_ok=True)
+        stderr = (stderr_text or "").strip().splitlines()
+        detail = stderr[-1] if stderr else f"exit code {returncode}"
+        raise TranscodeError(f"ffmpeg failed for {source_path.name}: {detail}")
+    temp_path.replace(destination_path)
+    if source_path != destination_path:
+        source_path.unlink(missing_ok=True)
+    return str(destination_path), cpu_seconds
+
+
+class TranscodePool:
+    """Process pool that encodes raw downloads while the next episodes download."""
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "TranscodePool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def transcode(
+        self,
+        source: Path,
+        destination: Path,
+        audio_format: str,
+        copy: bool = False,
+    ) -> tuple[Path, float]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        path, cpu_seconds = await loop.run_in_executor(
+            self._executor,
+            transcode_audio,
+            str(source),
+            str(destination),
+            audio_format,
+            copy,
+        )
+        return Path(path), cpu_seconds
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import errno
+import fcntl
+import json
+import os
+import shutil
+import sqlite3
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from .transcode import AudioPolicy
+
+VIDEO_INDEX_FILENAME = ".pipeline-videos.sqlite3"
+# ioctl request that makes a copy-on-write clone on btrfs/xfs (linux/fs.h).
+FICLONE = 0x40049409
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media (
+    video_id TEXT NOT NULL,
+    media_key TEXT NOT NULL,
+    audio_path TEXT NOT NULL,
+    info_path TEXT,
+    thumbnail_path TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (video_id, media_key)
+)
+"""
+
+
+def link_or_clone(source: Path, destination: Path) -> str:
+    """Materialise ``source`` at ``destination`` without a second copy where possible.
+
+    Tries a hardlink, then a reflink, then falls back to a plain copy; returns the
+    method used, or ``"existing"`` when ``destination`` is already there.
+    """
+
+    if destination.exists():
+        return "existing"
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, destination)
+        return "hardlink"
+    except OSError as exc:
+        if exc.errno == errno.EEXIST:
+            return "existing"
+    try:
+        with source.open("rb") as src, destination.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return "reflink"
+    except OSError:
+        destination.unlink(missing_ok=True)
+    shutil.copy2(source, destination)
+    return "copy"
+
+
+def media_key(audio_format: str, policy: AudioPolicy | None = None) -> str:
+    """Index key for the audio a playlist asks for: the format plus its passthrough policy."""
+
+    if policy is None:
+        return audio_format
+    key = f"{audio_format}+{','.join(sorted(policy.allowed_codecs))}"
+    return f"{key}@{policy.min_abr:g}" if policy.min_abr else key
+
+
+@dataclass
+class IndexedMedia:
+    video_id: str
+    audio_path: Path
+    info_path: Path | None
+    thumbnail_path: Path | None
+
+    def load_info(self) -> dict[str, Any] | None:
+        if self.info_path is None:
+            return None
+        try:
+            with self.info_path.open(encoding="utf-8") as fp:
+                info = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        return info if isinstance(info, dict) and str(info.get("id")) == self.video_id else None
+
+
+class VideoIndex:
+    """SQLite index of finished audio per video across every playlist directory.
+
+    Keyed by video id and a media key (the requested audio format plus any
+    passthrough policy), so the same video is downloaded and encoded once and then
+    linked into each playlist that lists it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    @classmethod
+    def open(cls, download_root: Path) -> "VideoIndex":
+        return cls(download_root / VIDEO_INDEX_FILENAME)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def lookup(self, video_id: str, media_key: str) -> IndexedMedia | None:
+        """Indexed media whose audio file still exists, or None."""
+
+        if not video_id:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT audio_path, info_path, thumbnail_path FROM media"
+                " WHERE video_id = ? AND media_key = ?",
+                (video_id, media_key),
+            ).fetchone()
+        if row is None:
+            return None
+        audio_path = Path(row[0])
+        if not audio_path.exists():
+            return None
+        info_path = Path(row[1]) if row[1] else None
+        thumbnail_path = Path(row[2]) if row[2] else None
+        return IndexedMedia(
+            video_id=video_id,
+            audio_path=audio_path,
+            info_path=info_path if info_path and info_path.exists() else None,
+            thumbnail_path=thumbnail_path if thumbnail_path and thumbnail_path.exists() else None,
+        )
+
+    def record(
+        self,
+        video_id: str,
+        media_key: str,
+        audio_path: Path,
+        info_path: Path | None = None,
+        thumbnail_path: Path | None = None,
+    ) -> None:
+        """Remember ``audio_path`` unless an existing entry still points at a live file."""
+
+        if not video_id or not audio_path.exists():
+            return
+        if self.lookup(video_id, media_key) is not None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO media"
+                " (video_id, media_key, audio_path, info_path, thumbnail_path, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    video_id,
+                    media_key,
+                    str(audio_path),
+                    str(info_path) if info_path else None,
+                    str(thumbnail_path) if thumbnail_path else None,
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pipeline_runner.adaptive import AdaptiveConcurrency
+from pipeline_runner.main import StageProgress
+
+MIB = 1024 * 1024
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _window(controller: AdaptiveConcurrency, clock: _Clock, rate_mib: float) -> list[int]:
+    """Finish one window of downloads at ``rate_mib`` MiB/s; returns the limits seen."""
+
+    limits = []
+    count = controller.limit
+    for _ in range(count):
+        clock.now += 1.0 / count
+        controller.record(int(rate_mib * MIB / count), ok=True)
+        limits.append(controller.limit)
+    return limits
+
+
+def test_controller_increases_while_throughput_improves_then_steps_back() -> None:
+    clock = _Clock()
+    controller = AdaptiveConcurrency(1, maximum=6, clock=clock)
+
+    _window(controller, clock, 2.0)
+    assert controller.limit == 2
+    _window(controller, clock, 4.0)
+    assert controller.limit == 3
+    _window(controller, clock, 4.1)  # plateau: the third worker did not help
+    assert controller.limit == 2
+    assert "정체" in controller.history[-1].reason
+    _window(controller, clock, 4.0)  # hold window
+    assert controller.limit == 2
+    _window(controller, clock, 4.0)  # probe again
+    assert controller.limit == 3
+
+
+def test_controller_halves_on_throttling_and_errors() -> None:
+    clock = _Clock()
+    controller = AdaptiveConcurrency(6, maximum=8, clock=clock)
+
+    change = controller.record(MIB, ok=True, throttled=True)
+    assert change is not None and (change.previous, change.limit) == (6, 3)
+
+    for ok in (False, True, False):
+        clock.now += 1.0
+        controller.record(MIB, ok=ok)
+    assert controller.limit == 1
+    assert controller.history[-1].reason.startswith("오류율")
+
+
+def test_stage_progress_message_reports_concurrency() -> None:
+    progress = StageProgress(total=4, downloaded=1, concurrency=3, concurrency_reason="처리량 2.0MiB/s")
+
+    assert progress.message().endswith("동시 다운로드 3 (처리량 2.0MiB/s)")
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pipeline_runner.archive import DownloadArchive
+
+
+def test_archive_status_only_moves_forward(tmp_path: Path) -> None:
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        archive.record(1, "vid-a", "uploaded", tmp_path / "a.mp3")
+        archive.record(1, "vid-a", "downloaded")
+        archive.record(1, "vid-b", "transcoded")
+        archive.record(2, "vid-c", "downloaded")
+
+        assert archive.status(1, "vid-a") == "uploaded"
+        assert archive.video_ids(1) == {"vid-a", "vid-b"}
+        assert archive.video_ids(1, ("uploaded",)) == {"vid-a"}
+        assert archive.video_ids(2, ("transcoded", "uploaded")) == set()
+    finally:
+        archive.close()
+
+    reopened = DownloadArchive.open(tmp_path)
+    try:
+        assert reopened.status(1, "vid-b") == "transcoded"
+    finally:
+        reopened.close()
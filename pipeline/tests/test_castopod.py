@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from pipeline_client.client import PipelinePlaylist, Playlist
+from pipeline_runner.archive import DownloadArchive
+from pipeline_runner.castopod import CastopodClient, CastopodConfig, UploadStats
+from pipeline_runner.catalog import CastopodCatalog
+from pipeline_runner.journal import PlaylistJournal
+from pipeline_runner.main import DownloadResult, EpisodeRecord, upload_playlist_to_castopod
+
+runner = importlib.import_module("pipeline_runner.main")
+
+
+def _client(
+    handler: httpx.MockTransport,
+    max_concurrency: int = 2,
+    catalog: CastopodCatalog | None = None,
+) -> CastopodClient:
+    config = CastopodConfig(
+        base_url="https://castopod.test/api/rest/v1/",
+        username="u",
+        password="p",
+        user_id=1,
+        max_concurrency=max_concurrency,
+    )
+    return CastopodClient(config, transport=handler, catalog=catalog)
+
+
+async def test_upload_episode_streams_audio_from_disk(tmp_path: Path) -> None:
+    audio = tmp_path / "episode.mp3"
+    payload = bytes(range(256)) * (12 * 1024)  # 3 MiB
+    audio.write_bytes(payload)
+    received: dict[str, object] = {}
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=[])
+        if request.url.path.endswith("/publish"):
+            return httpx.Response(200, json={})
+        received["length"] = request.headers.get("Content-Length")
+        received["streamed"] = isinstance(request.stream, httpx.AsyncByteStream)
+        received["body"] = await request.aread()
+        return httpx.Response(201, json={"id": 5})
+
+    client = _client(httpx.MockTransport(_handle))
+    stats = UploadStats()
+    try:
+        episode = await client.create_episode(1, "episode", "Episode", None, audio, None, stats=stats)
+    finally:
+        await client.close()
+
+    assert episode == {"id": 5}
+    assert received["streamed"] and received["length"] == str(len(received["body"]))  # type: ignore[arg-type]
+    assert payload in received["body"]  # type: ignore[operator]
+    assert stats.bytes_sent == len(payload)
+    assert stats.seconds > 0 and stats.bytes_per_second > 0
+    assert "MiB/s" in stats.message()
+
+
+async def test_uploads_run_concurrently_up_to_the_host_cap(tmp_path: Path) -> None:
+    active = 0
+    peak = 0
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        if request.method == "GET":
+            return httpx.Response(200, json=[])
+        if request.url.path.endswith("/publish"):
+            return httpx.Response(200, json={})
+        active += 1
+        peak = max(peak, active)
+        await request.aread()
+        await asyncio.sleep(0.02)
+        active -= 1
+        return httpx.Response(201, json={"id": 1})
+
+    client = _client(httpx.MockTransport(_handle), max_concurrency=2)
+    paths = []
+    for index in range(5):
+        path = tmp_path / f"e{index}.mp3"
+        path.write_bytes(b"x" * 1024)
+        paths.append(path)
+    try:
+        episodes = await asyncio.gather(
+            *(
+                client.create_episode(1, path.stem, path.stem, None, path, None)
+                for path in paths
+            )
+        )
+        # already-known slugs are skipped without another upload
+        again = await client.create_episode(1, "e0", "e0", None, paths[0], None)
+    finally:
+        await client.close()
+
+    assert all(episode == {"id": 1} for episode in episodes)
+    assert again is None
+    assert peak == 2
+
+
+async def test_catalog_refreshes_only_the_newest_episode_pages(tmp_path: Path) -> None:
+    episodes = [f"ep-{number}" for number in range(249, -1, -1)]  # newest first
+    requests: list[str] = []
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path.rsplit("/", 1)[-1])
+        if request.url.path.endswith("/podcasts"):
+            return httpx.Response(200, json=[{"id": 7, "guid": "uuid-7", "handle": "show"}])
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        return httpx.Response(200, json=[{"slug": slug} for slug in episodes[offset : offset + limit]])
+
+    playlist = Playlist(
+        id=1, youtube_playlist_id="PLfake", title="Show", channel_id=1, castopod_slug="show"
+    )
+
+    async def _run(ttl_seconds: float, read_only: bool = False) -> set[str]:
+        catalog = CastopodCatalog.open(
+            tmp_path, "https://castopod.test/api/rest/v1", ttl_seconds, read_only=read_only
+        )
+        client = _client(httpx.MockTransport(_handle), catalog=catalog)
+        try:
+            assert await client.prewarm([playlist]) == 1
+            return await client.get_episode_slugs(7)
+        finally:
+            await client.close()
+
+    assert len(await _run(3600)) == 250
+    assert requests == ["podcasts", "episodes", "episodes", "episodes"]
+
+    requests.clear()
+    assert len(await _run(3600)) == 250
+    assert requests == []
+
+    # --plan uses the cached catalog as well but leaves the file untouched.
+    saved = (tmp_path / ".castopod-catalog.json").read_text()
+    assert len(await _run(3600, read_only=True)) == 250
+    assert requests == []
+    await _run(0, read_only=True)
+    assert (tmp_path / ".castopod-catalog.json").read_text() == saved
+
+    episodes.insert(0, "ep-250")
+    requests.clear()
+    slugs = await _run(0)
+    assert "ep-250" in slugs and len(slugs) == 251
+    assert requests == ["podcasts", "episodes"]
+
+
+
+async def test_find_episode_pages_past_the_newest_episodes() -> None:
+    # concurrent uploads pushed the episode a failed attempt created onto page two
+    episodes = [{"id": number, "slug": f"ep-{number}"} for number in range(149, -1, -1)]
+    offsets: list[int] = []
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        offsets.append(offset)
+        return httpx.Response(200, json=episodes[offset : offset + limit])
+
+    client = _client(httpx.MockTransport(_handle))
+    try:
+        found = await client.find_episode(7, "ep-20")
+        missing = await client.find_episode(7, "ep-999")
+    finally:
+        await client.close()
+
+    assert found == {"id": 20, "slug": "ep-20"}
+    assert missing is None
+    assert offsets == [0, 100, 0, 100]
+
+async def test_deferred_publish_uploads_first_and_retries_only_the_publish(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(runner, "CASTOPOD_RETRY_BASE_SECONDS", 0)
+    calls: list[str] = []
+    failed_publish: set[str] = set()
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "GET":
+            return httpx.Response(200, json=[])
+        if path.endswith("/publish"):
+            episode_id = path.split("/")[-2]
+            calls.append(f"publish:{episode_id}")
+            if episode_id == "2" and episode_id not in failed_publish:
+                failed_publish.add(episode_id)
+                return httpx.Response(500)
+            return httpx.Response(200, json={})
+        calls.append("create")
+        return httpx.Response(201, json={"id": calls.count("create")})
+
+    # Chronological order is the reverse of the upload order.
+    episodes = []
+    for video_id, upload_date in (("b", "20240102"), ("a", "20240101")):
+        audio = tmp_path / f"{video_id}.mp3"
+        audio.write_bytes(b"audio")
+        episodes.append(
+            EpisodeRecord(
+                video_id, video_id, None, None, upload_date, None, audio, None, None, None, None
+            )
+        )
+    result = DownloadResult("url", len(episodes), False, episodes, None)
+    playlist_entry = PipelinePlaylist(
+        playlist=Playlist(id=1, youtube_playlist_id="PLfake", title="Show", channel_id=1),
+        schedules=[],
+    )
+    client = _client(httpx.MockTransport(_handle), max_concurrency=1)
+    try:
+        await upload_playlist_to_castopod(
+            client, playlist_entry, result, podcast_id=7, deferred_publish=True
+        )
+    finally:
+        await client.close()
+
+    # "a" is older, so its episode (id 2) is published first; its failed publish
+    # is retried without creating the episode again.
+    assert calls[:4] == ["create", "create", "publish:2", "publish:1"]
+    assert calls.count("create") == 2 and calls.count("publish:2") == 2
+    assert all(episode.castopod_episode_id is None for episode in episodes)
+
+
+async def test_deferred_episode_is_archived_only_once_published(tmp_path: Path) -> None:
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=[])
+        if request.url.path.endswith("/publish"):
+            return httpx.Response(422, json={"error": "invalid publication date"})
+        return httpx.Response(201, json={"id": 3})
+
+    audio = tmp_path / "vid.mp3"
+    audio.write_bytes(b"audio")
+    episode = EpisodeRecord("vid", "Vid", None, None, "20240101", None, audio, None, None, None, None)
+    playlist_entry = PipelinePlaylist(
+        playlist=Playlist(id=1, youtube_playlist_id="PLfake", title="Show", channel_id=1),
+        schedules=[],
+    )
+    archive = DownloadArchive.open(tmp_path)
+    journal = PlaylistJournal(tmp_path)
+    client = _client(httpx.MockTransport(_handle))
+    try:
+        await upload_playlist_to_castopod(
+            client,
+            playlist_entry,
+            DownloadResult("url", 1, False, [episode], None),
+            podcast_id=7,
+            archive=archive,
+            journal=journal,
+            deferred_publish=True,
+        )
+        assert archive.video_ids(1, ("uploaded",)) == set()
+    finally:
+        await client.close()
+        archive.close()
+
+    state = journal.get("vid")
+    assert state is not None and state.stage == "uploaded" and state.castopod_episode_id == 3
+
+
+async def test_lost_upload_response_is_published_without_sending_audio_again(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(runner, "CASTOPOD_RETRY_BASE_SECONDS", 0)
+    server: list[dict[str, object]] = []
+    calls: list[str] = []
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            calls.append("lookup")
+            return httpx.Response(200, json=server)
+        if request.url.path.endswith("/publish"):
+            calls.append("publish")
+            server[0]["published_at"] = "2024-01-01 06:00:00"
+            return httpx.Response(200, json={})
+        calls.append("create")
+        # The episode is created, but the response never reaches the client.
+        server.append({"id": 9, "slug": "vid", "published_at": None})
+        return httpx.Response(502)
+
+    audio = tmp_path / "vid.mp3"
+    audio.write_bytes(b"audio")
+    episode = EpisodeRecord("vid", "Vid", None, None, "20240101", None, audio, None, None, None, None)
+    playlist_entry = PipelinePlaylist(
+        playlist=Playlist(id=1, youtube_playlist_id="PLfake", title="Show", channel_id=1),
+        schedules=[],
+    )
+    journal = PlaylistJournal(tmp_path)
+    client = _client(httpx.MockTransport(_handle))
+    try:
+        await upload_playlist_to_castopod(
+            client,
+            playlist_entry,
+            DownloadResult("url", 1, False, [episode], None),
+            podcast_id=7,
+            journal=journal,
+        )
+    finally:
+        await client.close()
+
+    # The first GET fills the slug cache before the upload.
+    assert calls == ["lookup", "create", "lookup", "publish"]
+    state = journal.get("vid")
+    assert state is not None and state.stage == "published"
+
+
+async def test_next_run_publishes_an_episode_whose_publish_failed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(runner, "CASTOPOD_RETRY_BASE_SECONDS", 0)
+    calls: list[str] = []
+    publish_status = 503
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=[{"id": 4, "slug": "vid", "published_at": None}])
+        if request.url.path.endswith("/publish"):
+            calls.append("publish")
+            return httpx.Response(publish_status, json={})
+        calls.append("create")
+        return httpx.Response(201, json={"id": 4})
+
+    audio = tmp_path / "vid.mp3"
+    audio.write_bytes(b"audio")
+    episode = EpisodeRecord("vid", "Vid", None, None, "20240101", None, audio, None, None, None, None)
+    playlist_entry = PipelinePlaylist(
+        playlist=Playlist(id=1, youtube_playlist_id="PLfake", title="Show", channel_id=1),
+        schedules=[],
+    )
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        # First run: the episode is created, but every publish attempt fails.
+        journal = PlaylistJournal(tmp_path)
+        journal.record("vid", "transcoded", episode=runner._episode_payload(episode))
+        client = _client(httpx.MockTransport(_handle))
+        try:
+            await upload_playlist_to_castopod(
+                client,
+                playlist_entry,
+                DownloadResult("url", 1, False, [episode], None),
+                podcast_id=7,
+                archive=archive,
+                journal=journal,
+            )
+        finally:
+            await client.close()
+        journal.complete_run()
+        assert archive.video_ids(1, ("uploaded",)) == set()
+
+        # Second run: the journaled id is published without uploading again.
+        publish_status = 200
+        calls.clear()
+        journal = PlaylistJournal(tmp_path)
+        client = _client(httpx.MockTransport(_handle))
+        try:
+            published = await runner.publish_journaled_uploads(
+                client, 7, playlist_entry.playlist, journal, archive
+            )
+        finally:
+            await client.close()
+        assert published == 1
+        assert calls == ["publish"]
+        assert archive.video_ids(1, ("uploaded",)) == {"vid"}
+    finally:
+        archive.close()
+    state = PlaylistJournal(tmp_path).get("vid")
+    assert state is not None and state.stage == "published"
+
+
+async def test_cancelling_the_job_stops_uploads_in_flight(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(runner, "CANCEL_POLL_SECONDS", 0.01)
+    created: list[str] = []
+    started = asyncio.Event()
+
+    async def _handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=[])
+        created.append(request.url.path)
+        started.set()
+        await asyncio.sleep(10)  # a long audio upload
+        return httpx.Response(201, json={"id": len(created)})
+
+    episodes = []
+    for number in range(4):
+        audio = tmp_path / f"vid-{number}.mp3"
+        audio.write_bytes(b"audio")
+        episodes.append(
+            EpisodeRecord(f"vid-{number}", "Vid", None, None, None, None, audio, None, None, None, None)
+        )
+    playlist_entry = PipelinePlaylist(
+        playlist=Playlist(id=1, youtube_playlist_id="PLfake", title="Show", channel_id=1),
+        schedules=[],
+    )
+    cancel_event = threading.Event()
+
+    class _Tracker:
+        async def ensure_active(self) -> None:
+            return None
+
+        async def patch(self, **fields: Any) -> None:
+            return None
+
+        @property
+        def cancel_event(self) -> threading.Event:
+            return cancel_event
+
+    async def _cancel_when_started() -> None:
+        await started.wait()
+        cancel_event.set()
+
+    client = _client(httpx.MockTransport(_handle), max_concurrency=1)
+    canceller = asyncio.create_task(_cancel_when_started())
+    try:
+        with pytest.raises(runner.JobCancelledError):
+            await asyncio.wait_for(
+                upload_playlist_to_castopod(
+                    client,
+                    playlist_entry,
+                    DownloadResult("url", len(episodes), False, episodes, None),
+                    podcast_id=7,
+                    job_tracker=_Tracker(),  # type: ignore[arg-type]
+                ),
+                timeout=5,
+            )
+    finally:
+        await canceller
+        await client.close()
+
+    assert len(created) == 1
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pipeline_client.client import (
+    Channel,
+    Job,
+    PipelineChannel,
+    PipelineConfiguration,
+    PipelinePlaylist,
+    Playlist,
+)
+from pipeline_runner.main import (
+    DownloadResult,
+    RunnerSettings,
+    process_configuration,
+    process_job_queue,
+)
+
+runner = importlib.import_module("pipeline_runner.main")
+
+
+def _configuration(playlists_per_channel: dict[int, int]) -> PipelineConfiguration:
+    channels = []
+    next_id = 1
+    for channel_id, count in playlists_per_channel.items():
+        playlists = []
+        for _ in range(count):
+            playlists.append(
+                PipelinePlaylist(
+                    playlist=Playlist(
+                        id=next_id,
+                        youtube_playlist_id=f"PL{next_id}",
+                        title=f"Playlist {next_id}",
+                        channel_id=channel_id,
+                    ),
+                    schedules=[],
+                )
+            )
+            next_id += 1
+        channels.append(
+            PipelineChannel(
+                channel=Channel(id=channel_id, slug=f"ch{channel_id}", title=f"Channel {channel_id}"),
+                playlists=playlists,
+            )
+        )
+    return PipelineConfiguration(fetched_at=datetime.now(UTC), channels=channels)
+
+
+class _ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.active: Counter[int] = Counter()
+        self.peak_total = 0
+        self.peak_channel: Counter[int] = Counter()
+
+    async def process(
+        self, client: Any, channel_entry: PipelineChannel, playlist_entry: PipelinePlaylist, *args: Any, **kwargs: Any
+    ) -> DownloadResult:
+        channel_id = channel_entry.channel.id
+        self.active[channel_id] += 1
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        self.peak_channel[channel_id] = max(self.peak_channel[channel_id], self.active[channel_id])
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.active[channel_id] -= 1
+        return DownloadResult(
+            playlist_url=playlist_entry.playlist.youtube_playlist_id,
+            downloaded=0,
+            dry_run=True,
+            episodes=[],
+            playlist_info=None,
+        )
+
+
+async def test_process_configuration_respects_overall_and_channel_caps(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    probe = _ConcurrencyProbe()
+    monkeypatch.setattr(runner, "process_playlist_entry", probe.process)
+    config = _configuration({1: 4, 2: 2, 3: 1})
+
+    results = await process_configuration(
+        None,  # type: ignore[arg-type]
+        config,
+        tmp_path,
+        "mp3",
+        True,
+        None,
+        settings=RunnerSettings(playlist_concurrency=4, channel_concurrency=2),
+    )
+
+    assert [result.playlist_url for result in results] == [f"PL{index}" for index in range(1, 8)]
+    assert probe.peak_total == 4
+    assert max(probe.peak_channel.values()) == 2
+
+
+def test_channel_concurrency_defaults_to_overall_cap() -> None:
+    assert RunnerSettings(playlist_concurrency=3).channel_concurrency_limit == 3
+    assert RunnerSettings(playlist_concurrency=3, channel_concurrency=5).channel_concurrency_limit == 3
+    assert RunnerSettings(playlist_concurrency=3, channel_concurrency=1).channel_concurrency_limit == 1
+
+
+class _FakeJobClient:
+    def __init__(self, jobs: list[Job]) -> None:
+        self.jobs = {job.id: job for job in jobs}
+
+    async def fetch_jobs(self) -> list[Job]:
+        return list(self.jobs.values())
+
+    async def fetch_job(self, job_id: int) -> Job:
+        return self.jobs[job_id]
+
+    async def update_job(self, job_id: int, **fields: Any) -> Job:
+        job = self.jobs[job_id].model_copy(update=fields)
+        self.jobs[job_id] = job
+        return job
+
+
+def _job(job_id: int, playlist_id: int) -> Job:
+    now = datetime.now(UTC)
+    return Job(
+        id=job_id,
+        playlist_id=playlist_id,
+        action="download",
+        status="queued",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def test_process_job_queue_runs_slots_without_overlapping_playlists(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    running: Counter[int] = Counter()
+    peak_per_playlist: Counter[int] = Counter()
+    peak_total = 0
+    watched: list[bool] = []
+
+    async def _process(
+        client: Any, channel_entry: PipelineChannel, playlist_entry: PipelinePlaylist, *args: Any, **kwargs: Any
+    ) -> DownloadResult:
+        nonlocal peak_total
+        playlist_id = playlist_entry.playlist.id
+        watched.append(kwargs["job_tracker"]._watch_task is not None)
+        running[playlist_id] += 1
+        peak_total = max(peak_total, sum(running.values()))
+        peak_per_playlist[playlist_id] = max(peak_per_playlist[playlist_id], running[playlist_id])
+        await asyncio.sleep(0.02)
+        running[playlist_id] -= 1
+        return DownloadResult(
+            playlist_url=playlist_entry.playlist.youtube_playlist_id,
+            downloaded=0,
+            dry_run=True,
+            episodes=[],
+            playlist_info=None,
+        )
+
+    monkeypatch.setattr(runner, "process_playlist_entry", _process)
+    # playlist 1 has three queued jobs, playlists 2 and 3 one each
+    client = _FakeJobClient([_job(1, 1), _job(2, 1), _job(3, 2), _job(4, 1), _job(5, 3)])
+
+    results = await process_job_queue(
+        client,  # type: ignore[arg-type]
+        _configuration({1: 3}),
+        tmp_path,
+        "mp3",
+        True,
+        None,
+        settings=RunnerSettings(job_slots=3),
+    )
+
+    assert len(results) == 5
+    assert peak_total == 3
+    assert peak_per_playlist[1] == 1
+    assert all(watched)
+    assert {job.status for job in client.jobs.values()} == {"finished"}
+
+
+async def test_process_configuration_waits_for_other_playlists_when_one_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    finished: list[int] = []
+
+    async def _process(
+        client: Any, channel_entry: PipelineChannel, playlist_entry: PipelinePlaylist, *args: Any, **kwargs: Any
+    ) -> DownloadResult:
+        playlist_id = playlist_entry.playlist.id
+        if playlist_id == 1:
+            raise RuntimeError("podcast lookup failed")
+        await asyncio.sleep(0.05)
+        finished.append(playlist_id)
+        return DownloadResult(
+            playlist_url=playlist_entry.playlist.youtube_playlist_id,
+            downloaded=0,
+            dry_run=True,
+            episodes=[],
+            playlist_info=None,
+        )
+
+    monkeypatch.setattr(runner, "process_playlist_entry", _process)
+
+    results = await process_configuration(
+        None,  # type: ignore[arg-type]
+        _configuration({1: 3}),
+        tmp_path,
+        "mp3",
+        True,
+        None,
+        settings=RunnerSettings(playlist_concurrency=3),
+    )
+
+    assert sorted(finished) == [2, 3]
+    assert [result.playlist_url for result in results] == ["PL2", "PL3"]
+
+
+async def test_process_job_queue_waits_for_other_jobs_when_one_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _process(
+        client: Any, channel_entry: PipelineChannel, playlist_entry: PipelinePlaylist, *args: Any, **kwargs: Any
+    ) -> DownloadResult:
+        await asyncio.sleep(0.05)
+        return DownloadResult(
+            playlist_url=playlist_entry.playlist.youtube_playlist_id,
+            downloaded=0,
+            dry_run=True,
+            episodes=[],
+            playlist_info=None,
+        )
+
+    class _FailingJobClient(_FakeJobClient):
+        async def update_job(self, job_id: int, **fields: Any) -> Job:
+            if job_id == 1:
+                raise RuntimeError("automation service unavailable")
+            return await super().update_job(job_id, **fields)
+
+    monkeypatch.setattr(runner, "process_playlist_entry", _process)
+    client = _FailingJobClient([_job(1, 1), _job(2, 2), _job(3, 3)])
+
+    results = await process_job_queue(
+        client,  # type: ignore[arg-type]
+        _configuration({1: 3}),
+        tmp_path,
+        "mp3",
+        True,
+        None,
+        settings=RunnerSettings(job_slots=3),
+    )
+
+    assert len(results) == 2
+    assert client.jobs[2].status == "finished" and client.jobs[3].status == "finished"
@@ -0,0 +1,712 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pipeline_client.client import PipelinePlaylist, Playlist
+from pipeline_runner.adaptive import AdaptiveConcurrency
+from pipeline_runner.archive import DownloadArchive
+from pipeline_runner.journal import PlaylistJournal
+from pipeline_runner.listing import listing_fingerprint, newest_first, save_listing_state
+from pipeline_runner.metacache import MetadataCache
+from pipeline_runner.ratelimit import RateLimiter
+from pipeline_runner.transcode import AudioPlan, AudioPolicy, plan_audio
+from pipeline_runner.videoindex import VideoIndex, media_key
+from pipeline_runner.main import (
+    JobCancelledError,
+    RunnerSettings,
+    StageProgress,
+    _hand_off_episode,
+    download_playlist,
+    stream_episodes_to_castopod,
+)
+
+# ``pipeline_runner.main`` is shadowed by the re-exported ``main`` function.
+runner = importlib.import_module("pipeline_runner.main")
+
+VIDEOS = [
+    {"id": "vid-c", "title": "Third", "upload_date": "20240103"},
+    {"id": "vid-a", "title": "First", "upload_date": "20240101"},
+    {"id": "vid-b", "title": "Second", "upload_date": "20240102"},
+    {"id": "vid-d", "title": "Fourth", "upload_date": "20240104"},
+]
+
+
+class FakeYoutubeDL:
+    instances: list["FakeYoutubeDL"] = []
+    processed: list[str] = []
+    downloaded: list[str] = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    delay = 0.05
+
+    def __init__(self, opts: dict[str, Any]) -> None:
+        self.opts = opts
+        self.busy = False
+        FakeYoutubeDL.instances.append(self)
+
+    def __enter__(self) -> "FakeYoutubeDL":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.instances = []
+        cls.processed = []
+        cls.downloaded = []
+        cls.active = 0
+        cls.peak = 0
+
+    def extract_info(self, url: str, download: bool = False) -> dict[str, Any] | None:
+        if "playlist?list=" in url:
+            if self.opts.get("extract_flat"):
+                entries = [
+                    {
+                        "_type": "url",
+                        "id": video["id"],
+                        "title": video["title"],
+                        "url": f"https://www.youtube.com/watch?v={video['id']}",
+                    }
+                    for video in VIDEOS
+                ]
+            else:
+                entries = [
+                    self._resolve(video, f"https://www.youtube.com/watch?v={video['id']}")
+                    for video in VIDEOS
+                ]
+            return {"id": "PLfake", "entries": entries}
+        assert not self.busy, "YoutubeDL instance shared between workers"
+        self.busy = True
+        with FakeYoutubeDL.lock:
+            FakeYoutubeDL.active += 1
+            FakeYoutubeDL.peak = max(FakeYoutubeDL.peak, FakeYoutubeDL.active)
+        try:
+            time.sleep(FakeYoutubeDL.delay)
+            video_id = url.rsplit("=", 1)[-1]
+            info = next(
+                self._resolve(video, url) for video in VIDEOS if video["id"] == video_id
+            )
+            self.urlopen(url)  # watch page
+            self.urlopen(url)  # player / signature
+            if download:
+                self._download(info)
+            return info
+        finally:
+            with FakeYoutubeDL.lock:
+                FakeYoutubeDL.active -= 1
+            self.busy = False
+
+    def process_ie_result(self, info: dict[str, Any], download: bool = True) -> dict[str, Any]:
+        FakeYoutubeDL.processed.append(info["id"])
+        if download:
+            self._download(info)
+        return info
+
+    def urlopen(self, request: Any) -> None:
+        return None
+
+    def _resolve(self, video: dict[str, Any], url: str) -> dict[str, Any]:
+        return {
+            **video,
+            "webpage_url": url,
+            "formats": [{"format_id": "251", "url": "https://media.example/251"}],
+        }
+
+    def _download(self, info: dict[str, Any]) -> None:
+        self.urlopen(info["webpage_url"])  # media
+        raw_path = Path(self.prepare_filename(info))
+        raw_path.touch()
+        if self.opts.get("writeinfojson"):
+            raw_path.with_suffix(".info.json").write_text(json.dumps(info), encoding="utf-8")
+        if self.opts.get("postprocessors"):
+            raw_path.with_suffix(".mp3").touch()
+        FakeYoutubeDL.downloaded.append(info["id"])
+
+    def prepare_filename(self, info: dict[str, Any]) -> str:
+        template = Path(self.opts["outtmpl"])
+        return str(template.parent / f"{info['upload_date']}_{info['title']}.webm")
+
+
+@pytest.fixture()
+def fake_ydl(monkeypatch: pytest.MonkeyPatch) -> type[FakeYoutubeDL]:
+    FakeYoutubeDL.reset()
+    monkeypatch.setattr(runner, "YoutubeDL", FakeYoutubeDL)
+    return FakeYoutubeDL
+
+
+class _StubPool:
+    def __init__(self) -> None:
+        self.calls: list[tuple[Path, Path, str, bool]] = []
+
+    async def transcode(
+        self, source: Path, destination: Path, audio_format: str, copy: bool = False
+    ) -> tuple[Path, float]:
+        self.calls.append((source, destination, audio_format, copy))
+        destination.touch()
+        return destination, 0.0 if copy else 1.5
+
+
+def _playlist(**options: Any) -> PipelinePlaylist:
+    return PipelinePlaylist(
+        playlist=Playlist(
+            id=1,
+            youtube_playlist_id="PLfake",
+            title="Fake",
+            channel_id=1,
+            pipeline_options=options,
+        ),
+        schedules=[],
+    )
+
+
+async def test_download_playlist_worker_pool_keeps_episode_order(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    result = await download_playlist(
+        _playlist(), tmp_path, "mp3", dry_run=False, download_workers=3
+    )
+
+    assert [episode.video_id for episode in result.episodes] == [
+        "vid-a",
+        "vid-b",
+        "vid-c",
+        "vid-d",
+    ]
+    assert result.downloaded == 4
+    assert fake_ydl.peak > 1
+    # one metadata instance plus one per worker
+    assert len(fake_ydl.instances) == 4
+
+
+async def test_download_playlist_honours_cancel_event(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    class _Tracker:
+        cancel_event = threading.Event()
+
+    tracker = _Tracker()
+    tracker.cancel_event.set()
+
+    with pytest.raises(JobCancelledError):
+        await download_playlist(
+            _playlist(),
+            tmp_path,
+            "mp3",
+            dry_run=False,
+            job_tracker=tracker,  # type: ignore[arg-type]
+            download_workers=2,
+        )
+
+
+def test_runner_settings_playlist_override() -> None:
+    settings = RunnerSettings(download_workers=2)
+
+    assert settings.download_workers_for(_playlist().playlist) == 2
+    assert settings.download_workers_for(_playlist(download_workers=5).playlist) == 5
+    assert settings.download_workers_for(_playlist(download_workers="bad").playlist) == 2
+
+
+async def test_download_playlist_hands_raw_streams_to_transcode_pool(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    pool = _StubPool()
+    result = await download_playlist(
+        _playlist(),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        download_workers=2,
+        transcode_pool=pool,  # type: ignore[arg-type]
+    )
+
+    assert result.downloaded == 4
+    assert all("postprocessors" not in ydl.opts for ydl in fake_ydl.instances)
+    sources = sorted(call[0].name for call in pool.calls)
+    assert sources[0] == "20240101_First.webm"
+    assert all(call[1].suffix == ".mp3" and not call[3] for call in pool.calls)
+    assert result.transcode_cpu_seconds == pytest.approx(6.0)
+
+
+def test_plan_audio_negotiates_passthrough() -> None:
+    policy = AudioPolicy.from_values(["opus", "m4a"], min_abr=96)
+
+    assert plan_audio({"acodec": "opus", "ext": "webm", "abr": 130}, "mp3", policy) == AudioPlan(
+        "remux", "opus"
+    )
+    assert plan_audio({"acodec": "mp4a.40.2", "ext": "m4a", "abr": 128}, "mp3", policy) == (
+        AudioPlan("passthrough", "m4a")
+    )
+    assert plan_audio({"acodec": "opus", "ext": "webm", "abr": 48}, "mp3", policy).action == "encode"
+    assert plan_audio({"acodec": "opus", "ext": "webm"}, "mp3", None) == AudioPlan("encode", "mp3")
+
+
+async def test_download_playlist_remuxes_acceptable_codecs(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    original_resolve = FakeYoutubeDL._resolve
+
+    def _resolve(self: FakeYoutubeDL, video: dict[str, Any], url: str) -> dict[str, Any]:
+        return {**original_resolve(self, video, url), "acodec": "opus", "ext": "webm", "abr": 130}
+
+    monkeypatch.setattr(FakeYoutubeDL, "_resolve", _resolve)
+    pool = _StubPool()
+    settings = RunnerSettings(passthrough_codecs=("aac",))
+    playlist_entry = _playlist(passthrough_codecs="opus")
+    result = await download_playlist(
+        playlist_entry,
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        transcode_pool=pool,  # type: ignore[arg-type]
+        audio_policy=settings.audio_policy_for(playlist_entry.playlist),
+    )
+
+    assert all(call[3] and call[1].suffix == ".opus" for call in pool.calls)
+    assert {episode.audio_action for episode in result.episodes} == {"remux"}
+    assert all(episode.audio_path.suffix == ".opus" for episode in result.episodes)
+    assert result.transcode_cpu_seconds == 0.0
+
+
+async def test_download_playlist_skips_unchanged_flat_listing(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    first = await download_playlist(_playlist(), tmp_path, "mp3", dry_run=False)
+
+    assert fake_ydl.instances[0].opts["extract_flat"] == "in_playlist"
+    assert first.downloaded == 4
+    assert first.listing_fingerprint is not None
+
+    save_listing_state(tmp_path, first.listing_fingerprint, first.listing_count)
+    fake_ydl.reset()
+    second = await download_playlist(_playlist(), tmp_path, "mp3", dry_run=False)
+
+    assert second.unchanged
+    assert second.downloaded == 0
+    # only the listing instance was created
+    assert len(fake_ydl.instances) == 1
+
+
+async def test_download_playlist_retries_pending_entries_when_nothing_is_known_yet(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    first = await download_playlist(_playlist(), tmp_path, "mp3", dry_run=False)
+    assert first.listing_fingerprint is not None
+    save_listing_state(tmp_path, first.listing_fingerprint, first.listing_count)
+    fake_ydl.reset()
+
+    # Empty Castopod podcast and nothing archived as uploaded: all entries are pending.
+    second = await download_playlist(
+        _playlist(),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        existing_slugs=set(),
+        known_video_ids=set(),
+    )
+
+    assert not second.unchanged
+    assert second.downloaded == 4
+
+
+async def test_download_playlist_reuses_resolved_info(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    result = await download_playlist(
+        _playlist(), tmp_path, "mp3", dry_run=False, listing_mode="full"
+    )
+
+    assert sorted(fake_ydl.processed) == ["vid-a", "vid-b", "vid-c", "vid-d"]
+    assert all(episode.reused_info for episode in result.episodes)
+    assert [episode.request_count for episode in result.episodes] == [1, 1, 1, 1]
+
+    fake_ydl.reset()
+    flat = await download_playlist(
+        _playlist(), tmp_path / "flat", "mp3", dry_run=False, listing_mode="flat"
+    )
+
+    assert fake_ydl.processed == []
+    assert flat.request_count == 12
+
+
+def test_formats_expired_reads_expire_parameter() -> None:
+    soon = int(time.time()) + 10
+    later = int(time.time()) + 6 * 3600
+
+    assert runner._formats_expired({"url": f"https://media.example/a?expire={soon}"})
+    assert not runner._formats_expired({"url": f"https://media.example/a?expire={later}"})
+    assert not runner._formats_expired({"url": "https://media.example/a"})
+
+
+async def test_download_playlist_records_and_skips_archived_videos(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        archive.record(1, "vid-a", "uploaded")
+        result = await download_playlist(
+            _playlist(),
+            tmp_path / "playlist",
+            "mp3",
+            dry_run=False,
+            archive=archive,
+            known_video_ids=archive.video_ids(1, ("transcoded", "uploaded")),
+        )
+
+        assert [episode.video_id for episode in result.episodes] == ["vid-b", "vid-c", "vid-d"]
+        assert archive.status(1, "vid-a") == "uploaded"
+        assert archive.video_ids(1, ("transcoded",)) == {"vid-b", "vid-c", "vid-d"}
+    finally:
+        archive.close()
+
+
+async def test_streaming_uploads_start_before_playlist_finishes(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    uploads: list[tuple[str, int]] = []
+
+    class _StubCastopod:
+        max_concurrency = 1
+
+        async def create_episode(
+            self, podcast_id: int, slug: str, *args: Any, **kwargs: Any
+        ) -> dict[str, Any]:
+            uploads.append((slug, len(fake_ydl.downloaded)))
+            return {"id": len(uploads)}
+
+        async def publish_episode(self, episode_id: int, *args: Any) -> None:
+            return None
+
+    playlist_entry = _playlist()
+    progress = StageProgress()
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=1)
+    consumer = asyncio.create_task(
+        stream_episodes_to_castopod(
+            queue,
+            _StubCastopod(),  # type: ignore[arg-type]
+            playlist_entry.playlist,
+            tmp_path,
+            podcast_id=7,
+            progress=progress,
+        )
+    )
+
+    async def _on_episode(episode: Any) -> None:
+        await _hand_off_episode(queue, consumer, episode)
+
+    result = await download_playlist(
+        playlist_entry,
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        progress=progress,
+        on_episode=_on_episode,
+    )
+    await _hand_off_episode(queue, consumer, None)
+    await consumer
+
+    assert result.downloaded == 4
+    assert progress.total == progress.downloaded == progress.uploaded == 4
+    assert uploads[0][1] < 4
+
+
+async def test_download_playlist_resumes_from_journal_without_listing(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    journal = PlaylistJournal(tmp_path)
+    first = await download_playlist(
+        _playlist(),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        journal=journal,
+        journal_target_stage="published",
+    )
+    assert first.downloaded == 4
+    # the run was interrupted before any upload; one audio file went missing
+    first.episodes[0].audio_path.unlink()
+
+    fake_ydl.reset()
+    resumed = await download_playlist(
+        _playlist(),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        journal=PlaylistJournal(tmp_path),
+        journal_target_stage="published",
+    )
+
+    assert resumed.downloaded == 4
+    assert fake_ydl.downloaded == ["vid-a"]
+    # no listing instance: only the download worker was created
+    assert len(fake_ydl.instances) == 1
+
+
+async def test_download_playlist_retries_throttled_requests_through_shared_limiter(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _TooManyRequests(Exception):
+        status = 429
+        headers = {"Retry-After": "3"}
+
+    throttled = {"left": 1}
+
+    def _urlopen(self: FakeYoutubeDL, request: Any) -> None:
+        if "vid-b" in str(request) and throttled["left"]:
+            throttled["left"] -= 1
+            raise _TooManyRequests()
+
+    clock = {"now": 0.0}
+    sleeps: list[float] = []
+
+    def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(FakeYoutubeDL, "urlopen", _urlopen)
+    limiter = RateLimiter(0.0, clock=lambda: clock["now"], sleep=_sleep)
+    result = await download_playlist(
+        _playlist(), tmp_path, "mp3", dry_run=False, download_workers=2, rate_limiter=limiter
+    )
+
+    assert result.downloaded == 4
+    assert limiter.throttle_events == 1
+    assert sleeps[0] == 3.0
+    episode = next(episode for episode in result.episodes if episode.video_id == "vid-b")
+    assert episode.request_count == 4
+    assert result.throttled_seconds > 0
+
+
+async def test_download_playlist_adapts_worker_count(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    class _Tracker:
+        cancel_event = threading.Event()
+        messages: list[str] = []
+
+        async def patch(self, **fields: Any) -> None:
+            self.messages.append(fields["progress_message"])
+
+    tracker = _Tracker()
+    controller = AdaptiveConcurrency(1, maximum=3)
+    result = await download_playlist(
+        _playlist(),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        job_tracker=tracker,  # type: ignore[arg-type]
+        controller=controller,
+    )
+
+    assert result.downloaded == 4
+    # one listing instance plus the controller's maximum number of workers
+    assert len(fake_ydl.instances) == 4
+    assert controller.history and controller.history[0].limit == 2
+    assert fake_ydl.peak <= max(change.limit for change in controller.history)
+    assert any(message.startswith("동시 다운로드 1→2") for message in tracker.messages)
+
+
+async def test_download_playlist_serves_fresh_cached_info_without_extraction(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    first = await download_playlist(
+        _playlist(), tmp_path, "mp3", dry_run=False, metadata_cache=MetadataCache(tmp_path, 3600)
+    )
+    assert first.downloaded == 4
+    assert (tmp_path / "metadata" / "info-cache.json").exists()
+    for episode in first.episodes:
+        episode.audio_path.touch()
+    # vid-d's cached metadata is older than the TTL and has to be revalidated
+    stale = next(episode for episode in first.episodes if episode.video_id == "vid-d")
+    assert stale.info_path is not None
+    os.utime(stale.info_path, (0, 0))
+    (tmp_path / "metadata" / "info-cache.json").unlink()
+
+    fake_ydl.reset()
+    cache = MetadataCache(tmp_path, 3600)
+    second = await download_playlist(_playlist(), tmp_path, "mp3", dry_run=False, metadata_cache=cache)
+
+    assert second.downloaded == 4
+    assert fake_ydl.downloaded == ["vid-d"]
+    assert (cache.hits, cache.stale) == (3, 1)
+    cached = [episode for episode in second.episodes if episode.cached_info]
+    assert [episode.video_id for episode in cached] == ["vid-a", "vid-b", "vid-c"]
+    assert all(episode.request_count == 0 for episode in cached)
+    # revalidated lazily: the fresh extraction replaced the stale entry
+    assert cache.lookup("vid-d").fetched_at > 1_000_000  # type: ignore[union-attr]
+
+
+async def test_download_playlist_links_videos_from_other_playlists(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    index = VideoIndex.open(tmp_path)
+    try:
+        first = await download_playlist(
+            _playlist(), tmp_path / "one", "mp3", dry_run=False, video_index=index
+        )
+        assert first.downloaded == 4
+
+        fake_ydl.reset()
+        other = _playlist()
+        other.playlist.id = 2
+        second = await download_playlist(
+            other, tmp_path / "two", "mp3", dry_run=False, video_index=index
+        )
+
+        assert second.downloaded == 4
+        assert fake_ydl.downloaded == []
+        assert all(episode.shared_media == "hardlink" for episode in second.episodes)
+        for original, shared in zip(first.episodes, second.episodes):
+            assert shared.audio_path.parent == tmp_path / "two"
+            assert shared.audio_path.samefile(original.audio_path)
+            assert shared.info_path is not None and shared.info_path.exists()
+        # a different passthrough policy is a different media key
+        assert index.lookup("vid-a", media_key("mp3", AudioPolicy.from_values(["opus"]))) is None
+    finally:
+        index.close()
+
+
+async def test_download_playlist_processes_newest_entries_first(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    result = await download_playlist(
+        _playlist(),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        listing_mode="full",
+        processing_order="newest",
+    )
+
+    assert fake_ydl.downloaded == ["vid-d", "vid-c", "vid-b", "vid-a"]
+    # playlist.json is written from the chronological episode list
+    assert [episode.video_id for episode in result.episodes] == ["vid-a", "vid-b", "vid-c", "vid-d"]
+
+
+
+async def test_newest_first_keeps_listing_order_when_newest_on_top_is_set(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    # flat listings carry no upload dates, so only the listing position orders them
+    await download_playlist(
+        _playlist(newest_on_top=True),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        listing_mode="flat",
+        processing_order="newest",
+    )
+
+    assert fake_ydl.downloaded == ["vid-c", "vid-a", "vid-b", "vid-d"]
+
+def test_newest_first_orders_undated_entries_and_defaults_per_run_kind() -> None:
+    entries = [{"id": "old"}, {"id": "dated", "upload_date": "20240105"}, {"id": "new"}]
+
+    assert [entry["id"] for entry in newest_first(entries)] == ["dated", "new", "old"]
+    assert [entry["id"] for entry in newest_first(entries, newest_at_top=True)] == [
+        "dated",
+        "old",
+        "new",
+    ]
+    settings = RunnerSettings()
+    assert settings.processing_order_for(_playlist().playlist, scheduled=True) == "newest"
+    assert settings.processing_order_for(_playlist().playlist, scheduled=False) == "playlist"
+    pinned = _playlist(processing_order="playlist").playlist
+    assert settings.processing_order_for(pinned, scheduled=True) == "playlist"
+
+
+async def test_incremental_listing_stops_at_a_run_of_known_videos(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    yielded: list[str] = []
+
+    class _LazyYoutubeDL(FakeYoutubeDL):
+        def extract_info(
+            self, url: str, download: bool = False, process: bool = True
+        ) -> dict[str, Any] | None:
+            if "playlist?list=" not in url:
+                return super().extract_info(url, download)
+            assert not process
+
+            def _entries() -> Any:
+                for video_id in ["vid-d", "vid-c", *(f"old-{n}" for n in range(3000))]:
+                    yielded.append(video_id)
+                    yield {"_type": "url", "id": video_id, "url": f"https://www.youtube.com/watch?v={video_id}"}
+
+            return {"id": "UUfake", "title": "Uploads", "entries": _entries()}
+
+    monkeypatch.setattr(runner, "YoutubeDL", _LazyYoutubeDL)
+    result = await download_playlist(
+        _playlist(newest_on_top=True),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        listing_mode="incremental",
+        known_video_ids={f"old-{n}" for n in range(3000)},
+    )
+
+    assert len(yielded) == 2 + runner.INCREMENTAL_KNOWN_RUN
+    assert sorted(fake_ydl.downloaded) == ["vid-c", "vid-d"]
+    assert result.listing_count == len(yielded)
+    assert isinstance(result.playlist_info["entries"], list)  # type: ignore[index]
+
+
+async def test_sharded_listing_merges_windows_in_order_and_retries_failures(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    listing = [f"old-{n:03d}" for n in range(95)]
+    attempts: list[str] = []
+
+    class _WindowedYoutubeDL(FakeYoutubeDL):
+        def extract_info(self, url: str, download: bool = False) -> dict[str, Any] | None:
+            if "playlist?list=" not in url:
+                return super().extract_info(url, download)
+            window = self.opts["playlist_items"]
+            attempts.append(window)
+            if window == "21-40" and attempts.count(window) == 1:
+                return None  # ignoreerrors turns a failed extraction into None
+            first, last = (int(value) for value in window.split("-"))
+            time.sleep(0.01)
+            entries = [{"_type": "url", "id": video_id} for video_id in listing[first - 1 : last]]
+            return {"id": "PLfake", "title": "Fake", "entries": entries}
+
+    monkeypatch.setattr(runner, "YoutubeDL", _WindowedYoutubeDL)
+    result = await download_playlist(
+        _playlist(),
+        tmp_path,
+        "mp3",
+        dry_run=False,
+        known_video_ids=set(listing),
+        listing_mode="full",
+        listing_window=20,
+        listing_shards=3,
+    )
+
+    assert result.listing_count == 95
+    assert result.listing_fingerprint == listing_fingerprint(listing)
+    assert result.downloaded == 0
+    assert attempts.count("21-40") == 2
+    # the playlist ends inside the second batch; later windows are not requested
+    assert "121-140" not in attempts
+
+
+
+async def test_flat_listing_ignores_the_listing_window(
+    tmp_path: Path, fake_ydl: type[FakeYoutubeDL]
+) -> None:
+    result = await download_playlist(
+        _playlist(), tmp_path, "mp3", dry_run=False, listing_mode="flat", listing_window=2
+    )
+
+    assert result.listing_count == len(VIDEOS)
+    assert all("playlist_items" not in instance.opts for instance in fake_ydl.instances)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from pipeline_client.client import Channel, PipelineChannel, PipelinePlaylist, Playlist
+from pipeline_runner.archive import DownloadArchive
+from pipeline_runner.feed import check_feed, load_feed_state, parse_feed_video_ids
+from pipeline_runner.main import RunnerSettings, process_playlist_entry
+
+runner = importlib.import_module("pipeline_runner.main")
+
+ETAG = '"feed-v1"'
+
+
+def _atom(video_ids: list[str]) -> bytes:
+    entries = "".join(
+        f"<entry><id>yt:video:{video_id}</id><yt:videoId>{video_id}</yt:videoId>"
+        f"<title>{video_id}</title></entry>"
+        for video_id in video_ids
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+        'xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Fake</title>{entries}</feed>"
+    ).encode("utf-8")
+
+
+class _FeedServer:
+    """Stand-in for youtube.com/feeds that honours If-None-Match."""
+
+    def __init__(self) -> None:
+        self.video_ids = ["vid-b", "vid-a"]
+        self.requests: list[dict[str, str]] = []
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                server.requests.append({"path": self.path, **dict(self.headers)})
+                if self.headers.get("If-None-Match") == ETAG:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = _atom(server.video_ids)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/atom+xml")
+                self.send_header("ETag", ETAG)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                return None
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/feeds/videos.xml?playlist_id={{playlist_id}}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture()
+def feed_server() -> Iterator[_FeedServer]:
+    server = _FeedServer()
+    try:
+        yield server
+    finally:
+        server.close()
+
+
+def test_parse_feed_video_ids() -> None:
+    assert parse_feed_video_ids(_atom(["x1", "x2"])) == ["x1", "x2"]
+
+
+def test_check_feed_uses_conditional_get(feed_server: _FeedServer) -> None:
+    url = feed_server.url.format(playlist_id="PLfake")
+
+    first, state = check_feed(url, None, lambda video_id: video_id == "vid-a")
+    assert first.new_ids == ["vid-b"] and not first.unchanged
+    assert state.etag == ETAG
+
+    second, _state = check_feed(url, state, lambda video_id: True)
+    assert second.not_modified and second.unchanged
+    assert second.video_ids == ["vid-b", "vid-a"]
+    assert feed_server.requests[-1]["If-None-Match"] == ETAG
+
+
+class _StubClient:
+    def __init__(self) -> None:
+        self.updates: list[dict[str, Any]] = []
+
+    async def create_run(self, playlist_id: int, **fields: Any) -> SimpleNamespace:
+        return SimpleNamespace(id=1)
+
+    async def update_run(self, run_id: int, **fields: Any) -> None:
+        self.updates.append(fields)
+
+
+def _entries(newest_on_top: bool = True) -> tuple[PipelineChannel, PipelinePlaylist]:
+    playlist = PipelinePlaylist(
+        playlist=Playlist(
+            id=1,
+            youtube_playlist_id="PLfake",
+            title="Fake",
+            channel_id=1,
+            pipeline_options={"newest_on_top": newest_on_top},
+        ),
+        schedules=[],
+    )
+    channel = PipelineChannel(channel=Channel(id=1, slug="ch", title="Channel"), playlists=[playlist])
+    return channel, playlist
+
+
+async def test_scheduled_run_skips_yt_dlp_when_feed_has_nothing_new(
+    tmp_path: Path, feed_server: _FeedServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _no_download(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("yt-dlp listing should be skipped")
+
+    monkeypatch.setattr(runner, "download_playlist", _no_download)
+    channel, playlist = _entries()
+    settings = RunnerSettings(feed_url=feed_server.url)
+    settings.archive = DownloadArchive.open(tmp_path)
+    client = _StubClient()
+    try:
+        for video_id in ("vid-a", "vid-b"):
+            settings.archive.record(1, video_id, "transcoded")
+        for _ in range(2):
+            result = await process_playlist_entry(
+                client,  # type: ignore[arg-type]
+                channel,
+                playlist,
+                tmp_path,
+                "mp3",
+                dry_run=False,
+                castopod_client=None,
+                allow_castopod_upload=False,
+                settings=settings,
+            )
+            assert result is not None and result.feed_skipped
+    finally:
+        settings.close()
+
+    assert feed_server.requests[0]["path"].endswith("playlist_id=PLfake")
+    assert "If-None-Match" in feed_server.requests[1]
+    assert client.updates[-1]["status"] == "finished"
+    state = load_feed_state(tmp_path / "ch" / "Fake")
+    assert state is not None and state.video_ids == ["vid-b", "vid-a"]
+
+
+async def test_feed_precheck_is_skipped_for_playlists_that_append_at_the_end(
+    tmp_path: Path, feed_server: _FeedServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    listed: list[str] = []
+
+    async def _download(playlist_entry: PipelinePlaylist, *args: Any, **kwargs: Any) -> None:
+        listed.append(playlist_entry.playlist.youtube_playlist_id)
+        return None
+
+    monkeypatch.setattr(runner, "download_playlist", _download)
+    # The feed shows the first 15 of 20 entries; the new ones were appended at the end.
+    feed_server.video_ids = [f"vid-{number:02d}" for number in range(15)]
+    channel, playlist = _entries(newest_on_top=False)
+    settings = RunnerSettings(feed_url=feed_server.url)
+    settings.archive = DownloadArchive.open(tmp_path)
+    try:
+        for video_id in feed_server.video_ids:
+            settings.archive.record(1, video_id, "transcoded")
+        result = await process_playlist_entry(
+            _StubClient(),  # type: ignore[arg-type]
+            channel,
+            playlist,
+            tmp_path,
+            "mp3",
+            dry_run=False,
+            castopod_client=None,
+            allow_castopod_upload=False,
+            settings=settings,
+        )
+    finally:
+        settings.close()
+
+    assert result is None or not result.feed_skipped
+    assert listed == ["PLfake"]
+    assert feed_server.requests == []
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pipeline_runner.journal import PlaylistJournal
+
+
+def test_journal_resumes_pending_entries_after_interruption(tmp_path: Path) -> None:
+    journal = PlaylistJournal(tmp_path)
+    journal.start_run(
+        [
+            {"id": "vid-a", "title": "A", "url": "https://www.youtube.com/watch?v=vid-a"},
+            {"id": "vid-b", "title": "B", "url": "https://www.youtube.com/watch?v=vid-b"},
+        ],
+        "published",
+        {"id": "PL", "title": "Playlist", "entries": ["dropped"]},
+    )
+    journal.record_download_progress("vid-a", 1024)
+    journal.record("vid-a", "transcoded", episode={"audio_path": "a.mp3"})
+    journal.record("vid-a", "published")
+    journal.record_download_progress("vid-b", 5 * 1024 * 1024)
+    journal.record("vid-a", "artwork")  # never moves backwards
+
+    # simulate a crash: a fresh process replays the log
+    resumed = PlaylistJournal(tmp_path)
+
+    assert resumed.has_open_run
+    assert resumed.playlist_info == {"id": "PL", "title": "Playlist"}
+    assert resumed.pending_entries() == [
+        {"id": "vid-b", "title": "B", "url": "https://www.youtube.com/watch?v=vid-b"}
+    ]
+    vid_b = resumed.get("vid-b")
+    assert vid_b is not None and vid_b.stage == "downloading"
+    assert vid_b.downloaded_bytes == 5 * 1024 * 1024
+    vid_a = resumed.get("vid-a")
+    assert vid_a is not None and vid_a.stage == "published"
+
+    resumed.complete_run()
+    compacted = PlaylistJournal(tmp_path)
+
+    assert not compacted.has_open_run
+    assert compacted.pending_entries() == []
+    assert len(compacted.path.read_text(encoding="utf-8").splitlines()) == 2
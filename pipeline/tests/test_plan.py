@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pipeline_client.client import (
+    Channel,
+    PipelineChannel,
+    PipelineConfiguration,
+    PipelinePlaylist,
+    Playlist,
+)
+from pipeline_runner import plan as plan_module
+from pipeline_runner.archive import DownloadArchive
+from pipeline_runner.main import print_plan
+from pipeline_runner.plan import ESTIMATED_AUDIO_KBPS, plan_configuration
+
+
+class _FlatYoutubeDL:
+    opts: list[dict[str, Any]] = []
+
+    def __init__(self, opts: dict[str, Any]) -> None:
+        _FlatYoutubeDL.opts.append(opts)
+
+    def __enter__(self) -> "_FlatYoutubeDL":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def urlopen(self, request: Any) -> None:
+        return None
+
+    def extract_info(self, url: str, download: bool = False) -> dict[str, Any]:
+        assert not download
+        return {
+            "id": "PLfake",
+            "entries": [
+                {"_type": "url", "id": "vid-a", "title": "First", "duration": 600},
+                {"_type": "url", "id": "vid-b", "title": "Second", "duration": 1200},
+                {"_type": "url", "id": "vid-c", "title": "Third"},
+                None,
+            ],
+        }
+
+
+class _StubCastopod:
+    async def resolve_podcast_id(self, playlist: Playlist) -> int:
+        return 7
+
+    async def get_episode_slugs(self, podcast_id: int) -> set[str]:
+        return {"vid-a"}
+
+
+def _configuration() -> PipelineConfiguration:
+    playlist = Playlist(
+        id=1,
+        youtube_playlist_id="PLfake",
+        title="Fake",
+        channel_id=1,
+        castopod_slug="fake",
+        castopod_uuid="uuid",
+    )
+    return PipelineConfiguration(
+        fetched_at=datetime.now(UTC),
+        channels=[
+            PipelineChannel(
+                channel=Channel(id=1, slug="ch", title="Channel"),
+                playlists=[PipelinePlaylist(playlist=playlist, schedules=[])],
+            )
+        ],
+    )
+
+
+async def test_plan_configuration_reports_new_and_present_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _FlatYoutubeDL.opts = []
+    monkeypatch.setattr(plan_module, "YoutubeDL", _FlatYoutubeDL)
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        archive.record(1, "vid-b", "uploaded")
+        plans = await plan_configuration(
+            _configuration(),
+            _StubCastopod(),  # type: ignore[arg-type]
+            archive=archive,
+        )
+    finally:
+        archive.close()
+
+    [plan] = plans
+    assert _FlatYoutubeDL.opts[0]["extract_flat"] == "in_playlist"
+    assert plan.upload and plan.listed == 3
+    assert plan.present_ids == ["vid-a", "vid-b"]
+    assert [entry.video_id for entry in plan.new_entries] == ["vid-c"]
+    assert plan.estimated_bytes == 0
+
+    report = print_plan(plans, str(tmp_path / "plan.json"))
+    written = json.loads((tmp_path / "plan.json").read_text(encoding="utf-8"))
+    assert written["totals"] == report["totals"]
+    assert written["playlists"][0]["present_count"] == 2
+
+
+def test_estimate_entry_bytes_prefers_reported_size() -> None:
+    assert plan_module.estimate_entry_bytes({"filesize_approx": 1234, "duration": 60}) == 1234
+    assert plan_module.estimate_entry_bytes({"duration": 8}) == ESTIMATED_AUDIO_KBPS * 1000
+    assert plan_module.estimate_entry_bytes({}) is None
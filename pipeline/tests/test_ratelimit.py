@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+
+from pipeline_runner.ratelimit import RateLimiter, retry_after_seconds, throttle_status
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _Throttled(Exception):
+    def __init__(self, status: int, retry_after: str | None = None, reason: str = "") -> None:
+        super().__init__(f"HTTP Error {status}{reason}")
+        self.status = status
+        self.headers = {"Retry-After": retry_after} if retry_after else {}
+
+
+def _limiter(clock: _Clock, rate: float = 2.0, burst: int = 3, **kwargs: int) -> RateLimiter:
+    return RateLimiter(rate, burst, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_rate_limiter_allows_burst_then_paces_requests() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock)
+
+    waits = [limiter.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([0.5, 0.5])
+    assert limiter.throttled_seconds == pytest.approx(1.0)
+
+
+def test_penalize_pauses_and_backs_off_exponentially() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rate=0.0)
+
+    assert limiter.penalize() == 2.0
+    assert limiter.acquire() == pytest.approx(2.0)
+    assert limiter.penalize() == 4.0
+    assert limiter.penalize(retry_after=30.0) == 30.0
+    limiter.record_success()
+    assert limiter.penalize() == 2.0
+    assert limiter.throttle_events == 4
+
+
+def test_call_retries_throttled_requests_with_retry_after() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rate=0.0)
+    responses: list[Exception | str] = [
+        _Throttled(429, "7"),
+        _Throttled(403, reason=": the current session has been rate-limited by YouTube"),
+        "ok",
+    ]
+    throttles: list[tuple[int, float]] = []
+
+    def _send() -> str:
+        outcome = responses.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    response, waited = limiter.call(_send, lambda status, delay: throttles.append((status, delay)))
+
+    assert response == "ok"
+    assert throttles == [(429, 7.0), (403, 4.0)]
+    assert waited == pytest.approx(11.0)
+
+
+def test_call_gives_up_after_max_retries() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rate=0.0, max_retries=1)
+
+    def _send() -> None:
+        raise _Throttled(429)
+
+    with pytest.raises(_Throttled):
+        limiter.call(_send)
+    assert limiter.throttle_events == 1
+
+
+def test_throttle_status_ignores_other_errors() -> None:
+    assert throttle_status(_Throttled(429)) == 429
+    assert throttle_status(_Throttled(404)) is None
+    # a bare 403 is an expired signature or a blocked video, not throttling
+    assert throttle_status(_Throttled(403, reason=": Forbidden")) is None
+    assert throttle_status(_Throttled(403, "60")) == 403
+    assert throttle_status(ValueError("boom")) is None
+    assert retry_after_seconds(_Throttled(429, "bogus")) is None
+
+
+def test_call_does_not_retry_forbidden_without_a_throttle_signal() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rate=0.0)
+
+    def _send() -> None:
+        raise _Throttled(403, reason=": Forbidden")
+
+    with pytest.raises(_Throttled):
+        limiter.call(_send)
+    assert limiter.throttle_events == 0 and clock.sleeps == []
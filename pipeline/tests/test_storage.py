@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+from collections import namedtuple
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from pipeline_runner.archive import DownloadArchive
+from pipeline_runner.storage import (
+    StorageFullError,
+    StorageManager,
+    directory_size,
+    parse_channel_quotas,
+    parse_size,
+)
+
+_Usage = namedtuple("_Usage", "total used free")
+
+
+def _episode(root: Path, channel: str, stem: str, size: int, last_used: float) -> Path:
+    # the archive lives in ``root`` itself; keep episodes in their own tree for exact sizes
+    playlist_dir = root / "downloads" / channel / "Playlist"
+    playlist_dir.mkdir(parents=True, exist_ok=True)
+    audio = playlist_dir / f"{stem}.mp3"
+    audio.write_bytes(b"a" * size)
+    (playlist_dir / f"{stem}.info.json").write_text("{}", encoding="utf-8")
+    os.utime(audio, (last_used, last_used))
+    return audio
+
+
+def _manager(root: Path, archive: DownloadArchive, total: int, **kwargs: object) -> StorageManager:
+    downloads = root / "downloads"
+
+    def _disk_usage(path: Path) -> _Usage:
+        used = directory_size(downloads)
+        return _Usage(total, used, total - used)
+
+    return StorageManager(
+        downloads,
+        archive,
+        min_retention=kwargs.pop("min_retention", timedelta(0)),  # type: ignore[arg-type]
+        disk_usage=_disk_usage,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_parse_sizes_and_quotas() -> None:
+    assert parse_size("10G") == 10 * 1024**3
+    assert parse_size("1.5MiB") == int(1.5 * 1024**2)
+    assert parse_size("512") == 512
+    assert parse_channel_quotas(["news=2G,*=1G", "", "talk=500M"]) == {
+        "news": 2 * 1024**3,
+        "*": 1024**3,
+        "talk": 500 * 1024**2,
+    }
+    with pytest.raises(ValueError):
+        parse_channel_quotas(["news"])
+
+
+def test_evict_removes_least_recently_used_uploaded_episodes(tmp_path: Path) -> None:
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        old = _episode(tmp_path, "news", "old", 400, last_used=1_000)
+        new = _episode(tmp_path, "news", "new", 400, last_used=2_000)
+        pending = _episode(tmp_path, "news", "pending", 400, last_used=500)
+        archive.record(1, "old", "uploaded", old)
+        archive.record(1, "new", "uploaded", new)
+        archive.record(1, "pending", "transcoded", pending)
+        # 1200 of 1300 bytes used: above a 90% high-water mark
+        manager = _manager(tmp_path, archive, total=1300, high_water=0.9)
+
+        assert manager.pressure("news") is not None
+        result = manager.evict("news")
+
+        assert result.episodes == 1
+        assert not old.exists() and not old.with_suffix(".info.json").exists()
+        assert new.exists() and pending.exists()
+        assert manager.pressure("news") is None
+        assert archive.status(1, "old") == "uploaded"
+        assert [row[1] for row in archive.uploaded_files(datetime.now(UTC))] == ["new"]
+    finally:
+        archive.close()
+
+
+def test_evict_leaves_episodes_that_share_a_title_prefix(tmp_path: Path) -> None:
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        evicted = _episode(tmp_path, "news", "20240101_Ep 5", 400, last_used=1_000)
+        bonus = _episode(tmp_path, "news", "20240101_Ep 5. Bonus", 400, last_used=2_000)
+        (evicted.parent / "20240101_Ep 5.webp").write_bytes(b"t")
+        (bonus.parent / "20240101_Ep 5. Bonus.webp").write_bytes(b"t")
+        archive.record(1, "ep5", "uploaded", evicted)
+        archive.record(1, "ep5-bonus", "transcoded", bonus)
+        manager = _manager(tmp_path, archive, total=1000, high_water=0.7)
+
+        result = manager.evict("news")
+
+        assert result.episodes == 1 and result.files == 3
+        assert not evicted.exists() and not (evicted.parent / "20240101_Ep 5.webp").exists()
+        assert bonus.exists() and bonus.with_suffix(".info.json").exists()
+        assert (bonus.parent / "20240101_Ep 5. Bonus.webp").exists()
+    finally:
+        archive.close()
+
+
+def test_channel_quota_only_evicts_that_channel(tmp_path: Path) -> None:
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        other = _episode(tmp_path, "talk", "talk-1", 300, last_used=100)
+        first = _episode(tmp_path, "news", "news-1", 300, last_used=200)
+        second = _episode(tmp_path, "news", "news-2", 300, last_used=300)
+        for video_id, path in (("talk-1", other), ("news-1", first), ("news-2", second)):
+            archive.record(1, video_id, "uploaded", path)
+        manager = _manager(tmp_path, archive, total=10_000, channel_quotas={"news": 500})
+
+        result = manager.evict("news")
+
+        assert result.episodes == 1
+        assert other.exists() and not first.exists() and second.exists()
+    finally:
+        archive.close()
+
+
+async def test_admit_holds_back_when_nothing_can_be_evicted(tmp_path: Path) -> None:
+    archive = DownloadArchive.open(tmp_path)
+    try:
+        recent = _episode(tmp_path, "news", "recent", 900, last_used=100)
+        archive.record(1, "recent", "uploaded", recent)
+        manager = _manager(
+            tmp_path,
+            archive,
+            total=1000,
+            high_water=0.8,
+            min_retention=timedelta(hours=1),
+            admission_timeout=0.02,
+            poll_seconds=0.01,
+        )
+        holds: list[str] = []
+
+        async def _on_hold(reason: str) -> None:
+            holds.append(reason)
+
+        with pytest.raises(StorageFullError):
+            await manager.admit("news", _on_hold)
+
+        assert recent.exists()
+        assert len(holds) == 1 and "디스크" in holds[0]
+    finally:
+        archive.close()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from pipeline_runner import transcode
+from pipeline_runner.transcode import transcode_audio
+
+# Burns roughly ``seconds`` of CPU time, then copies argv[2] to argv[3] when given.
+_BURN = """
+import shutil, sys, time
+end = time.process_time() + float(sys.argv[1])
+while time.process_time() < end:
+    pass
+if len(sys.argv) > 3:
+    shutil.copyfile(sys.argv[2], sys.argv[3])
+"""
+
+
+def test_transcode_cpu_seconds_exclude_concurrent_children(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _command(source: Path, destination: Path, audio_format: str, copy: bool = False) -> list[str]:
+        return [sys.executable, "-c", _BURN, "1.0", str(source), str(destination)]
+
+    monkeypatch.setattr(transcode, "build_ffmpeg_command", _command)
+    source = tmp_path / "raw.webm"
+    source.write_bytes(b"audio")
+    # Another child of this process (a parallel ffmpeg or yt-dlp's ffprobe) that
+    # finishes and is reaped while the transcode is still running.
+    other = threading.Thread(
+        target=subprocess.run, args=([sys.executable, "-c", _BURN, "0.5"],), daemon=True
+    )
+    other.start()
+    try:
+        path, cpu_seconds = transcode_audio(str(source), str(tmp_path / "out.mp3"), "mp3")
+    finally:
+        other.join()
+
+    assert Path(path).read_bytes() == b"audio" and not source.exists()
+    assert 0.9 <= cpu_seconds < 1.3
@@ -13,6 +13,7 @@ export interface Playlist {
   is_active: boolean;
   castopod_slug?: string | null;
   castopod_uuid?: string | null;
+  pipeline_options?: Record<string, unknown>;
 }
 
 export interface CastopodPodcast {